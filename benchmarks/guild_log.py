@@ -0,0 +1,90 @@
+"""
+Compares parsing guild logs discriminated by type against the plain union of entries.
+
+Usage:
+    python benchmarks/guild_log.py [payload.json ...] [--guilds N] [--rounds N]
+
+Payloads are recorded responses of /v2/guild/:id/log, fixtures/guild_log.json is used
+if none are given. Every payload is parsed once per guild.
+"""
+
+import argparse
+import json
+import pathlib
+import time
+from typing import Any
+
+import pydantic
+
+from gw2.models import guild
+
+FIXTURE = pathlib.Path(__file__).parent / "fixtures" / "guild_log.json"
+
+# A log contains up to 100 entries
+LOG_SIZE = 100
+
+UnionLog = (
+    guild.Log.Invite
+    | guild.Log.InviteDeclined
+    | guild.Log.Kick
+    | guild.Log.Join
+    | guild.Log.Motd
+    | guild.Log.RankChange
+    | guild.Log.Stash
+    | guild.Log.Treasury
+    | guild.Log.Upgrade
+    | guild.Log.Influence
+)
+
+
+def load_payloads(paths: list[pathlib.Path]) -> list[bytes]:
+    payloads = []
+    for path in paths:
+        entries = json.loads(path.read_bytes())
+
+        # Pad short recordings to a full log
+        entries = (entries * (LOG_SIZE // len(entries) + 1))[:LOG_SIZE]
+        payloads.append(json.dumps(entries).encode())
+
+    return payloads
+
+
+def measure(
+    adapter: pydantic.TypeAdapter[Any],
+    payloads: list[bytes],
+    guilds: int,
+    rounds: int,
+) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(guilds):
+            for payload in payloads:
+                adapter.validate_json(payload)
+
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("payloads", nargs="*", type=pathlib.Path, default=[FIXTURE])
+    parser.add_argument("--guilds", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.payloads)
+    adapters: dict[str, pydantic.TypeAdapter[Any]] = {
+        "union": pydantic.TypeAdapter(list[UnionLog]),
+        "by type": pydantic.TypeAdapter(list[guild.AnyLog]),
+    }
+
+    entries = args.guilds * LOG_SIZE * len(payloads)
+    for name, adapter in adapters.items():
+        seconds = measure(adapter, payloads, args.guilds, args.rounds)
+        print(f"{name:>8}: {seconds:.3f}s, {entries / seconds:,.0f} entries/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
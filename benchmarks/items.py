@@ -0,0 +1,176 @@
+"""
+Compares parsing items with details picked by type against the plain details union,
+and against constructing them from trusted data without validation.
+
+Usage:
+    python benchmarks/items.py [dump.json] [--rounds N]
+
+The dump is a JSON list of items, e.g. collected via `Items().all_noniter()` and
+`json.dumps(...)`. Synthetic items are used if no dump is given.
+"""
+
+import argparse
+import json
+import pathlib
+import time
+import warnings
+from collections.abc import Callable
+from typing import Any
+
+import pydantic
+import pydantic_core
+
+from gw2.models import Item
+from gw2.models._base import BaseModel
+from gw2.trusted import construct
+
+INFUSION_SLOTS = [{"flags": ["Infusion"]}]
+INFIX_UPGRADE = {
+    "id": 161,
+    "attributes": [{"attribute": "Power", "modifier": 63}],
+}
+
+SAMPLE_DETAILS: dict[str, dict[str, Any] | None] = {
+    "Armor": {
+        "type": "Coat",
+        "weight_class": "Heavy",
+        "defense": 363,
+        "infusion_slots": INFUSION_SLOTS,
+        "attribute_adjustment": 242.688,
+        "infix_upgrade": INFIX_UPGRADE,
+    },
+    "Back": {
+        "infusion_slots": INFUSION_SLOTS,
+        "attribute_adjustment": 242.688,
+        "stat_choices": [161, 155],
+    },
+    "Bag": {"size": 20, "no_sell_or_sort": False},
+    "Consumable": {
+        "type": "Food",
+        "description": "Gain Power",
+        "duration_ms": 1800000,
+        "apply_count": 1,
+    },
+    "Container": {"type": "Default"},
+    "CraftingMaterial": None,
+    "Gathering": {"type": "Mining"},
+    "Gizmo": {"type": "Default", "vendor_ids": [1, 2]},
+    "MiniPet": {"minipet_id": 1},
+    "Tool": {"type": "Salvage", "charges": 25},
+    "Trinket": {
+        "type": "Ring",
+        "infusion_slots": INFUSION_SLOTS,
+        "attribute_adjustment": 242.688,
+        "infix_upgrade": INFIX_UPGRADE,
+    },
+    "Trophy": None,
+    "UpgradeComponent": {
+        "attribute_adjustment": 0,
+        "bonuses": ["+25 Power"],
+        "flags": ["Axe", "HeavyArmor"],
+        "infix_upgrade": INFIX_UPGRADE,
+        "infusion_upgrade_flags": [],
+        "suffix": "of Strength",
+        "type": "Rune",
+    },
+    "Weapon": {
+        "type": "Greatsword",
+        "damage_type": "Physical",
+        "min_power": 1045,
+        "max_power": 1155,
+        "defense": 0,
+        "infusion_slots": INFUSION_SLOTS,
+        "attribute_adjustment": 717.6,
+        "infix_upgrade": INFIX_UPGRADE,
+    },
+}
+
+
+def synthetic_items(count: int) -> list[dict[str, Any]]:
+    types = list(SAMPLE_DETAILS)
+    items = []
+
+    for i in range(count):
+        _type = types[i % len(types)]
+        item: dict[str, Any] = {
+            "id": i,
+            "chat_link": "[&AgEAWgAA]",
+            "name": f"Item {i}",
+            "icon": "https://render.guildwars2.com/file/item.png",
+            "type": _type,
+            "rarity": "Exotic",
+            "level": 80,
+            "vendor_value": 330,
+            "flags": ["AccountBound", "NoSell"],
+            "game_types": ["Activity", "Dungeon", "Pve", "Wvw"],
+            "restrictions": [],
+        }
+        if SAMPLE_DETAILS[_type] is not None:
+            item["details"] = SAMPLE_DETAILS[_type]
+
+        items.append(item)
+
+    return items
+
+
+def union_item() -> type[BaseModel]:
+    """
+    Item model which validates details against the plain union, like before
+    """
+
+    return pydantic.create_model(  # type: ignore[no-any-return, call-overload]
+        "UnionItem",
+        __base__=BaseModel,
+        **{
+            name: (field.annotation, field) for name, field in Item.model_fields.items()
+        },
+    )
+
+
+def measure(parse: Callable[[bytes], Any], data: bytes, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        parse(data)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("dump", nargs="?", type=pathlib.Path)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--count", type=int, default=60000)
+    args = parser.parse_args()
+
+    if args.dump is not None:
+        data = args.dump.read_bytes()
+    else:
+        data = json.dumps(synthetic_items(args.count)).encode()
+
+    adapters: dict[str, pydantic.TypeAdapter[Any]] = {
+        "union": pydantic.TypeAdapter(list[union_item()]),  # type: ignore[misc]
+        "by type": pydantic.TypeAdapter(list[Item]),
+    }
+
+    # Unknown enum values are expected in dumps of the live API
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    parsers: dict[str, Callable[[bytes], Any]] = {
+        name: adapter.validate_json for name, adapter in adapters.items()
+    }
+    # Including decoding the JSON
+    parsers["trusted"] = lambda data: construct(
+        list[Item], pydantic_core.from_json(data)
+    )
+
+    count = len(adapters["by type"].validate_json(data))
+    results = {name: measure(p, data, args.rounds) for name, p in parsers.items()}
+
+    for name, seconds in results.items():
+        print(f"{name:>8}: {seconds:.3f}s, {count / seconds:,.0f} items/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Measures memory per model of items, skins and recipes, as validated and compacted
+via gw2.compact, and as constructed from trusted data via gw2.trusted.
+
+Usage:
+    python benchmarks/memory.py [--count N]
+"""
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+from items import synthetic_items
+
+from gw2.compact import Compactor
+from gw2.models import Item, Recipe, Skin
+from gw2.trusted import construct
+from gw2.utils import type_adapter
+
+DYE_SLOTS = {
+    "default": [{"color_id": 1, "material": "cloth"}, None],
+    "overrides": {"CharrMale": [{"color_id": 2, "material": "metal"}, None]},
+}
+
+
+def synthetic_skins(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "name": f"Skin {i}",
+            "type": "Armor",
+            "flags": ["ShowInWardrobe"],
+            "restrictions": [],
+            "icon": "https://render.guildwars2.com/file/skin.png",
+            "rarity": "Exotic",
+            "details": {
+                "type": "Coat",
+                "weight_class": "Heavy",
+                "dye_slots": DYE_SLOTS,
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_recipes(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "type": "Refinement",
+            "output_item_id": i,
+            "output_item_count": 1,
+            "time_to_craft_ms": 1000,
+            "disciplines": ["Armorsmith", "Leatherworker", "Tailor"],
+            "min_rating": 0,
+            "flags": ["AutoLearned"],
+            "ingredients": [
+                {"item_id": 19697, "count": 2},
+                {"item_id": i, "count": 1},
+            ],
+            "chat_link": "[&CQEAAAA=]",
+        }
+        for i in range(count)
+    ]
+
+
+def traced(fn: Callable[[], Any]) -> int:
+    """
+    Returns the memory still allocated by the result of `fn`
+    """
+
+    tracemalloc.start()
+    try:
+        # Keeps the result alive while measuring
+        result = fn()  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    samples: dict[type, list[dict[str, Any]]] = {
+        Item: synthetic_items(args.count),
+        Skin: synthetic_skins(args.count),
+        Recipe: synthetic_recipes(args.count),
+    }
+
+    for model, data in samples.items():
+        body = json.dumps(data).encode()
+        adapter = type_adapter(list[model])  # type: ignore[valid-type]
+
+        def validated() -> Any:
+            return adapter.validate_json(body)  # noqa: B023
+
+        def trusted() -> Any:
+            return construct(list[model], pydantic_core.from_json(body))  # type: ignore[valid-type]  # noqa: B023
+
+        # Build the validators and plans first
+        Compactor().compact(trusted())
+
+        results = {
+            "validated": traced(validated),
+            "compact": traced(lambda: Compactor().compact(validated())),  # noqa: B023
+            "trusted": traced(trusted),
+            "trusted, compact": traced(lambda: Compactor().compact(trusted())),  # noqa: B023
+        }
+
+        print(f"{model.__name__}: {len(body) / len(data):,.0f} bytes of JSON")  # noqa: T201
+        for name, size in results.items():
+            print(f"{name:>18}: {size / len(data):8,.0f} bytes")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
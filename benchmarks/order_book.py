@@ -0,0 +1,80 @@
+"""
+Compares decoding trading post listings into an OrderBook against validating them
+into models, by time and by memory kept.
+
+Usage:
+    python benchmarks/order_book.py [--items N] [--levels N] [--rounds N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pydantic_core
+
+from gw2.models import Listings
+from gw2.orderbook import OrderBook
+from gw2.utils import type_adapter
+
+
+def synthetic_listings(items: int, levels: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "buys": [
+                {"listings": 1, "unit_price": 1000 - level, "quantity": 250}
+                for level in range(levels)
+            ],
+            "sells": [
+                {"listings": 2, "unit_price": 1001 + level, "quantity": 250}
+                for level in range(levels)
+            ],
+        }
+        for i in range(items)
+    ]
+
+
+def measure(fn: Callable[[], Any], rounds: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        # Keeps the result alive while measuring
+        result = fn()  # noqa: F841
+        return best, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--levels", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    body = json.dumps(synthetic_listings(args.items, args.levels)).encode()
+    adapter = type_adapter(list[Listings])
+
+    results = {
+        "models": measure(lambda: adapter.validate_json(body), args.rounds),
+        "order book": measure(
+            lambda: OrderBook.from_data(pydantic_core.from_json(body)),
+            args.rounds,
+        ),
+    }
+
+    print(f"{args.items * args.levels * 2:,} levels")  # noqa: T201
+    for name, (seconds, size) in results.items():
+        print(f"{name:>10}: {seconds:.3f}s, {size / 1024**2:7.1f} MiB kept")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compares detecting changed trading post prices via integer arrays, like PriceFeed,
+against validating every price and comparing the models.
+
+Usage:
+    python benchmarks/price_feed.py [--count N] [--changed RATIO] [--rounds N]
+"""
+
+import argparse
+import itertools
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from gw2.models import Price
+from gw2.pricefeed import CHUNK_SIZE, PriceSnapshot
+from gw2.utils import chunks, type_adapter
+
+
+def synthetic_prices(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "whitelisted": False,
+            "buys": {"quantity": 100 + i, "unit_price": 1000 + i},
+            "sells": {"quantity": 50 + i, "unit_price": 1200 + i},
+        }
+        for i in range(count)
+    ]
+
+
+def update(prices: list[dict[str, Any]], ratio: float) -> list[dict[str, Any]]:
+    result = [dict(price) for price in prices]
+    for price in random.sample(result, int(len(result) * ratio)):
+        price["sells"] = {
+            **price["sells"],
+            "unit_price": price["sells"]["unit_price"] - 1,
+        }
+
+    return result
+
+
+def by_models(before: list[dict[str, Any]], after: list[dict[str, Any]]) -> int:
+    adapter = type_adapter(list[Price])
+    previous = {price.id: price for price in adapter.validate_python(before)}
+
+    return sum(
+        previous.get(price.id) is None
+        or previous[price.id].buys.unit_price != price.buys.unit_price
+        or previous[price.id].sells.unit_price != price.sells.unit_price
+        for price in adapter.validate_python(after)
+    )
+
+
+def by_arrays(before: list[dict[str, Any]], after: list[dict[str, Any]]) -> int:
+    changed = 0
+    for old, new in zip(
+        chunks(before, CHUNK_SIZE),
+        chunks(after, CHUNK_SIZE),
+        strict=True,
+    ):
+        snapshot = PriceSnapshot.from_data(new)
+        changes = snapshot.changes(PriceSnapshot.from_data(old))
+        changed += len(list(itertools.compress(new, changes)))
+
+    return changed
+
+
+def measure(fn: Callable[[], int], rounds: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        changed = fn()
+        best = min(best, time.perf_counter() - start)
+
+    return best, changed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=30000)
+    parser.add_argument("--changed", type=float, default=0.1)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    before = synthetic_prices(args.count)
+    after = update(before, args.changed)
+
+    for name, fn in {"models": by_models, "arrays": by_arrays}.items():
+        seconds, changed = measure(lambda: fn(before, after), args.rounds)  # noqa: B023
+        print(f"{name:>6}: {seconds * 1000:6.1f}ms, {changed:,} changed")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
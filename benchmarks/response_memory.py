@@ -0,0 +1,97 @@
+"""
+Measures memory allocated while handling a large response, comparing the bytes path of
+`_get()` with the previous path via `response.text`.
+
+Usage:
+    python benchmarks/response_memory.py [--count N]
+"""
+
+import argparse
+import asyncio
+import json
+import tracemalloc
+import warnings
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from items import synthetic_items
+
+import gw2
+from gw2.api._base import ERROR_BODY_PREFIX
+from gw2.models import Item
+from gw2.utils import type_adapter
+
+
+def traced(fn: Callable[[], Any]) -> int:
+    """
+    Returns the peak of memory allocated by `fn`
+    """
+
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+async def fetch(body: bytes) -> int:
+    """
+    Returns the peak of memory allocated by `_get()`, including the validated models
+    """
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body)
+
+    async with gw2.Client(transport=httpx.MockTransport(respond)) as client:
+        items = gw2.Items(client=client)
+        items.cache = None
+
+        tracemalloc.start()
+        try:
+            await items._get(ids=[1])
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    body = json.dumps(synthetic_items(args.count)).encode()
+    adapter = type_adapter(list[Item])
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    # Responses cache their decoded text, so every measurement gets a new one
+    def text(response: httpx.Response) -> Any:
+        response.text.lower()
+        return adapter.validate_json(response.text)
+
+    def content(response: httpx.Response) -> Any:
+        response.content[:ERROR_BODY_PREFIX].lower()
+        return adapter.validate_json(response.content)
+
+    results = {
+        # Decoding and searching the whole body for error messages
+        "text, checks": traced(lambda: httpx.Response(200, content=body).text.lower()),
+        "bytes, checks": traced(
+            lambda: httpx.Response(200, content=body)
+            .content[:ERROR_BODY_PREFIX]
+            .lower()
+        ),
+        # Including validation
+        "text, total": traced(lambda: text(httpx.Response(200, content=body))),
+        "bytes, total": traced(lambda: content(httpx.Response(200, content=body))),
+        "_get()": asyncio.run(fetch(body)),
+    }
+
+    print(f"body: {len(body) / 1024**2:.1f} MiB")  # noqa: T201
+    for name, peak in results.items():
+        print(f"{name:>13}: {peak / 1024**2:8.2f} MiB peak")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
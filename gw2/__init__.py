@@ -1,122 +1,325 @@
-from .api.account import Account
-from .api.achievements import (
-    Achievement,
-    AchievementCategories,
-    AchievementCategory,
-    AchievementGroup,
-    AchievementGroups,
-    Achievements,
-)
-from .api.backstory import (
-    BackstoryAnswer,
-    BackstoryAnswers,
-    BackstoryQuestion,
-    BackstoryQuestions,
-)
-from .api.build import Build, BuildManifest
-from .api.characters import Character, Characters
-from .api.colors import Color, Colors
-from .api.continents import (
-    Continent,
-    ContinentMap,
-    ContinentMaps,
-    Continents,
-    Floor,
-    Floors,
-    PointOfInterest,
-    PointsOfInterest,
-    Region,
-    Regions,
-    Sector,
-    Sectors,
-    Task,
-    Tasks,
-)
-from .api.currencies import Currencies, Currency
-from .api.daily_crafting import DailyCrafting
-from .api.details import V2
-from .api.dungeons import Dungeon, Dungeons
-from .api.emblems import (
-    EmblemBackground,
-    EmblemBackgrounds,
-    EmblemForeground,
-    EmblemForegrounds,
-)
-from .api.emotes import Emote, Emotes
-from .api.files import File, Files
-from .api.finishers import Finisher, Finishers
-from .api.gliders import Glider, Gliders
-from .api.guild import (
-    Guild,
-    GuildPermission,
-    GuildPermissions,
-    GuildSearch,
-    GuildUpgrade,
-    GuildUpgrades,
-)
-from .api.home import HomeCat, HomeCats, HomeNode, HomeNodes
-from .api.item_stats import ItemStat, ItemStats
-from .api.items import Item, Items
-from .api.legendary_armory import LegendaryArmory, LegendaryArmoryItem
-from .api.legends import Legend, Legends
-from .api.mail_carriers import MailCarrier, MailCarriers
-from .api.map_chests import MapChest, MapChests
-from .api.maps import Map, Maps
-from .api.masteries import Masteries, Mastery
-from .api.materials import Material, Materials
-from .api.minis import Mini, Minis
-from .api.mounts import MountSkin, MountSkins, MountType, MountTypes
-from .api.novelties import Novelties, Novelty
-from .api.outfits import Outfit, Outfits
-from .api.pets import Pet, Pets
-from .api.professions import Profession, Professions
-from .api.pvp import (
-    Amulet,
-    Amulets,
-    Game,
-    Games,
-    Hero,
-    Heroes,
-    PvPRank,
-    PvPRanks,
-    Season,
-    Seasons,
-    Standings,
-    Stats,
-)
-from .api.quaggans import Quaggan, Quaggans
-from .api.quests import Quest, Quests
-from .api.races import Race, Races
-from .api.raids import Raid, Raids
-from .api.recipes import Recipe, Recipes, RecipeSearch
-from .api.skills import Skill, Skills
-from .api.skins import Skin, Skins
-from .api.specializations import Specialization, Specializations
-from .api.stories import Stories, Story, StorySeason, StorySeasons
-from .api.titles import Title, Titles
-from .api.tokeninfo import TokenInfo
-from .api.traits import Trait, Traits
-from .api.wizards_vault import (
-    WizardsVaultListing,
-    WizardsVaultListings,
-    WizardsVaultObjective,
-    WizardsVaultObjectives,
-)
-from .api.world_bosses import WorldBoss, WorldBosses
-from .api.worlds import World, Worlds
-from .api.wvw import (
-    Match,
-    Matches,
-    MatchOverview,
-    MatchOverviews,
-    MatchScore,
-    MatchScores,
-    MatchStat,
-    MatchStats,
-    Objective,
-    Objectives,
-    WvWRank,
-    WvWRanks,
-    WvWUpgrade,
-    WvWUpgrades,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api._base import build_adapters, prewarm
+    from .api.account import Account
+    from .api.achievements import (
+        Achievement,
+        AchievementCategories,
+        AchievementCategory,
+        AchievementGroup,
+        AchievementGroups,
+        Achievements,
+    )
+    from .api.backstory import (
+        BackstoryAnswer,
+        BackstoryAnswers,
+        BackstoryQuestion,
+        BackstoryQuestions,
+    )
+    from .api.build import Build, BuildManifest
+    from .api.characters import Character, Characters
+    from .api.colors import Color, Colors
+    from .api.commerce import Listing, Listings, Price, Prices, Transactions
+    from .api.continents import (
+        Continent,
+        ContinentMap,
+        ContinentMaps,
+        Continents,
+        Floor,
+        Floors,
+        PointOfInterest,
+        PointsOfInterest,
+        Region,
+        Regions,
+        Sector,
+        Sectors,
+        Task,
+        Tasks,
+    )
+    from .api.currencies import Currencies, Currency
+    from .api.daily_crafting import DailyCrafting
+    from .api.details import V2
+    from .api.dungeons import Dungeon, Dungeons
+    from .api.emblems import (
+        EmblemBackground,
+        EmblemBackgrounds,
+        EmblemForeground,
+        EmblemForegrounds,
+    )
+    from .api.emotes import Emote, Emotes
+    from .api.files import File, Files
+    from .api.finishers import Finisher, Finishers
+    from .api.gliders import Glider, Gliders
+    from .api.guild import (
+        Guild,
+        GuildPermission,
+        GuildPermissions,
+        GuildSearch,
+        GuildUpgrade,
+        GuildUpgrades,
+    )
+    from .api.home import HomeCat, HomeCats, HomeNode, HomeNodes
+    from .api.item_stats import ItemStat, ItemStats
+    from .api.items import Item, Items
+    from .api.legendary_armory import LegendaryArmory, LegendaryArmoryItem
+    from .api.legends import Legend, Legends
+    from .api.mail_carriers import MailCarrier, MailCarriers
+    from .api.map_chests import MapChest, MapChests
+    from .api.maps import Map, Maps
+    from .api.masteries import Masteries, Mastery
+    from .api.materials import Material, Materials
+    from .api.minis import Mini, Minis
+    from .api.mounts import MountSkin, MountSkins, MountType, MountTypes
+    from .api.novelties import Novelties, Novelty
+    from .api.outfits import Outfit, Outfits
+    from .api.pets import Pet, Pets
+    from .api.professions import Profession, Professions
+    from .api.pvp import (
+        Amulet,
+        Amulets,
+        Game,
+        Games,
+        Hero,
+        Heroes,
+        PvPRank,
+        PvPRanks,
+        Season,
+        Seasons,
+        Standings,
+        Stats,
+    )
+    from .api.quaggans import Quaggan, Quaggans
+    from .api.quests import Quest, Quests
+    from .api.races import Race, Races
+    from .api.raids import Raid, Raids
+    from .api.recipes import Recipe, Recipes, RecipeSearch
+    from .api.skills import Skill, Skills
+    from .api.skins import Skin, Skins
+    from .api.specializations import Specialization, Specializations
+    from .api.stories import Stories, Story, StorySeason, StorySeasons
+    from .api.titles import Title, Titles
+    from .api.tokeninfo import TokenInfo
+    from .api.traits import Trait, Traits
+    from .api.wizards_vault import (
+        WizardsVaultListing,
+        WizardsVaultListings,
+        WizardsVaultObjective,
+        WizardsVaultObjectives,
+    )
+    from .api.world_bosses import WorldBoss, WorldBosses
+    from .api.worlds import World, Worlds
+    from .api.wvw import (
+        Match,
+        Matches,
+        MatchOverview,
+        MatchOverviews,
+        MatchScore,
+        MatchScores,
+        MatchStat,
+        MatchStats,
+        Objective,
+        Objectives,
+        WvWRank,
+        WvWRanks,
+        WvWUpgrade,
+        WvWUpgrades,
+    )
+    from .client import Client
+    from .diskcache import DiskCache
+    from .logtail import JsonCursorStore, LogTail
+    from .orderbook import OrderBook
+    from .pricefeed import PriceFeed
+    from .transactions import TransactionSync
+
+# Public name -> module defining it, imported on first access to keep `import` cheap
+_LAZY_ATTRIBUTES = {
+    "build_adapters": ".api._base",
+    "prewarm": ".api._base",
+    "Account": ".api.account",
+    "Achievement": ".api.achievements",
+    "AchievementCategories": ".api.achievements",
+    "AchievementCategory": ".api.achievements",
+    "AchievementGroup": ".api.achievements",
+    "AchievementGroups": ".api.achievements",
+    "Achievements": ".api.achievements",
+    "BackstoryAnswer": ".api.backstory",
+    "BackstoryAnswers": ".api.backstory",
+    "BackstoryQuestion": ".api.backstory",
+    "BackstoryQuestions": ".api.backstory",
+    "Build": ".api.build",
+    "BuildManifest": ".api.build",
+    "Character": ".api.characters",
+    "Characters": ".api.characters",
+    "Color": ".api.colors",
+    "Colors": ".api.colors",
+    "Listing": ".api.commerce",
+    "Listings": ".api.commerce",
+    "Price": ".api.commerce",
+    "Prices": ".api.commerce",
+    "Transactions": ".api.commerce",
+    "Continent": ".api.continents",
+    "ContinentMap": ".api.continents",
+    "ContinentMaps": ".api.continents",
+    "Continents": ".api.continents",
+    "Floor": ".api.continents",
+    "Floors": ".api.continents",
+    "PointOfInterest": ".api.continents",
+    "PointsOfInterest": ".api.continents",
+    "Region": ".api.continents",
+    "Regions": ".api.continents",
+    "Sector": ".api.continents",
+    "Sectors": ".api.continents",
+    "Task": ".api.continents",
+    "Tasks": ".api.continents",
+    "Currencies": ".api.currencies",
+    "Currency": ".api.currencies",
+    "DailyCrafting": ".api.daily_crafting",
+    "V2": ".api.details",
+    "Dungeon": ".api.dungeons",
+    "Dungeons": ".api.dungeons",
+    "EmblemBackground": ".api.emblems",
+    "EmblemBackgrounds": ".api.emblems",
+    "EmblemForeground": ".api.emblems",
+    "EmblemForegrounds": ".api.emblems",
+    "Emote": ".api.emotes",
+    "Emotes": ".api.emotes",
+    "File": ".api.files",
+    "Files": ".api.files",
+    "Finisher": ".api.finishers",
+    "Finishers": ".api.finishers",
+    "Glider": ".api.gliders",
+    "Gliders": ".api.gliders",
+    "Guild": ".api.guild",
+    "GuildPermission": ".api.guild",
+    "GuildPermissions": ".api.guild",
+    "GuildSearch": ".api.guild",
+    "GuildUpgrade": ".api.guild",
+    "GuildUpgrades": ".api.guild",
+    "HomeCat": ".api.home",
+    "HomeCats": ".api.home",
+    "HomeNode": ".api.home",
+    "HomeNodes": ".api.home",
+    "ItemStat": ".api.item_stats",
+    "ItemStats": ".api.item_stats",
+    "Item": ".api.items",
+    "Items": ".api.items",
+    "LegendaryArmory": ".api.legendary_armory",
+    "LegendaryArmoryItem": ".api.legendary_armory",
+    "Legend": ".api.legends",
+    "Legends": ".api.legends",
+    "MailCarrier": ".api.mail_carriers",
+    "MailCarriers": ".api.mail_carriers",
+    "MapChest": ".api.map_chests",
+    "MapChests": ".api.map_chests",
+    "Map": ".api.maps",
+    "Maps": ".api.maps",
+    "Masteries": ".api.masteries",
+    "Mastery": ".api.masteries",
+    "Material": ".api.materials",
+    "Materials": ".api.materials",
+    "Mini": ".api.minis",
+    "Minis": ".api.minis",
+    "MountSkin": ".api.mounts",
+    "MountSkins": ".api.mounts",
+    "MountType": ".api.mounts",
+    "MountTypes": ".api.mounts",
+    "Novelties": ".api.novelties",
+    "Novelty": ".api.novelties",
+    "Outfit": ".api.outfits",
+    "Outfits": ".api.outfits",
+    "Pet": ".api.pets",
+    "Pets": ".api.pets",
+    "Profession": ".api.professions",
+    "Professions": ".api.professions",
+    "Amulet": ".api.pvp",
+    "Amulets": ".api.pvp",
+    "Game": ".api.pvp",
+    "Games": ".api.pvp",
+    "Hero": ".api.pvp",
+    "Heroes": ".api.pvp",
+    "PvPRank": ".api.pvp",
+    "PvPRanks": ".api.pvp",
+    "Season": ".api.pvp",
+    "Seasons": ".api.pvp",
+    "Standings": ".api.pvp",
+    "Stats": ".api.pvp",
+    "Quaggan": ".api.quaggans",
+    "Quaggans": ".api.quaggans",
+    "Quest": ".api.quests",
+    "Quests": ".api.quests",
+    "Race": ".api.races",
+    "Races": ".api.races",
+    "Raid": ".api.raids",
+    "Raids": ".api.raids",
+    "Recipe": ".api.recipes",
+    "Recipes": ".api.recipes",
+    "RecipeSearch": ".api.recipes",
+    "Skill": ".api.skills",
+    "Skills": ".api.skills",
+    "Skin": ".api.skins",
+    "Skins": ".api.skins",
+    "Specialization": ".api.specializations",
+    "Specializations": ".api.specializations",
+    "Stories": ".api.stories",
+    "Story": ".api.stories",
+    "StorySeason": ".api.stories",
+    "StorySeasons": ".api.stories",
+    "Title": ".api.titles",
+    "Titles": ".api.titles",
+    "TokenInfo": ".api.tokeninfo",
+    "Trait": ".api.traits",
+    "Traits": ".api.traits",
+    "WizardsVaultListing": ".api.wizards_vault",
+    "WizardsVaultListings": ".api.wizards_vault",
+    "WizardsVaultObjective": ".api.wizards_vault",
+    "WizardsVaultObjectives": ".api.wizards_vault",
+    "WorldBoss": ".api.world_bosses",
+    "WorldBosses": ".api.world_bosses",
+    "World": ".api.worlds",
+    "Worlds": ".api.worlds",
+    "Match": ".api.wvw",
+    "Matches": ".api.wvw",
+    "MatchOverview": ".api.wvw",
+    "MatchOverviews": ".api.wvw",
+    "MatchScore": ".api.wvw",
+    "MatchScores": ".api.wvw",
+    "MatchStat": ".api.wvw",
+    "MatchStats": ".api.wvw",
+    "Objective": ".api.wvw",
+    "Objectives": ".api.wvw",
+    "WvWRank": ".api.wvw",
+    "WvWRanks": ".api.wvw",
+    "WvWUpgrade": ".api.wvw",
+    "WvWUpgrades": ".api.wvw",
+    "Client": ".client",
+    "DiskCache": ".diskcache",
+    "JsonCursorStore": ".logtail",
+    "LogTail": ".logtail",
+    "OrderBook": ".orderbook",
+    "PriceFeed": ".pricefeed",
+    "TransactionSync": ".transactions",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        # Submodules, e.g. gw2.errors
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
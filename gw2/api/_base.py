@@ -1,11 +1,17 @@
 import asyncio
+import copy
 import functools
+import importlib
+import json
 import logging
-from asyncio import Future, Task
-from collections.abc import AsyncIterator
-from importlib.metadata import PackageNotFoundError, version
+import pkgutil
+import sys
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterable, Iterator
 from typing import (
     Any,
+    ClassVar,
     Generic,
     Literal,
     Self,
@@ -16,40 +22,74 @@ from typing import (
 
 import httpx
 import pydantic
-from asyncio_throttle import Throttler
+import pydantic_core
 from pydantic import ValidationError
 
 from gw2 import errors
+from gw2.cache import ResponseCache, SingleFlight, hash_api_key
+from gw2.client import DEFAULT_TIMEOUT, Client, default_client
+from gw2.compact import Compactor
 from gw2.const import (
     HTTP_BAD_REQUEST,
     HTTP_FORBIDDEN,
     HTTP_INTERNAL_SERVER_ERROR,
     HTTP_PARTIAL_SUCCESS,
     HTTP_SUCCESS,
+    HTTP_TOO_MANY_REQUESTS,
 )
-from gw2.utils import chunks, get_generic_alias
-
-try:
-    __version__ = version("gw2")
-except PackageNotFoundError:
-    __version__ = "unknown"
+from gw2.diskcache import DiskCache
+from gw2.loader import BatchLoader
+from gw2.meta import ResponseMeta
+from gw2.models._base import BaseModel
+from gw2.ratelimit import RateLimiter, parse_retry_after
+from gw2.retry import RetryPolicy
+from gw2.trusted import construct
+from gw2.utils import chunks, get_generic_alias, map_bounded, type_adapter
 
 # Global config
 BASE_URL = "https://api.guildwars2.com/v2"
-# todo: make timeout a global configurable thing
-DEFAULT_TIMEOUT = 30
 SCHEMA = "2021-04-06T21:00:00.000Z"
 
 
-GLOBAL_THROTTLE = Throttler(rate_limit=300, period=60)
-
-
-# TODO: better rate limiting
-#  https://github.com/greaka/gw2api/blob/ab5a08cec3004b3cea8a62b51b3831a097adb989/http/src/rate_limit.rs#L44-L66
-# todo: expose header metadata on returned model
-
-# todo: retries for 50x
-#       e.g. https://github.com/jd/tenacity
+# Bucket of 300 requests, refilled with 5 requests per second, see
+# https://github.com/greaka/gw2api/blob/ab5a08cec3004b3cea8a62b51b3831a097adb989/http/src/rate_limit.rs#L44-L66
+GLOBAL_THROTTLE = RateLimiter(burst=300, refill_rate=5)
+GLOBAL_CACHE = ResponseCache()
+GLOBAL_SINGLE_FLIGHT = SingleFlight()
+GLOBAL_RETRY_POLICY = RetryPolicy()
+
+# Whether ?ids=all is supported, per route of /v2.json
+_ALL_IDS_SUPPORT: dict[str, bool] = {}
+# Seconds before loading /v2.json is attempted again after it failed
+ROUTES_RETRY_AFTER = 5 * 60
+
+# Batch loaders of IdsBase.loader(), per event loop and endpoint settings:
+# (url, client, hashed API key, language, timeout, response cache, cache expiry)
+LoaderKey = tuple[
+    str,
+    Client,
+    str | None,
+    str,
+    float,
+    ResponseCache | None,
+    int | None,
+]
+_LOADERS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    dict[LoaderKey, BatchLoader[Any, Any]],
+] = weakref.WeakKeyDictionary()
+
+# Chunks requested at once by IdsBase.many(concurrent=True)
+DEFAULT_CONCURRENCY = 10
+# Upper bound of ?page_size=
+MAX_PAGE_SIZE = 200
+# Seconds IdsBase.loader() waits for further ids
+DEFAULT_BATCH_WINDOW = 0.005
+
+# Wait time after HTTP 429 if the server didn't send a Retry-After header
+DEFAULT_RETRY_AFTER = 5
+# Bytes of error responses searched for known error messages
+ERROR_BODY_PREFIX = 1024
 
 
 LOG = logging.getLogger(__name__)
@@ -62,34 +102,45 @@ EndpointId = TypeVar("EndpointId", str, int)
 IdsVariant = TypeVar("IdsVariant", str, int)
 IdsParameter = str | int | None
 
-
-def _create_session(timeout: float) -> httpx.AsyncClient:
-    session = httpx.AsyncClient(timeout=timeout)
-
-    # Set request headers
-    session.headers.update(
-        {
-            "User-Agent": f"Invisi/python-gw2@{__version__}",
-            "Accept": "application/json",
-            "Accept-Language": "en",  # TODO: configurable
-        },
-    )
-
-    return session
+# Any endpoint, used for sub-clients
+EndpointT = TypeVar("EndpointT", bound="_Base[Any]")
+# Any class, used to find subclasses
+ClassT = TypeVar("ClassT", bound=type)
 
 
 class _Base(Generic[EndpointModel]):
-    # Cache expiry, may be set on the endpoint itself
+    # Cache expiry, may be set on the endpoint itself. None disables caching
     expiry: int | None = 5 * 60
+    # Response cache, may be replaced or disabled (None) per endpoint
+    cache: ResponseCache | None = GLOBAL_CACHE
+    # Coalesces identical concurrent requests, may be disabled (None) per endpoint
+    single_flight: SingleFlight | None = GLOBAL_SINGLE_FLIGHT
+    # Rate limiter, may be replaced per endpoint
+    limiter: RateLimiter = GLOBAL_THROTTLE
+    # Retries for transient errors, may be replaced or disabled (None) per endpoint
+    retry_policy: RetryPolicy | None = GLOBAL_RETRY_POLICY
+    # Shares equal objects between models to save memory, disabled (None) by default
+    compactor: Compactor | None = None
     _ids_params: dict[str, str] = {}
 
     # Optional global default API key
     _api_key: str | None
 
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT) -> None:
-        self._session = _create_session(timeout)
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        client: Client | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self._client = client
 
         self.api_key: None | str = None
+        # Retries needed by the last request of this instance
+        self.retries = 0
+        # Status and headers of the last response of this instance
+        self.meta: ResponseMeta | None = None
+        # Per-instance request headers, e.g. authorization
+        self._headers: dict[str, str] = {}
 
         # Set API key from global storage
         if hasattr(type(self), "_api_key"):
@@ -105,10 +156,48 @@ class _Base(Generic[EndpointModel]):
         traceback: Any = None,
     ) -> None:
         """
-        Closes the httpx session properly
+        Does nothing, the session is owned by the client and shared with other
+        endpoints. See :py:class:`gw2.client.Client` for closing it.
+        """
+
+    @property
+    def client(self) -> Client:
+        """
+        The client whose session is used for requests, defaults to the shared client
+        of the running event loop
+        """
+
+        if self._client is not None:
+            return self._client
+
+        return default_client()
+
+    @property
+    def _session(self) -> httpx.AsyncClient:
+        return self.client.session
+
+    def using(self, client: Client) -> Self:
+        """
+        Use the given client for requests of this endpoint and its sub-clients
+
+        Args:
+            client: A client, e.g. one with custom connection limits
         """
 
-        await self._session.aclose()
+        self._client = client
+        return self
+
+    def _inherit(self, endpoint: EndpointT) -> EndpointT:
+        """
+        Prepares a sub-client, which borrows client, timeout and API key from this
+        endpoint
+        """
+
+        endpoint._client = self._client
+        endpoint.timeout = self.timeout
+        endpoint.auth(self.api_key)
+
+        return endpoint
 
     @functools.cached_property
     def suffix(self) -> str:
@@ -124,52 +213,79 @@ class _Base(Generic[EndpointModel]):
 
         return f"{BASE_URL}/{self.suffix}"
 
-    @functools.cached_property
-    def _klass(self) -> EndpointModel | list[EndpointModel]:
+    @classmethod
+    def _model_type(cls) -> EndpointModel | list[EndpointModel]:
         """
         Returns the actual endpoint model instance for later use, can be a
         `str`, `int`, list[BaseModel], or anything similar
         """
         try:
-            generic_alias = get_generic_alias(self)
+            generic_alias = get_generic_alias(cls)
         except StopIteration as e:
             raise NotImplementedError from e
 
-        if issubclass(self.__class__, IdsBase | AllIdsBase | ListBase | StringsBase):
+        if issubclass(cls, IdsBase | AllIdsBase | ListBase | StringsBase):
             return cast(
                 list[EndpointModel],
                 list[generic_alias.__args__[0]],  # type: ignore[name-defined]
             )
-        elif issubclass(self.__class__, Base):
+        elif issubclass(cls, Base):
             return cast(EndpointModel, generic_alias.__args__[0])
         else:
             raise NotImplementedError
 
+    @functools.cached_property
+    def _klass(self) -> EndpointModel | list[EndpointModel]:
+        """
+        See :py:function:`_model_type()`
+        """
+
+        return self._model_type()
+
+    @functools.cached_property
+    def _adapter(self) -> pydantic.TypeAdapter[EndpointModel | list[EndpointModel]]:
+        """
+        The adapter validating responses, shared by all endpoints of the same model
+        """
+
+        return type_adapter(self._klass)
+
     def _cast(
         self,
-        data: dict[str, Any] | list | str,
+        data: dict[str, Any] | list | str | bytes,
+        *,
+        trusted: bool = False,
     ) -> EndpointModel | list[EndpointModel]:
         """
         Casts data into model
 
         *May be overridden inside the model itself*
+
+        Args:
+            data: The response or stored data
+            trusted: Skip validation of data which was validated before, e.g. by
+                     an earlier response, see :py:mod:`gw2.trusted`
         """
 
         try:
-            if isinstance(data, str):
-                return cast(
-                    EndpointModel | list[EndpointModel],
-                    pydantic.TypeAdapter(self._klass).validate_json(data),
-                )
-
-            return cast(
-                EndpointModel | list[EndpointModel],
-                pydantic.TypeAdapter(self._klass).validate_python(data),
-            )
+            if trusted:
+                if isinstance(data, str | bytes):
+                    data = pydantic_core.from_json(data)
+
+                result = construct(self._klass, data)
+            elif isinstance(data, str | bytes):
+                result = self._adapter.validate_json(data)
+            else:
+                result = self._adapter.validate_python(data)
         except (TypeError, ValueError, ValidationError) as e:
             LOG.exception("Failed to coerce data into model: %s", data)
             raise e
 
+        if self.compactor is not None:
+            result = self.compactor.compact(result)
+
+        return result  # type: ignore[no-any-return]
+
     # region _get()
     @overload
     async def _get(
@@ -177,8 +293,10 @@ class _Base(Generic[EndpointModel]):
         *,
         _id: IdsParameter,
         ids: None = None,
+        page: int | None = None,
+        page_size: int | None = None,
         _raw: Literal[True],
-    ) -> str: ...
+    ) -> bytes: ...
 
     @overload
     async def _get(
@@ -186,6 +304,8 @@ class _Base(Generic[EndpointModel]):
         *,
         _id: IdsParameter,
         ids: None = None,
+        page: int | None = None,
+        page_size: int | None = None,
         _raw: Literal[False] = False,
     ) -> EndpointModel: ...
 
@@ -195,8 +315,10 @@ class _Base(Generic[EndpointModel]):
         *,
         _id: None = None,
         ids: list[IdsVariant] | Literal["all"],
+        page: int | None = None,
+        page_size: int | None = None,
         _raw: Literal[True],
-    ) -> str: ...
+    ) -> bytes: ...
 
     @overload
     async def _get(
@@ -204,6 +326,8 @@ class _Base(Generic[EndpointModel]):
         *,
         _id: None = None,
         ids: list[IdsVariant] | Literal["all"],
+        page: int | None = None,
+        page_size: int | None = None,
         _raw: Literal[False] = False,
     ) -> list[EndpointModel]: ...
 
@@ -213,8 +337,10 @@ class _Base(Generic[EndpointModel]):
         *,
         _id: None = None,
         ids: None = None,
+        page: int | None = None,
+        page_size: int | None = None,
         _raw: Literal[True],
-    ) -> str: ...
+    ) -> bytes: ...
 
     @overload
     async def _get(self) -> EndpointModel: ...
@@ -224,13 +350,18 @@ class _Base(Generic[EndpointModel]):
         *,
         _id: IdsParameter = None,
         ids: list[IdsVariant] | Literal["all"] | None = None,
+        page: int | None = None,
+        page_size: int | None = None,
         _raw: bool = False,
-    ) -> str | EndpointModel | list[EndpointModel]:
+    ) -> bytes | EndpointModel | list[EndpointModel]:
         """
         Get model or raw value from endpoint
 
         Args:
-            _raw: Return the raw API response instead of a model instance
+            page: Page of paginated endpoints, starting at 0
+            page_size: Objects per page, up to MAX_PAGE_SIZE
+            _raw: Return the raw API response (undecoded bytes) instead of a model
+                  instance
 
         Raises:
              httpx.NetworkError: Network-related issues, should not be hit
@@ -252,7 +383,6 @@ class _Base(Generic[EndpointModel]):
         """
 
         # TODO: Check if authentication is required
-        # TODO: Caching
 
         params: dict[str, IdsParameter | list[IdsVariant]] = self._params.copy()
 
@@ -270,49 +400,165 @@ class _Base(Generic[EndpointModel]):
             elif ids == "all":
                 params[ids_name] = "all"
 
-        LOG.debug("Sending request to %s with params %s", self.url, params)
-        async with GLOBAL_THROTTLE:
+        # Pagination, e.g. of /commerce/transactions
+        pagination = {"page": page, "page_size": page_size}
+        params.update({k: v for k, v in pagination.items() if v is not None})
+
+        # Identifies identical requests
+        key = ResponseCache.key(
+            self.url,
+            params,
+            self.api_key,
+            self.client.language,
+        )
+
+        cache = self.cache if self.expiry else None
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                LOG.debug("Cache hit for %s with params %s", self.url, params)
+                meta = cache.meta(key)
+                self.meta = meta.from_cache() if meta is not None else None
+
+                if _raw:
+                    return cached
+
+                return self._cast(cached)
+
+        if self.single_flight is not None:
+            response, meta = await self.single_flight.do(
+                key,
+                lambda: self._request(params),
+            )
+        else:
+            response, meta = await self._request(params)
+
+        self.meta = meta
+
+        # Bytes are validated as they are, decoding them to str would copy them
+        if cache is not None:
+            cache.set(key, response.content, cast(int, self.expiry), meta)
+
+        if _raw:
+            return response.content
+
+        return self._cast(response.content)
+
+    # endregion _get()
+
+    async def _request(
+        self,
+        params: dict[str, Any],
+    ) -> tuple[httpx.Response, ResponseMeta]:
+        """
+        Sends a request to the endpoint and retries it on transient errors according
+        to the endpoint's retry policy, see :py:function:`_send()`
+        """
+
+        policy = self.retry_policy
+        retries = 0
+
+        while True:
             try:
-                response = await self._session.get(self.url, params=params)
-            except httpx.NetworkError:
-                LOG.exception("Failed to fetch data")
-                raise
+                response, latency = await self._send(params)
+            except (Exception, errors.ApiError) as e:
+                if policy is None or not policy.should_retry(e, retries):
+                    raise
+
+                delay = policy.delay(retries)
+                retries += 1
+                LOG.warning(
+                    "Request to %s failed with %r, retry %s/%s in %.1fs",
+                    self.url,
+                    e,
+                    retries,
+                    policy.max_retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            else:
+                if policy is not None:
+                    policy.record_request()
+
+                self.retries = retries
+                meta = ResponseMeta.from_response(
+                    response,
+                    latency=latency,
+                    retries=retries,
+                )
+                return response, meta
+
+    async def _send(self, params: dict[str, Any]) -> tuple[httpx.Response, float]:
+        """
+        Sends a throttled request to the endpoint and raises for any error
+        responses, see :py:function:`_get()` for possible exceptions.
+        Rate limited requests (HTTP 429) are sent again after backing off.
+
+        Returns:
+            The response and the seconds it took, without waiting for the limiter
+        """
+
+        for attempt in range(self.limiter.max_requeues + 1):
+            LOG.debug("Sending request to %s with params %s", self.url, params)
+            async with self.limiter:
+                start = time.monotonic()
+                try:
+                    response = await self._session.get(
+                        self.url,
+                        params=params,
+                        headers=self._headers,
+                        timeout=self.timeout,
+                    )
+                except httpx.NetworkError:
+                    LOG.exception("Failed to fetch data")
+                    raise
+
+                latency = time.monotonic() - start
+
+            if response.status_code != HTTP_TOO_MANY_REQUESTS:
+                break
+
+            # Pause all requests sharing this limiter, then queue up again
+            self.limiter.backoff(
+                parse_retry_after(
+                    response.headers.get("Retry-After"),
+                    DEFAULT_RETRY_AFTER * 2**attempt,
+                ),
+            )
+
+        # Error bodies are short, large responses are never searched in full
+        body = response.content[:ERROR_BODY_PREFIX].lower()
 
         # Raise error if the key is reported as invalid
         if (
             HTTP_BAD_REQUEST <= response.status_code <= HTTP_FORBIDDEN
-            and "authorization" in self._session.headers
-            and "invalid" in response.text.lower()
+            and "Authorization" in self._headers
+            and b"invalid" in body
         ):
             raise errors.InvalidKeyError
 
         if (
             response.status_code == HTTP_BAD_REQUEST
-            and "account does not have game access" in response.text.lower()
+            and b"account does not have game access" in body
         ):
             raise errors.MissingGameAccessError
 
         if (
             response.status_code == HTTP_INTERNAL_SERVER_ERROR
-            and "unknown error" in response.text.lower()
+            and b"unknown error" in body
         ):
             raise errors.UnknownError
 
         # 206 might be returned if only part of the ids were valid, for example
         if response.status_code not in {HTTP_SUCCESS, HTTP_PARTIAL_SUCCESS}:
             LOG.debug(
-                "Unhandled HTTP response: status=%s content=%s",
+                "Unhandled HTTP response: status=%s content=%r",
                 response.status_code,
-                response.text,
+                response.content[:ERROR_BODY_PREFIX],
             )
             response.raise_for_status()
 
-        if _raw:
-            return response.text
-
-        return self._cast(response.text)
-
-    # endregion _get()
+        return response, latency
 
     def auth(self, api_key: str | None = None) -> None:
         """
@@ -324,14 +570,13 @@ class _Base(Generic[EndpointModel]):
 
         self.api_key = api_key
 
-        # Set key on session
+        # Set key on requests of this instance
         if api_key:
-            self._session.headers.update({"Authorization": f"Bearer {api_key}"})
+            self._headers["Authorization"] = f"Bearer {api_key}"
             return
 
-        # Remove key from session
-        if "authorization" in self._session.headers:
-            del self._session.headers["authorization"]
+        # Remove key from requests
+        self._headers.pop("Authorization", None)
 
     def global_auth(self, api_key: str | None = None) -> None:
         """
@@ -368,6 +613,72 @@ class _Base(Generic[EndpointModel]):
         # todo: schema per endpoint
         return {"v": SCHEMA}
 
+    async def _pages(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        *,
+        concurrent: bool = False,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+    ) -> AsyncIterator[list[EndpointModel]]:
+        """
+        Yields the pages of paginated endpoints. The first response tells the number
+        of pages via X-Page-Total, which allows requesting the remaining pages
+        concurrently. Otherwise pages are requested one after another until a short
+        one.
+
+        Args:
+            page_size: Objects per page, up to MAX_PAGE_SIZE
+            concurrent: Request the remaining pages concurrently
+            max_concurrency: Upper bound for concurrent requests
+            ordered: Yield pages in order, otherwise in the order the requests finish
+        """
+
+        models = await self._get_page(0, page_size)
+        page_total = self.meta.page_total if self.meta is not None else None
+
+        if models:
+            yield models
+
+        if len(models) < page_size:
+            return
+
+        if concurrent and page_total is not None:
+            results: AsyncIterator[list[EndpointModel]] = map_bounded(
+                lambda page: self._get_page(page, page_size),
+                range(1, page_total),
+                max_concurrency,
+                ordered=ordered,
+            )
+
+            async for models in results:
+                yield models
+
+            return
+
+        page = 1
+        while True:
+            try:
+                models = await self._get_page(page, page_size)
+            except httpx.HTTPStatusError as e:
+                # The page after a full last page is out of range
+                if e.response.status_code == HTTP_BAD_REQUEST:
+                    return
+
+                raise
+
+            if models:
+                yield models
+
+            if len(models) < page_size:
+                return
+
+            page += 1
+
+    async def _get_page(self, page: int, page_size: int) -> list[EndpointModel]:
+        raw_data = await self._get(page=page, page_size=page_size, _raw=True)
+        return cast(list[EndpointModel], self._cast(raw_data))
+
     def __repr__(self) -> str:
         return f"<{self.__module__}.{self.__class__.__name__}: {self.url}>"
 
@@ -402,6 +713,21 @@ class ListBase(_Base[EndpointModel]):
         raw_data = await super()._get(_raw=True)
         return cast(list[EndpointModel], self._cast(raw_data))
 
+    async def pages(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[list[EndpointModel]]:
+        """
+        Yields the pages of paginated endpoints one after another, e.g. of
+        /commerce/transactions. Pages are only requested while iterating.
+
+        Args:
+            page_size: Objects per page, up to MAX_PAGE_SIZE
+        """
+
+        async for models in self._pages(page_size):
+            yield models
+
 
 class StringsBase(_Base[EndpointModel]):
     """
@@ -426,7 +752,7 @@ class StringsBase(_Base[EndpointModel]):
         """
 
         raw_data = await super()._get(_raw=True)
-        return pydantic.TypeAdapter(list[str]).validate_json(raw_data)
+        return type_adapter(list[str]).validate_json(raw_data)
 
 
 class IdsBase(Generic[EndpointModel, EndpointId], _Base[EndpointModel]):
@@ -435,13 +761,51 @@ class IdsBase(Generic[EndpointModel, EndpointId], _Base[EndpointModel]):
     character endpoint) if requested without any special parameters.
     """
 
+    # Whether all() may use ?ids=all, None discovers it on first use
+    all_ids: bool | None = None
+    # Whether all() requests pages of ?page_size=200 instead of ids first
+    all_pages: bool = False
+    # Batch one() calls issued within this many seconds, None disables batching
+    batch_window: float | None = None
+    # Model field containing the id, used to match batched responses
+    _id_field: str = "id"
+    # Whether objects only change with a new game build, e.g. items
+    static: bool = False
+    # Persistent cache for static endpoints, disabled (None) by default
+    disk_cache: DiskCache | None = None
+
+    # Active routes of /v2.json
+    _routes: ClassVar[list[str] | None] = None
+    # Monotonic time before which /v2.json is not requested again after a failure
+    _routes_retry_at: ClassVar[float] = 0.0
+
     async def ids(self) -> list[EndpointId]:
         """
         Returns a list of IDs for this endpoint
         """
 
         data = await super()._get(_raw=True)
-        return pydantic.TypeAdapter(list[EndpointId]).validate_json(data)
+        return type_adapter(list[EndpointId]).validate_json(data)
+
+    async def count(self) -> int:
+        """
+        Returns the number of objects on this endpoint. A single object is requested
+        via ?page_size=1 and the count is taken from X-Result-Total, the ids are
+        only requested if the endpoint does not support pagination.
+        """
+
+        try:
+            await self._get(page=0, page_size=1, _raw=True)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= HTTP_INTERNAL_SERVER_ERROR:
+                raise
+
+            LOG.debug("?page_size= is not supported by %s", self.url)
+        else:
+            if self.meta is not None and self.meta.result_total is not None:
+                return self.meta.result_total
+
+        return len(await self.ids())
 
     async def one(self, _id: EndpointId) -> EndpointModel:
         """
@@ -457,24 +821,75 @@ class IdsBase(Generic[EndpointModel, EndpointId], _Base[EndpointModel]):
              InvalidKeyError: The API reported that the currently used API key
                             is invalid. This may be caused by invalid keys or
                             server-side caching issues.
+             NotFoundError: The id was not returned by a batched request
              NotImplementedError: Should never occur but might if the API
                                   response changes in unexpected ways.
         """
+
+        if self.batch_window is not None:
+            model = await self.loader().load(_id)
+            if model is None:
+                raise errors.NotFoundError(_id)
+
+            return model
+
         return await super()._get(_id=_id)
 
+    def loader(self) -> BatchLoader[EndpointId, EndpointModel]:
+        """
+        Returns a loader which batches single ids into ?ids= requests. It is shared
+        by all instances of this endpoint with the same client, API key, language,
+        timeout and cache.
+
+        ```python
+        items = await Items().loader().load_many([19721, 19976])
+        ```
+        """
+
+        loaders = _LOADERS.setdefault(asyncio.get_running_loop(), {})
+        key = (
+            self.url,
+            self.client,
+            hash_api_key(self.api_key),
+            self.client.language,
+            self.timeout,
+            self.cache,
+            self.expiry,
+        )
+
+        loader = loaders.get(key)
+        if loader is None:
+            # Later changes to this instance, e.g. of its API key, must not leak
+            # into requests of other instances sharing the loader
+            endpoint = copy.copy(self)
+            endpoint._headers = dict(self._headers)
+
+            loader = loaders[key] = BatchLoader(
+                lambda ids: endpoint._get(ids=ids),
+                lambda model: getattr(model, endpoint._id_field),
+                window=self.batch_window or DEFAULT_BATCH_WINDOW,
+            )
+
+        return loader
+
     async def many(
         self,
         ids: list[EndpointId] | Literal["all"],
         *,
         concurrent: bool = False,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
     ) -> AsyncIterator[EndpointModel]:
         """
         Returns an async generator for the requested objects
 
         Args:
             ids: A list of IDs or "all"
-            concurrent: Enable concurrent requests. Will wait for all requests to finish
-                        before the iterator becomes available.
+            concurrent: Enable concurrent requests. Models are yielded as soon as
+                        their request is done.
+            max_concurrency: Upper bound for concurrent requests
+            ordered: Yield models in the order of the requested IDs, otherwise in
+                     the order the requests finish
         Raises:
              httpx.NetworkError: Network-related issues, should not be hit
                                  usually
@@ -493,29 +908,91 @@ class IdsBase(Generic[EndpointModel, EndpointId], _Base[EndpointModel]):
 
             return
 
-        if concurrent:
-            tasks: list[Task] = []
-            for chunk in chunks(ids, 200):
-                tasks.append(asyncio.ensure_future(self._get(ids=chunk)))
+        cached: dict[str, EndpointModel] = {}
+        missing = ids
+        if self._uses_disk_cache():
+            cached, missing = await self._load_from_disk(ids)
 
-            for results in await cast(
-                Future[list[list[EndpointModel]]],
-                asyncio.gather(*tasks),
-            ):
-                for _model in results:
-                    yield _model
+        batches = list(chunks(missing, 200))
+        if concurrent:
+            results: AsyncIterator[list[EndpointModel]] = map_bounded(
+                self._fetch_chunk,
+                batches,
+                max_concurrency,
+                ordered=ordered,
+            )
         else:
-            for chunk in chunks(ids, 200):
-                for _model in await self._get(ids=chunk):
-                    yield _model
+            results = (await self._fetch_chunk(batch) for batch in batches)
+
+        if cached and ordered:
+            async for _model in self._merge(ids, cached, batches, results):
+                yield _model
+
+            return
+
+        # Stored objects first, then whatever is missing
+        for _model in cached.values():
+            yield _model
+
+        async for models in results:
+            for _model in models:
+                yield _model
+
+    async def _merge(
+        self,
+        ids: list[EndpointId],
+        cached: dict[str, EndpointModel],
+        batches: list[list[EndpointId]],
+        results: AsyncIterator[list[EndpointModel]],
+    ) -> AsyncIterator[EndpointModel]:
+        """
+        Yields stored and fetched models in the order of the requested ids, fetched
+        chunks are awaited once the first of their ids is due
+
+        Args:
+            ids: The requested ids
+            cached: Stored models per id, see :py:function:`_load_from_disk()`
+            batches: The chunks of missing ids, in request order
+            results: Models per chunk, in the order of `batches`
+        """
+
+        pending = iter(batches)
+        fetched: set[str] = set()
+        found: dict[str, EndpointModel] = {}
+
+        for _id in ids:
+            key = str(_id)
+            if key in cached:
+                yield cached[key]
+                continue
+
+            while key not in fetched:
+                fetched.update(str(_) for _ in next(pending))
+                found.update(
+                    (str(getattr(_model, self._id_field)), _model)
+                    for _model in await anext(results)
+                )
+
+            # Unknown ids are missing from responses
+            if key in found:
+                yield found.pop(key)
 
-    async def all(self, *, concurrent: bool = False) -> AsyncIterator[EndpointModel]:
+    async def all(
+        self,
+        *,
+        concurrent: bool = False,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+    ) -> AsyncIterator[EndpointModel]:
         """
         Returns an async iterator for all objects on this endpoint
 
         Args:
-            concurrent: Enable concurrent requests. Will wait for all requests to finish
-                        before the iterator becomes available.
+            concurrent: Enable concurrent requests. Models are yielded as soon as
+                        their request is done.
+            max_concurrency: Upper bound for concurrent requests
+            ordered: Yield models in the order of the requested IDs, otherwise in
+                     the order the requests finish
         Raises:
              httpx.NetworkError: Network-related issues, should not be hit
                                  usually
@@ -528,20 +1005,53 @@ class IdsBase(Generic[EndpointModel, EndpointId], _Base[EndpointModel]):
                                   response changes in unexpected ways.
         """
 
+        if self.all_pages and not self._uses_disk_cache():
+            async for page in self._pages(
+                concurrent=concurrent,
+                max_concurrency=max_concurrency,
+                ordered=ordered,
+            ):
+                for _model in page:
+                    yield _model
+
+            return
+
+        # Fetch everything at once if possible, unless most objects are on disk
+        models = None if self._uses_disk_cache() else await self._get_all_ids()
+        if models is not None:
+            for _model in models:
+                yield _model
+
+            return
+
         # Grab all IDs
         ids = await self.ids()
 
         # Just throw them into many()
-        async for _ in self.many(ids=ids, concurrent=concurrent):
+        async for _ in self.many(
+            ids=ids,
+            concurrent=concurrent,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        ):
             yield _
 
-    async def all_noniter(self, *, concurrent: bool = False) -> list[EndpointModel]:
+    async def all_noniter(
+        self,
+        *,
+        concurrent: bool = False,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
+    ) -> list[EndpointModel]:
         """
         Returns a list of all objects on this endpoint
 
         Args:
-            concurrent: Enable concurrent requests. Will wait for all requests to finish
-                        before the iterator becomes available.
+            concurrent: Enable concurrent requests. Models are yielded as soon as
+                        their request is done.
+            max_concurrency: Upper bound for concurrent requests
+            ordered: Yield models in the order of the requested IDs, otherwise in
+                     the order the requests finish
         Raises:
              httpx.NetworkError: Network-related issues, should not be hit
                                  usually
@@ -554,16 +1064,137 @@ class IdsBase(Generic[EndpointModel, EndpointId], _Base[EndpointModel]):
                                   response changes in unexpected ways.
         """
 
-        # Grab all IDs
-        ids = await self.ids()
-
         items = []
-        async for item in self.many(ids=ids, concurrent=concurrent):
+        async for item in self.all(
+            concurrent=concurrent,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        ):
             items.append(item)
 
         return items
 
-    # TODO: Maybe add a .count property that pre-caches ids?
+    def _uses_disk_cache(self) -> bool:
+        return self.static and self.disk_cache is not None
+
+    async def _load_from_disk(
+        self,
+        ids: list[EndpointId],
+    ) -> tuple[dict[str, EndpointModel], list[EndpointId]]:
+        """
+        Loads objects of the current build from the disk cache
+
+        Returns:
+            The stored models per ID in order of the requested IDs and the missing
+            IDs
+        """
+
+        disk_cache = cast(DiskCache, self.disk_cache)
+        await disk_cache.check_build(self)
+
+        stored = await asyncio.to_thread(
+            disk_cache.get_many,
+            self.url,
+            (str(_id) for _id in ids),
+            self.client.language,
+            SCHEMA,
+        )
+        if not stored:
+            return {}, ids
+
+        found = [str(_id) for _id in ids if str(_id) in stored]
+        missing = [_id for _id in ids if str(_id) not in stored]
+
+        models = cast(
+            list[EndpointModel],
+            self._cast(
+                f"[{','.join(stored[key] for key in found)}]",
+                trusted=disk_cache.trusted,
+            ),
+        )
+        return dict(zip(found, models, strict=True)), missing
+
+    async def _fetch_chunk(self, chunk: list[EndpointId]) -> list[EndpointModel]:
+        """
+        Fetches a chunk of objects and stores them in the disk cache, if enabled
+        """
+
+        if not self._uses_disk_cache():
+            return await self._get(ids=chunk)
+
+        data = json.loads(await self._get(ids=chunk, _raw=True))
+        # Only validated objects are stored, they may be trusted when loaded
+        models = cast(list[EndpointModel], self._cast(data))
+
+        await asyncio.to_thread(
+            cast(DiskCache, self.disk_cache).set_many,
+            self.url,
+            {str(obj[self._id_field]): json.dumps(obj) for obj in data},
+            self.client.language,
+            SCHEMA,
+        )
+
+        return models
+
+    async def _get_all_ids(self) -> list[EndpointModel] | None:
+        """
+        Fetches all objects with a single ?ids=all request if the endpoint supports
+        it. Unless set via `all_ids`, support is discovered once per process: the
+        endpoint has to be an active route in /v2.json and the first request with
+        ?ids=all must not be rejected.
+
+        Returns:
+            All models or None if ?ids=all is not supported
+        """
+
+        if self.all_ids is not None:
+            return await self._get(ids="all") if self.all_ids else None
+
+        route = _match_route(httpx.URL(self.url).path, await self._active_routes())
+        if route is None or not _ALL_IDS_SUPPORT.get(route, True):
+            return None
+
+        try:
+            models = await self._get(ids="all")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= HTTP_INTERNAL_SERVER_ERROR:
+                raise
+
+            LOG.debug("?ids=all is not supported by %s", route)
+            _ALL_IDS_SUPPORT[route] = False
+            return None
+
+        _ALL_IDS_SUPPORT[route] = True
+        return models
+
+    async def _active_routes(self) -> list[str]:
+        """
+        Returns the active routes of /v2.json, loaded once per process. After a
+        failure, no routes are returned for ROUTES_RETRY_AFTER seconds.
+        """
+
+        if IdsBase._routes is None:
+            if time.monotonic() < IdsBase._routes_retry_at:
+                return []
+
+            from gw2.api.details import V2
+
+            # /v2.json is public, the API key of this endpoint is not sent along
+            v2 = V2(timeout=self.timeout, client=self._client)
+            v2.auth(None)
+            # Routes are kept by this class already
+            v2.expiry = None
+
+            try:
+                details = await v2.get()
+            except (httpx.HTTPError, ValidationError):
+                LOG.warning("Failed to load routes from /v2.json", exc_info=True)
+                IdsBase._routes_retry_at = time.monotonic() + ROUTES_RETRY_AFTER
+                return []
+
+            IdsBase._routes = [route.path for route in details.routes if route.active]
+
+        return IdsBase._routes
 
     def __init_subclass__(cls, _ids_param: str | None = None):
         """
@@ -589,49 +1220,102 @@ class AllIdsBase(
     character endpoint) if requested without any special parameters and ?ids=all.
     """
 
-    # TODO: Use ?ids=all on endpoints where that is supported
+    all_ids = True
 
-    async def all(self, *, concurrent: bool = False) -> AsyncIterator[EndpointModel]:
-        """
-        Returns an async iterator for all objects on this endpoint
 
-        Args:
-            concurrent: Doesn't do anything. See Liskov Substitution Principle.
-        Raises:
-             httpx.NetworkError: Network-related issues, should not be hit
-                                 usually
-             httpx.HTTPError: The server responded with a 4xx or 5xx, and
-                              it's not because of an invalid API key
-             InvalidKeyError: The API reported that the currently used API key
-                            is invalid. This may be caused by invalid keys or
-                            server-side caching issues.
-             NotImplementedError: Should never occur but might if the API
-                                  response changes in unexpected ways.
-        """
+def _match_route(path: str, routes: Iterable[str]) -> str | None:
+    """
+    Returns the route matching a path, e.g. /v2/continents/:id/floors for
+    /v2/continents/1/floors
+    """
 
-        async for _ in self.many(ids="all"):
-            yield _
+    segments = path.split("/")
+    for route in routes:
+        route_segments = route.split("/")
 
-    async def all_noniter(self, *, concurrent: bool = False) -> list[EndpointModel]:
-        """
-        Returns a list of all objects on this endpoint
+        if len(route_segments) == len(segments) and all(
+            a == b or a.startswith(":")
+            for a, b in zip(route_segments, segments, strict=True)
+        ):
+            return route
 
-        Args:
-            concurrent: Doesn't do anything. See Liskov Substitution Principle.
-        Raises:
-             httpx.NetworkError: Network-related issues, should not be hit
-                                 usually
-             httpx.HTTPError: The server responded with a 4xx or 5xx, and
-                              it's not because of an invalid API key
-             InvalidKeyError: The API reported that the currently used API key
-                            is invalid. This may be caused by invalid keys or
-                            server-side caching issues.
-             NotImplementedError: Should never occur but might if the API
-                                  response changes in unexpected ways.
-        """
+    return None
 
-        items = []
-        async for item in self.many(ids="all"):
-            items.append(item)
 
-        return items
+def _import_modules(package: str) -> None:
+    """
+    Imports all modules of a package, e.g. gw2.api, which are otherwise imported on
+    first use
+    """
+
+    importlib.import_module(package)
+    for module in pkgutil.iter_modules(sys.modules[package].__path__):
+        importlib.import_module(f"{package}.{module.name}")
+
+
+def _subclasses(klass: ClassT) -> Iterator[ClassT]:
+    for subclass in klass.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def build_adapters(endpoints: Iterable[type[_Base[Any]]] | None = None) -> None:
+    """
+    Builds the adapters of the given endpoint classes ahead of time, e.g. on startup
+    of long-running services. Otherwise, every adapter is built on first use.
+
+    Args:
+        endpoints: Endpoint classes, defaults to all endpoints
+    """
+
+    if endpoints is None:
+        _import_modules(__name__.rpartition(".")[0])
+        endpoints = set(_subclasses(_Base))
+
+    for endpoint in endpoints:
+        # Skip generic base classes
+        if getattr(endpoint, "__parameters__", ()):
+            continue
+
+        try:
+            type_adapter(endpoint._model_type())
+        except NotImplementedError:
+            LOG.debug("Skipping adapter of %s", endpoint)
+
+
+def prewarm(
+    targets: Iterable[type[_Base[Any]] | type[pydantic.BaseModel]] | None = None,
+) -> None:
+    """
+    Builds validators ahead of time, e.g. on startup of long-running services which
+    would rather pay the cost up front. Otherwise, the schemas of models and
+    endpoints are built on first use.
+
+    ```python
+    gw2.prewarm([gw2.Items, gw2.Skills, gw2.models.Character])
+    ```
+
+    Args:
+        targets: Endpoint or model classes, defaults to all endpoints and models
+    """
+
+    if targets is None:
+        build_adapters()
+
+        # Models validated on their own, e.g. item details, have their own schema
+        _import_modules("gw2.models")
+        for model in _subclasses(BaseModel):
+            # Skip generic base classes
+            if not model.__pydantic_generic_metadata__["parameters"]:
+                model.model_rebuild()
+
+        return
+
+    endpoints = []
+    for target in targets:
+        if issubclass(target, pydantic.BaseModel):
+            target.model_rebuild()
+        else:
+            endpoints.append(target)
+
+    build_adapters(endpoints)
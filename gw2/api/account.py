@@ -4,320 +4,256 @@ from gw2.models import account, common
 from ._base import Base, IdsBase, ListBase
 
 
-class Account(Base[models.Account]):
+class _Account:
+    # Account data changes at any time and must not be answered from the cache
+    expiry: int | None = None
+
+
+class Account(_Account, Base[models.Account]):
     def achievements(self) -> "Achievements":
-        client = Achievements()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Achievements())
 
     def bank(self) -> "Bank":
-        client = Bank()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Bank())
 
     def build_storage(self) -> "BuildStorage":
-        client = BuildStorage()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(BuildStorage())
 
     def daily_crafting(self) -> "DailyCrafting":
-        client = DailyCrafting()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(DailyCrafting())
 
     def dungeons(self) -> "Dungeons":
-        client = Dungeons()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Dungeons())
 
     def dyes(self) -> "Dyes":
-        client = Dyes()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Dyes())
 
     def finishers(self) -> "Finishers":
-        client = Finishers()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Finishers())
 
     def gliders(self) -> "Gliders":
-        client = Gliders()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Gliders())
 
     def home_cats(self) -> "HomeCats":
-        client = HomeCats()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(HomeCats())
 
     def home_nodes(self) -> "HomeNodes":
-        client = HomeNodes()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(HomeNodes())
 
     def legendary_armory(self) -> "LegendaryArmory":
-        client = LegendaryArmory()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(LegendaryArmory())
 
     def luck(self) -> "Luck":
-        client = Luck()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Luck())
 
     def mail_carriers(self) -> "MailCarriers":
-        client = MailCarriers()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(MailCarriers())
 
     def map_chests(self) -> "MapChests":
-        client = MapChests()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(MapChests())
 
     def masteries(self) -> "Masteries":
-        client = Masteries()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Masteries())
 
     def mastery_points(self) -> "MasteryPoints":
-        client = MasteryPoints()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(MasteryPoints())
 
     def materials(self) -> "Materials":
-        client = Materials()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Materials())
 
     def minis(self) -> "Minis":
-        client = Minis()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Minis())
 
     def mount_skins(self) -> "MountSkins":
-        client = MountSkins()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(MountSkins())
 
     def mount_types(self) -> "MountTypes":
-        client = MountTypes()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(MountTypes())
 
     def novelties(self) -> "Novelties":
-        client = Novelties()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Novelties())
 
     def outfits(self) -> "Outfits":
-        client = Outfits()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Outfits())
 
     def progression(self) -> "Progression":
-        client = Progression()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Progression())
 
     def pvp_heroes(self) -> "PvPHeroes":
-        client = PvPHeroes()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(PvPHeroes())
 
     def raids(self) -> "Raids":
-        client = Raids()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Raids())
 
     def recipes(self) -> "Recipes":
-        client = Recipes()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Recipes())
 
     def shared_inventory(self) -> "SharedInventory":
-        client = SharedInventory()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(SharedInventory())
 
     def skins(self) -> "Skins":
-        client = Skins()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Skins())
 
     def titles(self) -> "Titles":
-        client = Titles()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Titles())
 
     def wallet(self) -> "Wallet":
-        client = Wallet()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Wallet())
 
     def wizards_vault_daily(self) -> "WizardsVaultDaily":
-        client = WizardsVaultDaily()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(WizardsVaultDaily())
 
     def wizards_vault_listings(self) -> "WizardsVaultListings":
-        client = WizardsVaultListings()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(WizardsVaultListings())
 
     def wizards_vault_special(self) -> "WizardsVaultSpecial":
-        client = WizardsVaultSpecial()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(WizardsVaultSpecial())
 
     def wizards_vault_weekly(self) -> "WizardsVaultWeekly":
-        client = WizardsVaultWeekly()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(WizardsVaultWeekly())
 
     def world_bosses(self) -> "WorldBosses":
-        client = WorldBosses()
-        client.auth(self.api_key)
-        return client
+        return self._inherit(WorldBosses())
 
 
-class Achievements(ListBase[account.Achievement]):
+class Achievements(_Account, ListBase[account.Achievement]):
     suffix = "account/achievements"
 
 
-class Bank(ListBase[common.InventorySlot | None]):
+class Bank(_Account, ListBase[common.InventorySlot | None]):
     suffix = "account/bank"
 
 
-class BuildStorage(IdsBase[common.BuildTab.Build, int]):
+class BuildStorage(_Account, IdsBase[common.BuildTab.Build, int]):
     suffix = "account/buildstorage"
 
 
-class DailyCrafting(ListBase[str]):
+class DailyCrafting(_Account, ListBase[str]):
     suffix = "account/dailycrafting"
 
 
-class Dungeons(ListBase[str]):
+class Dungeons(_Account, ListBase[str]):
     suffix = "account/dungeons"
 
 
-class Dyes(ListBase[int]):
+class Dyes(_Account, ListBase[int]):
     suffix = "account/dyes"
 
 
-class Finishers(ListBase[account.Finisher]):
+class Finishers(_Account, ListBase[account.Finisher]):
     suffix = "account/finishers"
 
 
-class Gliders(ListBase[int]):
+class Gliders(_Account, ListBase[int]):
     suffix = "account/gliders"
 
 
-class HomeCats(ListBase[int]):
+class HomeCats(_Account, ListBase[int]):
     suffix = "account/home/cats"
 
 
-class HomeNodes(ListBase[str]):
+class HomeNodes(_Account, ListBase[str]):
     suffix = "account/home/nodes"
 
 
-class LegendaryArmory(ListBase[account.LegendaryArmory]):
+class LegendaryArmory(_Account, ListBase[account.LegendaryArmory]):
     suffix = "account/legendaryarmory"
 
 
-class Luck(ListBase[account.Luck]):
+class Luck(_Account, ListBase[account.Luck]):
     suffix = "account/luck"
 
 
-class MailCarriers(ListBase[int]):
+class MailCarriers(_Account, ListBase[int]):
     suffix = "account/mailcarriers"
 
 
-class MapChests(ListBase[str]):
+class MapChests(_Account, ListBase[str]):
     suffix = "account/mapchests"
 
 
-class Masteries(ListBase[account.Mastery]):
+class Masteries(_Account, ListBase[account.Mastery]):
     suffix = "account/masteries"
 
 
-class MasteryPoints(Base[account.MasteryPoints]):
+class MasteryPoints(_Account, Base[account.MasteryPoints]):
     suffix = "account/mastery/points"
 
 
-class Materials(ListBase[account.Material]):
+class Materials(_Account, ListBase[account.Material]):
     suffix = "account/materials"
 
 
-class Minis(ListBase[int]):
+class Minis(_Account, ListBase[int]):
     suffix = "account/minis"
 
 
-class MountTypes(ListBase[str]):
+class MountTypes(_Account, ListBase[str]):
     suffix = "account/mounts/types"
 
 
-class MountSkins(ListBase[int]):
+class MountSkins(_Account, ListBase[int]):
     suffix = "account/mounts/skins"
 
 
-class Novelties(ListBase[int]):
+class Novelties(_Account, ListBase[int]):
     suffix = "account/novelties"
 
 
-class Outfits(ListBase[int]):
+class Outfits(_Account, ListBase[int]):
     suffix = "account/outfits"
 
 
-class Progression(ListBase[account.Progression]):
+class Progression(_Account, ListBase[account.Progression]):
     suffix = "account/progression"
 
 
-class PvPHeroes(ListBase[int]):
+class PvPHeroes(_Account, ListBase[int]):
     suffix = "account/pvp/heroes"
 
 
-class Raids(ListBase[str]):
+class Raids(_Account, ListBase[str]):
     suffix = "account/raids"
 
 
-class Recipes(ListBase[int]):
+class Recipes(_Account, ListBase[int]):
     suffix = "account/recipes"
 
 
 class SharedInventory(
+    _Account,
     ListBase[account.SharedInventorySlot | None],
 ):
     suffix = "account/inventory"
 
 
-class Skins(ListBase[int]):
+class Skins(_Account, ListBase[int]):
     suffix = "account/skins"
 
 
-class Titles(ListBase[int]):
+class Titles(_Account, ListBase[int]):
     suffix = "account/titles"
 
 
-class Wallet(ListBase[account.WalletEntry]):
+class Wallet(_Account, ListBase[account.WalletEntry]):
     suffix = "account/wallet"
 
 
-class WizardsVaultDaily(Base[account.WizardsVaultDaily]):
+class WizardsVaultDaily(_Account, Base[account.WizardsVaultDaily]):
     suffix = "account/wizardsvault/daily"
 
 
-class WizardsVaultListings(ListBase[account.AccountWizardsVaultListing]):
+class WizardsVaultListings(_Account, ListBase[account.AccountWizardsVaultListing]):
     suffix = "account/wizardsvault/listings"
 
 
-class WizardsVaultSpecial(Base[account.WizardsVaultSpecial]):
+class WizardsVaultSpecial(_Account, Base[account.WizardsVaultSpecial]):
     suffix = "account/wizardsvault/special"
 
 
-class WizardsVaultWeekly(Base[account.WizardsVaultWeekly]):
+class WizardsVaultWeekly(_Account, Base[account.WizardsVaultWeekly]):
     suffix = "account/wizardsvault/weekly"
 
 
-class WorldBosses(ListBase[str]):
+class WorldBosses(_Account, ListBase[str]):
     suffix = "account/worldbosses"
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Achievements(IdsBase[models.Achievement, int]):
-    pass
+    static = True
 
 
 class Achievement(Base[models.Achievement]):
@@ -20,6 +20,7 @@ class Achievement(Base[models.Achievement]):
 
 
 class AchievementCategories(IdsBase[models.AchievementCategory, int]):
+    static = True
     suffix = "achievements/categories"
 
 
@@ -34,6 +35,7 @@ class AchievementCategory(Base[models.AchievementCategory]):
 
 
 class AchievementGroups(IdsBase[models.AchievementGroup, str]):
+    static = True
     suffix = "achievements/groups"
 
 
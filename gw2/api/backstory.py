@@ -6,6 +6,7 @@ from ._base import Base, IdsBase
 
 
 class BackstoryQuestions(IdsBase[models.BackstoryQuestion, str]):
+    static = True
     suffix = "backstory/questions"
 
 
@@ -22,6 +23,7 @@ class BackstoryQuestion(Base[models.BackstoryQuestion]):
 class BackstoryAnswers(
     IdsBase[models.BackstoryAnswer, str],
 ):
+    static = True
     suffix = "backstory/answers"
 
 
@@ -1,6 +1,5 @@
-import httpx
-
 from gw2 import models
+from gw2.client import default_client
 
 from ._base import Base
 
@@ -22,20 +21,19 @@ class BuildManifest:
              ValueError
         """
 
-        async with httpx.AsyncClient() as ac:
-            # noinspection HttpUrlsUsage
-            response = await ac.get(
-                "http://assetcdn.101.arenanetworks.com/latest64/101",
+        # noinspection HttpUrlsUsage
+        response = await default_client().session.get(
+            "http://assetcdn.101.arenanetworks.com/latest64/101",
+        )
+
+        try:
+            data = response.text.split(" ")
+            return models.BuildManifest(
+                build_id=data[0],  # type: ignore[arg-type]
+                exe_id=data[1],  # type: ignore[arg-type]
+                exe_size=data[2],  # type: ignore[arg-type]
+                manifest_id=data[3],  # type: ignore[arg-type]
+                manifest_size=data[4],  # type: ignore[arg-type]
             )
-
-            try:
-                data = response.text.split(" ")
-                return models.BuildManifest(
-                    build_id=data[0],  # type: ignore[arg-type]
-                    exe_id=data[1],  # type: ignore[arg-type]
-                    exe_size=data[2],  # type: ignore[arg-type]
-                    manifest_id=data[3],  # type: ignore[arg-type]
-                    manifest_size=data[4],  # type: ignore[arg-type]
-                )
-            except IndexError as e:
-                raise ValueError from e
+        except IndexError as e:
+            raise ValueError from e
@@ -7,10 +7,14 @@ from ._base import Base, IdsBase, ListBase
 
 
 class Characters(IdsBase[models.Character, str]):
-    pass
+    _id_field = "name"
+    expiry = None
 
 
 class _Character:
+    # Character data changes at any time and must not be answered from the cache
+    expiry: int | None = None
+
     def __init__(self, character_name: str):
         self.character_name = character_name
         super().__init__()
@@ -22,54 +26,34 @@ class Character(_Character, Base[models.Character]):
         return f"characters/{self.character_name}"
 
     def backstory(self) -> "Backstory":
-        client = Backstory(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Backstory(self.character_name))
 
     def build_tabs(self) -> "BuildTabs":
-        client = BuildTabs(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(BuildTabs(self.character_name))
 
     def core(self) -> "Core":
-        client = Core(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Core(self.character_name))
 
     def crafting(self) -> "Crafting":
-        client = Crafting(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Crafting(self.character_name))
 
     def equipment(self) -> "Equipment":
-        client = Equipment(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Equipment(self.character_name))
 
     def equipment_tabs(self) -> "EquipmentTabs":
-        client = EquipmentTabs(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(EquipmentTabs(self.character_name))
 
     def inventory(self) -> "Inventory":
-        client = Inventory(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Inventory(self.character_name))
 
     def quests(self) -> "Quests":
-        client = Quests(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Quests(self.character_name))
 
     def recipes(self) -> "Recipes":
-        client = Recipes(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Recipes(self.character_name))
 
     def sab(self) -> "SuperAdventureBox":
-        client = SuperAdventureBox(self.character_name)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(SuperAdventureBox(self.character_name))
 
 
 class Backstory(_Character, Base[characters.Backstory]):
@@ -83,6 +67,8 @@ class BuildTabs(
     IdsBase[characters.BuildTab, int],
     _ids_param="tabs",
 ):
+    _id_field = "tab"
+
     @functools.cached_property
     def suffix(self) -> str:
         return f"characters/{self.character_name}/buildtabs"
@@ -111,6 +97,8 @@ class EquipmentTabs(
     IdsBase[characters.EquipmentTabs, int],
     _ids_param="tabs",
 ):
+    _id_field = "tab"
+
     @functools.cached_property
     def suffix(self) -> str:
         return f"characters/{self.character_name}/equipmenttabs"
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Colors(IdsBase[models.Color, int]):
-    pass
+    static = True
 
 
 class Color(Base[models.Color]):
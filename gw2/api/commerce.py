@@ -0,0 +1,123 @@
+import functools
+from collections.abc import AsyncIterator
+from typing import Literal
+
+import pydantic_core
+
+from gw2 import models
+from gw2.orderbook import OrderBook
+from gw2.utils import chunks, map_bounded
+
+from ._base import DEFAULT_CONCURRENCY, MAX_PAGE_SIZE, Base, IdsBase, ListBase
+
+
+class Prices(IdsBase[models.Price, int]):
+    suffix = "commerce/prices"
+    # Prices change constantly and must not be answered from the cache
+    expiry = None
+
+
+class Price(Base[models.Price]):
+    expiry = None
+
+    def __init__(self, item_id: int):
+        self.item_id = item_id
+        super().__init__()
+
+    @functools.cached_property
+    def suffix(self) -> str:
+        return f"commerce/prices/{self.item_id}"
+
+
+class Listings(IdsBase[models.Listings, int]):
+    suffix = "commerce/listings"
+    expiry = None
+
+    async def order_book(
+        self,
+        ids: list[int] | None = None,
+        *,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> OrderBook:
+        """
+        Fetches listings into a columnar order book, without creating models
+
+        Args:
+            ids: Items to fetch, all tradable items by default
+            max_concurrency: Upper bound for concurrent requests
+        """
+
+        if ids is None:
+            ids = await self.ids()
+
+        book = OrderBook()
+        async for raw in map_bounded(
+            lambda chunk: self._get(ids=chunk, _raw=True),
+            chunks(ids, 200),
+            max_concurrency,
+            ordered=False,
+        ):
+            book.extend(pydantic_core.from_json(raw))
+
+        return book
+
+
+class Listing(Base[models.Listings]):
+    expiry = None
+
+    def __init__(self, item_id: int):
+        self.item_id = item_id
+        super().__init__()
+
+    @functools.cached_property
+    def suffix(self) -> str:
+        return f"commerce/listings/{self.item_id}"
+
+
+class Transactions(ListBase[models.Transaction]):
+    """
+    Trading post transactions of the authenticated account, newest first.
+    `get()` only returns the first page, see :py:function:`pages()`.
+    """
+
+    expiry = None
+
+    def __init__(
+        self,
+        state: Literal["current", "history"] = "history",
+        side: Literal["buys", "sells"] = "buys",
+    ):
+        """
+        Args:
+            state: Open orders or transactions of the past 90 days
+            side: Buy orders or sell offers
+        """
+
+        self.state = state
+        self.side = side
+        super().__init__()
+
+    @functools.cached_property
+    def suffix(self) -> str:
+        return f"commerce/transactions/{self.state}/{self.side}"
+
+    async def since(
+        self,
+        transaction_id: int | None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[models.Transaction]:
+        """
+        Yields transactions newer than `transaction_id`, newest first. No further
+        pages are requested once it was reached.
+
+        Args:
+            transaction_id: The newest known transaction, None yields all
+            page_size: Transactions per request
+        """
+
+        async for page in self.pages(page_size):
+            for transaction in page:
+                if transaction_id is not None and transaction.id <= transaction_id:
+                    return
+
+                yield transaction
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Continents(IdsBase[models.Continent, int]):
-    pass
+    static = True
 
 
 class Continent(Base[models.Continent]):
@@ -19,13 +19,15 @@ class Continent(Base[models.Continent]):
         return f"continents/{self.continent_id}"
 
     def floors(self) -> "Floors":
-        return Floors(self.continent_id)
+        return self._inherit(Floors(self.continent_id))
 
     def floor(self, floor_id: int) -> "Floor":
-        return Floor(self.continent_id, floor_id)
+        return self._inherit(Floor(self.continent_id, floor_id))
 
 
 class Floors(IdsBase[models.Floor, int]):
+    static = True
+
     def __init__(self, continent_id: int):
         self.continent_id = continent_id
         super().__init__()
@@ -46,13 +48,15 @@ class Floor(Base[models.Floor]):
         return f"continents/{self.continent_id}/floors/{self.floor_id}"
 
     def regions(self) -> "Regions":
-        return Regions(self.continent_id, self.floor_id)
+        return self._inherit(Regions(self.continent_id, self.floor_id))
 
     def region(self, region_id: int) -> "Region":
-        return Region(self.continent_id, self.floor_id, region_id)
+        return self._inherit(Region(self.continent_id, self.floor_id, region_id))
 
 
 class Regions(IdsBase[models.Region, int]):
+    static = True
+
     def __init__(self, continent_id: int, floor_id: int):
         self.continent_id = continent_id
         self.floor_id = floor_id
@@ -78,13 +82,19 @@ class Region(Base[models.Region]):
         )
 
     def maps(self) -> "ContinentMaps":
-        return ContinentMaps(self.continent_id, self.floor_id, self.region_id)
+        return self._inherit(
+            ContinentMaps(self.continent_id, self.floor_id, self.region_id)
+        )
 
     def map(self, map_id: int) -> "ContinentMap":
-        return ContinentMap(self.continent_id, self.floor_id, self.region_id, map_id)
+        return self._inherit(
+            ContinentMap(self.continent_id, self.floor_id, self.region_id, map_id)
+        )
 
 
 class ContinentMaps(IdsBase[models.ContinentMap, int]):
+    static = True
+
     def __init__(self, continent_id: int, floor_id: int, region_id: int):
         self.continent_id = continent_id
         self.floor_id = floor_id
@@ -115,33 +125,45 @@ class ContinentMap(Base[models.ContinentMap]):
         )
 
     def sectors(self) -> "Sectors":
-        return Sectors(self.continent_id, self.floor_id, self.region_id, self.map_id)
+        return self._inherit(
+            Sectors(self.continent_id, self.floor_id, self.region_id, self.map_id)
+        )
 
     def sector(self, sector_id: int) -> "Sector":
-        return Sector(
-            self.continent_id, self.floor_id, self.region_id, self.map_id, sector_id
+        return self._inherit(
+            Sector(
+                self.continent_id, self.floor_id, self.region_id, self.map_id, sector_id
+            )
         )
 
     def pois(self) -> "PointsOfInterest":
-        return PointsOfInterest(
-            self.continent_id, self.floor_id, self.region_id, self.map_id
+        return self._inherit(
+            PointsOfInterest(
+                self.continent_id, self.floor_id, self.region_id, self.map_id
+            )
         )
 
     def poi(self, poi_id: int) -> "PointOfInterest":
-        return PointOfInterest(
-            self.continent_id, self.floor_id, self.region_id, self.map_id, poi_id
+        return self._inherit(
+            PointOfInterest(
+                self.continent_id, self.floor_id, self.region_id, self.map_id, poi_id
+            )
         )
 
     def tasks(self) -> "Tasks":
-        return Tasks(self.continent_id, self.floor_id, self.region_id, self.map_id)
+        return self._inherit(
+            Tasks(self.continent_id, self.floor_id, self.region_id, self.map_id)
+        )
 
     def task(self, task_id: int) -> "Task":
-        return Task(
-            self.continent_id, self.floor_id, self.region_id, self.map_id, task_id
+        return self._inherit(
+            Task(self.continent_id, self.floor_id, self.region_id, self.map_id, task_id)
         )
 
 
 class Sectors(IdsBase[models.Sector, int]):
+    static = True
+
     def __init__(self, continent_id: int, floor_id: int, region_id: int, map_id: int):
         self.continent_id = continent_id
         self.floor_id = floor_id
@@ -219,6 +241,8 @@ class PointOfInterest(Base[models.PointOfInterest]):
 
 
 class Tasks(IdsBase[models.Task, int]):
+    static = True
+
     def __init__(self, continent_id: int, floor_id: int, region_id: int, map_id: int):
         self.continent_id = continent_id
         self.floor_id = floor_id
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Currencies(IdsBase[models.Currency, int]):
-    pass
+    static = True
 
 
 class Currency(Base[models.Currency]):
@@ -6,6 +6,7 @@ from ._base import Base, IdsBase
 
 
 class EmblemBackgrounds(IdsBase[models.Emblem, int]):
+    static = True
     suffix = "emblem/backgrounds"
 
 
@@ -20,6 +21,7 @@ class EmblemBackground(Base[models.Emblem]):
 
 
 class EmblemForegrounds(IdsBase[models.Emblem, int]):
+    static = True
     suffix = "emblem/foregrounds"
 
 
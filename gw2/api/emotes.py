@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Emotes(IdsBase[models.Emote, int]):
-    pass
+    static = True
 
 
 class Emote(Base[models.Emote]):
@@ -6,7 +6,7 @@ from ._base import AllIdsBase, Base
 
 
 class Files(AllIdsBase[models.File, str]):
-    pass
+    static = True
 
 
 class File(Base[models.File]):
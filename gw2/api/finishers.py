@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Finishers(IdsBase[models.Finisher, int]):
-    pass
+    static = True
 
 
 class Finisher(Base[models.Finisher]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Gliders(IdsBase[models.Glider, int]):
-    pass
+    static = True
 
 
 class Glider(Base[models.Glider]):
@@ -1,14 +1,17 @@
 import functools
 
-import pydantic
-
 from gw2 import errors
+from gw2.utils import type_adapter
 
 from ..models import guild
 from ._base import Base, IdsBase, ListBase, StringsBase
 
 
 class _Guild:
+    # Guild data of members changes at any time and must not be answered from
+    # the cache
+    expiry: int | None = None
+
     def __init__(self, guild_id: str):
         self.guild_id = guild_id
         super().__init__()
@@ -22,45 +25,29 @@ class Guild(
     def suffix(self) -> str:
         return f"guild/{self.guild_id}"
 
-    def log(self) -> "Log":
-        client = Log(self.guild_id)
-        client.auth(self.api_key)
-        return client
+    def log(self, since: int | None = None) -> "Log":
+        return self._inherit(Log(self.guild_id, since))
 
     def members(self) -> "Members":
-        client = Members(self.guild_id)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Members(self.guild_id))
 
     def ranks(self) -> "Ranks":
-        client = Ranks(self.guild_id)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Ranks(self.guild_id))
 
     def stash(self) -> "Stash":
-        client = Stash(self.guild_id)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Stash(self.guild_id))
 
     def storage(self) -> "Storage":
-        client = Storage(self.guild_id)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Storage(self.guild_id))
 
     def teams(self) -> "Teams":
-        client = Teams(self.guild_id)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Teams(self.guild_id))
 
     def treasury(self) -> "Treasury":
-        client = Treasury(self.guild_id)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Treasury(self.guild_id))
 
     def upgrades(self) -> "Upgrades":
-        client = Upgrades(self.guild_id)
-        client.auth(self.api_key)
-        return client
+        return self._inherit(Upgrades(self.guild_id))
 
 
 class GuildSearch(Base[guild.Guild]):
@@ -76,14 +63,14 @@ class GuildSearch(Base[guild.Guild]):
 
     async def ids(self) -> list[str]:
         raw_data = await super()._get(_raw=True)
-        return pydantic.TypeAdapter(list[str]).validate_json(raw_data)
+        return type_adapter(list[str]).validate_json(raw_data)
 
     async def get(self) -> guild.Guild:
         guids = await self.ids()
         if len(guids) == 0:
             raise errors.GuildNotFoundError()
 
-        return await Guild(guids[0]).get()
+        return await self._inherit(Guild(guids[0])).get()
 
 
 class GuildPermissions(StringsBase[guild.GuildPermission]):
@@ -101,6 +88,7 @@ class GuildPermission(Base[guild.GuildPermission]):
 
 
 class GuildUpgrades(IdsBase[guild.GuildUpgrade, int]):
+    static = True
     suffix = "guild/upgrades"
 
 
@@ -114,25 +102,29 @@ class GuildUpgrade(Base[guild.GuildUpgrade]):
         return f"guild/upgrades/{self.upgrade_id}"
 
 
-class Log(
-    _Guild,
-    ListBase[
-        guild.Log.Invite
-        | guild.Log.InviteDeclined
-        | guild.Log.Kick
-        | guild.Log.Join
-        | guild.Log.Motd
-        | guild.Log.RankChange
-        | guild.Log.Stash
-        | guild.Log.Treasury
-        | guild.Log.Upgrade
-        | guild.Log.Influence
-    ],
-):
+class Log(_Guild, ListBase[guild.AnyLog]):
+    def __init__(self, guild_id: str, since: int | None = None):
+        """
+        Args:
+            guild_id: The guild's id
+            since: Only return entries newer than this log id
+        """
+
+        self.since = since
+        super().__init__(guild_id)
+
     @functools.cached_property
     def suffix(self) -> str:
         return f"guild/{self.guild_id}/log"
 
+    @functools.cached_property
+    def _params(self) -> dict:
+        params = super()._params
+        if self.since is not None:
+            params["since"] = self.since
+
+        return params
+
 
 class Members(_Guild, ListBase[guild.Member]):
     @functools.cached_property
@@ -6,6 +6,7 @@ from ._base import Base, IdsBase, StringsBase
 
 
 class HomeCats(IdsBase[models.HomeCat, int]):
+    static = True
     suffix = "home/cats"
 
 
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class ItemStats(IdsBase[models.ItemStat, str]):
-    pass
+    static = True
 
 
 class ItemStat(Base[models.ItemStat]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Items(IdsBase[models.Item, int]):
-    pass
+    static = True
 
 
 class Item(Base[models.Item]):
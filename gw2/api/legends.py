@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Legends(IdsBase[models.Legend, int]):
-    pass
+    static = True
 
 
 class Legend(Base[models.Legend]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class MailCarriers(IdsBase[models.MailCarrier, str]):
-    pass
+    static = True
 
 
 class MailCarrier(Base[models.MailCarrier]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class MapChests(IdsBase[models.MapChest, int]):
-    pass
+    static = True
 
 
 class MapChest(Base[models.MapChest]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Maps(IdsBase[models.Map, int]):
-    pass
+    static = True
 
 
 class Map(Base[models.Map]):
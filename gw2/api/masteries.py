@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Masteries(IdsBase[models.Mastery, int]):
-    pass
+    static = True
 
 
 class Mastery(Base[models.Mastery]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Materials(IdsBase[models.Material, int]):
-    pass
+    static = True
 
 
 class Material(Base[models.Material]):
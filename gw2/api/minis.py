@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Minis(IdsBase[models.Mini, int]):
-    pass
+    static = True
 
 
 class Mini(Base[models.Mini]):
@@ -6,6 +6,7 @@ from ._base import Base, IdsBase, StringsBase
 
 
 class MountSkins(IdsBase[models.MountSkin, int]):
+    static = True
     suffix = "mounts/skins"
 
 
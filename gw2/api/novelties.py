@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Novelties(IdsBase[models.Novelty, int]):
-    pass
+    static = True
 
 
 class Novelty(Base[models.Novelty]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Outfits(IdsBase[models.Outfit, int]):
-    pass
+    static = True
 
 
 class Outfit(Base[models.Outfit]):
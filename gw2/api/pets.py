@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Pets(IdsBase[models.Pet, int]):
-    pass
+    static = True
 
 
 class Pet(Base[models.Pet]):
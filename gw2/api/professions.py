@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Professions(IdsBase[models.Profession, str]):
-    pass
+    static = True
 
 
 class Profession(Base[models.Profession]):
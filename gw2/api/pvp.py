@@ -7,6 +7,7 @@ from ._base import AllIdsBase, Base, IdsBase, ListBase
 
 
 class Amulets(IdsBase[models.Amulet, int]):
+    static = True
     suffix = "pvp/amulets"
 
 
@@ -22,9 +23,12 @@ class Amulet(Base[models.Amulet]):
 
 class Games(IdsBase[models.Game, str]):
     suffix = "pvp/games"
+    expiry = None
 
 
 class Game(Base[models.Game]):
+    expiry = None
+
     def __init__(self, game_id: str):
         self.game_id = game_id
         super().__init__()
@@ -49,6 +53,7 @@ class Hero(Base[models.Hero]):
 
 
 class PvPRanks(IdsBase[models.PvPRank, int]):
+    static = True
     suffix = "pvp/ranks"
 
 
@@ -72,8 +77,7 @@ class Season(Base[models.Season]):
         super().__init__()
 
     def leaderboards(self, region: Literal["na", "eu"]) -> "Leaderboards":
-        client = Leaderboards(self.season_id, region)
-        return client
+        return self._inherit(Leaderboards(self.season_id, region))
 
     @functools.cached_property
     def suffix(self) -> str:
@@ -93,7 +97,9 @@ class Leaderboards(ListBase[models.LeaderboardLadder]):
 
 class Standings(ListBase[models.Standings]):
     suffix = "pvp/standings"
+    expiry = None
 
 
 class Stats(Base[models.Stats]):
     suffix = "pvp/stats"
+    expiry = None
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Quests(IdsBase[models.Quest, int]):
-    pass
+    static = True
 
 
 class Quest(Base[models.Quest]):
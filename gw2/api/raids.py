@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Raids(IdsBase[models.Raid, int]):
-    pass
+    static = True
 
 
 class Raid(Base[models.Raid]):
@@ -7,6 +7,8 @@ from ._base import Base, IdsBase
 
 
 class Recipes(IdsBase[models.Recipe, int]):
+    static = True
+
     @staticmethod
     @overload
     def search(*, input_id: int) -> "RecipeSearch": ...
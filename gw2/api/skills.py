@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Skills(IdsBase[models.Skill, int]):
-    pass
+    static = True
 
 
 class Skill(Base[models.Skill]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Skins(IdsBase[models.Skin, int]):
-    pass
+    static = True
 
 
 class Skin(Base[models.Skin]):
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Specializations(IdsBase[models.Specialization, int]):
-    pass
+    static = True
 
 
 class Specialization(Base[models.Specialization]):
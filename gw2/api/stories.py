@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Stories(IdsBase[models.Story, int]):
-    pass
+    static = True
 
 
 class Story(Base[models.Story]):
@@ -20,6 +20,7 @@ class Story(Base[models.Story]):
 
 
 class StorySeasons(IdsBase[models.StorySeason, str]):
+    static = True
     suffix = "stories/seasons"
 
 
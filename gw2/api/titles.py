@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Titles(IdsBase[models.Title, int]):
-    pass
+    static = True
 
 
 class Title(Base[models.Title]):
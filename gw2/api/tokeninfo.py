@@ -6,4 +6,4 @@ from ._base import Base
 class TokenInfo(
     Base[models.TokenInfo | models.SubTokenInfo],
 ):
-    pass
+    expiry = None
@@ -6,7 +6,7 @@ from ._base import Base, IdsBase
 
 
 class Traits(IdsBase[models.Trait, int]):
-    pass
+    static = True
 
 
 class Trait(Base[models.Trait]):
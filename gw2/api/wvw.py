@@ -64,6 +64,7 @@ class MatchStat(Base[models.MatchStat]):
 
 
 class Objectives(IdsBase[models.Objective, str]):
+    static = True
     suffix = "wvw/objectives"
 
 
@@ -78,6 +79,7 @@ class Objective(Base[models.Objective]):
 
 
 class WvWRanks(IdsBase[models.WvWRank, int]):
+    static = True
     suffix = "wvw/ranks"
 
 
@@ -92,6 +94,7 @@ class WvWRank(Base[models.WvWRank]):
 
 
 class WvWUpgrades(IdsBase[models.WvWUpgrade, int]):
+    static = True
     suffix = "wvw/upgrades"
 
 
@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from gw2.meta import ResponseMeta
+
+# (url, sorted query parameters, hashed API key, language)
+CacheKey = tuple[str, tuple[tuple[str, str], ...], str | None, str | None]
+
+ResultVar = TypeVar("ResultVar")
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache for raw API responses.
+
+    Entries expire after the TTL they were stored with, the least recently used
+    entries are evicted once the stored responses exceed `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Args:
+            max_bytes: Upper bound for the size of all cached responses
+        """
+
+        self.max_bytes = max_bytes
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        # key -> (expires at, size, value, metadata)
+        self._entries: OrderedDict[
+            CacheKey,
+            tuple[float, int, bytes, ResponseMeta | None],
+        ] = OrderedDict()
+
+    @staticmethod
+    def key(
+        url: str,
+        params: dict[str, Any],
+        api_key: str | None = None,
+        language: str | None = None,
+    ) -> CacheKey:
+        """
+        Builds a cache key for a request
+
+        Args:
+            url: The requested URL
+            params: Query parameters of the request
+            api_key: The API key used for the request, only its hash is stored
+            language: Value of the Accept-Language header
+        """
+
+        return (
+            url,
+            tuple(sorted((k, str(v)) for k, v in params.items())),
+            hash_api_key(api_key),
+            language,
+        )
+
+    def get(self, key: CacheKey) -> bytes | None:
+        """
+        Returns the cached response or None if it is missing or expired
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def meta(self, key: CacheKey) -> ResponseMeta | None:
+        """
+        Returns the metadata stored with a response, without counting a hit
+        """
+
+        entry = self._entries.get(key)
+        return entry[3] if entry is not None else None
+
+    def set(
+        self,
+        key: CacheKey,
+        value: bytes,
+        ttl: float,
+        meta: ResponseMeta | None = None,
+    ) -> None:
+        """
+        Stores a response for `ttl` seconds, evicting the least recently used
+        entries if necessary. Responses larger than the whole cache are skipped,
+        replacing the entry of the key either way.
+        """
+
+        size = sys.getsizeof(value)
+        if ttl <= 0 or size > self.max_bytes:
+            self.invalidate(key)
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (time.monotonic() + ttl, size, value, meta)
+        self.size += size
+
+        while self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Removes a single entry"""
+
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the counters"""
+
+        self._entries.clear()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        _, size, _, _ = self._entries.pop(key)
+        self.size -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: entries={len(self)} size={self.size} "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+
+def hash_api_key(api_key: str | None) -> str | None:
+    """
+    Returns a hash identifying an API key, so the key itself isn't kept
+    """
+
+    if not api_key:
+        return None
+
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single call, whose result
+    (or exception) is shared by all callers.
+
+    Cancelling one caller does not cancel the shared call or the other callers.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[CacheKey, asyncio.Future[Any]] = {}
+
+        # Calls which joined an already running call
+        self.shared = 0
+
+    async def do(
+        self,
+        key: CacheKey,
+        fn: Callable[[], Awaitable[ResultVar]],
+    ) -> ResultVar:
+        """
+        Runs `fn`, unless a call with the same key is in flight already
+
+        Args:
+            key: Identifies identical calls, e.g. via :py:function:`ResponseCache.key`
+            fn: Creates the awaitable if no call is in flight
+        """
+
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._finish(key, call))
+        else:
+            self.shared += 1
+
+        return await asyncio.shield(call)
+
+    def _finish(self, key: CacheKey, call: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+        # Mark exception as retrieved in case all callers were cancelled
+        if not call.cancelled():
+            call.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
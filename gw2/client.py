@@ -0,0 +1,123 @@
+import asyncio
+import weakref
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Self
+
+import httpx
+
+try:
+    __version__ = version("gw2")
+except PackageNotFoundError:
+    __version__ = "unknown"
+
+# todo: make timeout a global configurable thing
+DEFAULT_TIMEOUT = 30
+
+# Default clients, one per event loop since pooled connections can't be shared
+# between loops
+_DEFAULT_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Client]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class Client:
+    """
+    Owns the pooled HTTP session that endpoint instances borrow for their requests.
+
+    Endpoints use a default client per event loop unless one is passed explicitly,
+    sub-clients (e.g. `Account().bank()`) use the client of their parent.
+
+    ```python
+    async with Client(max_connections=50) as client:
+        account = Account(client=client)
+        bank = await account.bank().get()
+    ```
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 30,
+        language: str = "en",
+        **session_options: Any,
+    ) -> None:
+        """
+        Args:
+            timeout: Default timeout for requests
+            max_connections: Upper bound for concurrently open connections
+            max_keepalive_connections: Upper bound for idle connections kept in
+                                       the pool
+            keepalive_expiry: Seconds after which idle connections are closed
+            language: Default value of the Accept-Language header
+            session_options: Passed to httpx.AsyncClient
+        """
+
+        self.session = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            headers={
+                "User-Agent": f"Invisi/python-gw2@{__version__}",
+                "Accept": "application/json",
+                "Accept-Language": language,
+            },
+            **session_options,
+        )
+
+    @property
+    def language(self) -> str:
+        return self.session.headers["Accept-Language"]
+
+    @property
+    def is_closed(self) -> bool:
+        return self.session.is_closed
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled connections
+        """
+
+        await self.session.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: Any = None,
+    ) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"<{self.__module__}.{self.__class__.__name__}: {self.language}>"
+
+
+def default_client() -> Client:
+    """
+    Returns the default client of the running event loop, creating it if necessary
+    """
+
+    loop = asyncio.get_running_loop()
+
+    client = _DEFAULT_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = _DEFAULT_CLIENTS[loop] = Client()
+
+    return client
+
+
+def set_default_client(client: Client) -> None:
+    """
+    Replaces the default client of the running event loop, e.g. to configure
+    connection limits for all endpoints at once
+    """
+
+    _DEFAULT_CLIENTS[asyncio.get_running_loop()] = client
@@ -0,0 +1,196 @@
+"""
+Shrinks validated models in place, for processes keeping many of them in memory.
+
+- Enum-like strings are interned, which matters for data built by
+  :py:mod:`gw2.trusted`, validation already shares them
+- Equal URLs share one object
+- Models sharing the same set of fields share one `__pydantic_fields_set__`
+- Equal leaf models, e.g. infusion slots or ingredients, share one instance
+
+Pydantic keeps fields in `__dict__`, so models can't use `__slots__`. Sharing
+instances is safe since all models are frozen. Shared URLs and models are only
+referenced weakly, so a long-lived compactor doesn't keep them alive.
+"""
+
+import functools
+import sys
+import threading
+import types
+import weakref
+from collections.abc import Hashable
+from typing import Annotated, Any, Literal, TypeVar, Union, get_args, get_origin
+
+import pydantic
+from pydantic import AnyUrl
+
+from gw2.models._base import Unknown
+
+CompactVar = TypeVar("CompactVar")
+
+_UNIONS = {Union, types.UnionType}
+
+
+class Compactor:
+    """
+    Keeps the shared objects while any model still references them
+
+    ```python
+    items = GLOBAL_COMPACTOR.compact(await Items().all_noniter())
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._urls: weakref.WeakValueDictionary[str, Any] = (
+            weakref.WeakValueDictionary()
+        )
+        # Few distinct sets exist, they are kept
+        self._fields_sets: dict[frozenset[str], set[str]] = {}
+        self._leaves: weakref.WeakValueDictionary[Hashable, pydantic.BaseModel] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def compact(self, value: CompactVar) -> CompactVar:
+        """
+        Compacts a model or a list of models in place
+
+        Returns:
+            The value, or a shared instance if it's an equal leaf model
+        """
+
+        with self._lock:
+            return self._compact(value)  # type: ignore[no-any-return]
+
+    def clear(self) -> None:
+        """
+        Forgets the shared objects, objects already compacted keep sharing them
+        """
+
+        with self._lock:
+            self._urls.clear()
+            self._fields_sets.clear()
+            self._leaves.clear()
+
+    def _compact(self, value: Any) -> Any:
+        if isinstance(value, pydantic.BaseModel):
+            return self._compact_model(value)
+
+        if isinstance(value, list):
+            value[:] = [self._compact(item) for item in value]
+
+        return value
+
+    def _compact_model(self, model: pydantic.BaseModel) -> pydantic.BaseModel:
+        values = model.__dict__
+        leaf = model.__pydantic_extra__ is None
+
+        for name, kind in _field_kinds(type(model)):
+            value = values.get(name)
+            if value is None:
+                continue
+
+            if kind == "enum":
+                if type(value) is str:
+                    values[name] = sys.intern(value)
+            elif kind == "enum list":
+                value[:] = [sys.intern(v) if type(v) is str else v for v in value]
+            elif kind == "url":
+                # Trusted construction keeps URLs as str, which can't be weakly
+                # referenced. Interned strings are freed once unused as well.
+                if type(value) is str:
+                    values[name] = sys.intern(value)
+                else:
+                    values[name] = self._urls.setdefault(str(value), value)
+            elif isinstance(value, pydantic.BaseModel):
+                values[name] = self._compact_model(value)
+                leaf = False
+            elif isinstance(value, list):
+                value[:] = [self._compact(item) for item in value]
+                leaf = leaf and not any(
+                    isinstance(item, pydantic.BaseModel | list) for item in value
+                )
+
+        fields_set = model.__pydantic_fields_set__
+        object.__setattr__(
+            model,
+            "__pydantic_fields_set__",
+            self._fields_sets.setdefault(frozenset(fields_set), fields_set),
+        )
+
+        if not leaf:
+            return model
+
+        try:
+            # Types are part of the key, 1 and 1.0 are equal but not the same
+            key = (type(model), *(_key(v) for v in values.values()))
+            return self._leaves.setdefault(key, model)
+        except TypeError:
+            # Unhashable values
+            return model
+
+    def __len__(self) -> int:
+        return len(self._urls) + len(self._leaves)
+
+    def __repr__(self) -> str:
+        return f"<{self.__module__}.{self.__class__.__name__}: {len(self)}>"
+
+
+GLOBAL_COMPACTOR = Compactor()
+
+
+def _key(value: Any) -> Hashable:
+    if type(value) is list:
+        return list, tuple(_key(item) for item in value)
+
+    return type(value), value
+
+
+@functools.cache
+def _field_kinds(model: type[pydantic.BaseModel]) -> list[tuple[str, str]]:
+    """
+    Returns fields of a model which may be compacted, with how to compact them
+    """
+
+    kinds = []
+    for name, field in model.model_fields.items():
+        tp = _strip(field.annotation)
+
+        if _is_enum(tp):
+            kinds.append((name, "enum"))
+        elif get_origin(tp) is list and _is_enum(_strip(get_args(tp)[0])):
+            kinds.append((name, "enum list"))
+        elif isinstance(tp, type) and issubclass(tp, AnyUrl):
+            kinds.append((name, "url"))
+        elif not isinstance(tp, type) or not issubclass(tp, int | float | str):
+            kinds.append((name, "other"))
+
+    return kinds
+
+
+def _strip(tp: Any) -> Any:
+    """
+    Removes Annotated and None of optional types
+    """
+
+    while get_origin(tp) is Annotated:
+        tp = get_args(tp)[0]
+
+    if get_origin(tp) in _UNIONS:
+        members = [_strip(arg) for arg in get_args(tp) if arg is not type(None)]
+        if len(members) == 1:
+            return members[0]
+
+    return tp
+
+
+def _is_enum(tp: Any) -> bool:
+    if get_origin(tp) is Literal:
+        return True
+
+    if get_origin(tp) in _UNIONS:
+        return all(
+            _is_enum(_strip(arg)) or arg in {Unknown, type(None)}
+            for arg in get_args(tp)
+        )
+
+    return False
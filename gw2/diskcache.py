@@ -0,0 +1,246 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from gw2.utils import chunks
+
+if TYPE_CHECKING:
+    from gw2.api._base import _Base
+
+LOG = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    endpoint TEXT NOT NULL,
+    id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    schema TEXT NOT NULL,
+    build INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (endpoint, id, language, schema)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Stays well below SQLite's limit of variables per statement
+_MAX_VARIABLES = 500
+
+
+class DiskCache:
+    """
+    Persistent SQLite cache for objects of static endpoints, e.g. items or skins,
+    whose data only changes with a new game build.
+
+    Objects are stored as raw JSON per endpoint, id, language and schema, together
+    with the build they were fetched on. Once the build changes, objects of older
+    builds are dropped, or kept as stale if `keep_stale` is set.
+
+    ```python
+    IdsBase.disk_cache = DiskCache("gw2.sqlite")
+    async for item in Items().many([19721, 19976]):
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        keep_stale: bool = False,
+        build_ttl: float = 5 * 60,
+        trusted: bool = False,
+    ) -> None:
+        """
+        Args:
+            path: The database file, ":memory:" creates a temporary database
+            keep_stale: Keep objects of older builds instead of dropping them
+            build_ttl: Seconds after which the current build is checked again
+            trusted: Construct stored objects without validating them again,
+                     see :py:mod:`gw2.trusted`
+        """
+
+        self.path = path
+        self.keep_stale = keep_stale
+        self.build_ttl = build_ttl
+        self.trusted = trusted
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+        self._checked_at: float | None = None
+        # Queries are run in worker threads, see asyncio.to_thread()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._db:
+            self._db.executescript(_SCHEMA)
+            row = self._db.execute(
+                "SELECT value FROM meta WHERE key = 'build'",
+            ).fetchone()
+
+        # The game build new objects are stored with
+        self.build_id: int | None = int(row[0]) if row is not None else None
+
+    async def check_build(self, endpoint: "_Base[Any] | None" = None) -> None:
+        """
+        Fetches the current game build unless it was checked within `build_ttl`
+        seconds, and drops outdated objects if the build changed
+
+        Args:
+            endpoint: Lends its client to the build request
+        """
+
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.build_ttl:
+            return
+
+        from gw2.api.build import Build
+
+        build = Build()
+        if endpoint is not None:
+            build = endpoint._inherit(build)
+
+        try:
+            model = await build.get()
+        except httpx.HTTPError:
+            LOG.warning("Failed to check the game build", exc_info=True)
+            return
+
+        self._checked_at = now
+        await asyncio.to_thread(self.set_build, model.id)
+
+    def set_build(self, build_id: int) -> None:
+        """
+        Sets the current game build, objects of older builds are dropped unless
+        `keep_stale` is set
+
+        Args:
+            build_id: The build reported by /v2/build
+        """
+
+        if build_id == self.build_id:
+            return
+
+        LOG.info("Game build changed from %s to %s", self.build_id, build_id)
+
+        with self._lock, self._db:
+            if not self.keep_stale:
+                self._db.execute("DELETE FROM objects WHERE build != ?", (build_id,))
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('build', ?)",
+                (str(build_id),),
+            )
+
+        self.build_id = build_id
+
+    def get_many(
+        self,
+        endpoint: str,
+        ids: Iterable[str],
+        language: str,
+        schema: str,
+        *,
+        stale: bool = False,
+    ) -> dict[str, str]:
+        """
+        Returns the stored objects for the given ids, missing ids are skipped
+
+        Args:
+            endpoint: The endpoint's URL
+            ids: The requested ids
+            language: Language of the objects
+            schema: Schema version of the objects
+            stale: Include objects of older builds
+        """
+
+        ids = list(ids)
+        found: dict[str, str] = {}
+        if self.build_id is None and not stale:
+            self.misses += len(ids)
+            return found
+
+        with self._lock:
+            for chunk in chunks(ids, _MAX_VARIABLES):
+                query = (
+                    "SELECT id, data FROM objects "
+                    "WHERE endpoint = ? AND language = ? AND schema = ? "
+                    f"AND id IN ({','.join('?' * len(chunk))})"
+                )
+                params: list[str | int] = [endpoint, language, schema, *chunk]
+
+                if not stale:
+                    query += " AND build = ?"
+                    params.append(self.build_id)  # type: ignore[arg-type]
+
+                found.update(self._db.execute(query, params).fetchall())
+
+        self.hits += len(found)
+        self.misses += len(ids) - len(found)
+        return found
+
+    def set_many(
+        self,
+        endpoint: str,
+        objects: dict[str, str],
+        language: str,
+        schema: str,
+    ) -> None:
+        """
+        Stores objects for the current build, nothing is stored if the build is
+        unknown
+
+        Args:
+            endpoint: The endpoint's URL
+            objects: Raw JSON per id
+            language: Language of the objects
+            schema: Schema version of the objects
+        """
+
+        if self.build_id is None:
+            return
+
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO objects "
+                "(endpoint, id, language, schema, build, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (endpoint, _id, language, schema, self.build_id, data)
+                    for _id, data in objects.items()
+                ),
+            )
+
+    def clear(self) -> None:
+        """Removes all objects"""
+
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM objects")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._db.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+        return count
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__module__}.{self.__class__.__name__}: {self.path} "
+            f"build={self.build_id} hits={self.hits} misses={self.misses}>"
+        )
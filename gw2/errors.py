@@ -25,6 +25,12 @@ class GuildNotFoundError(ApiError):
     """
 
 
+class NotFoundError(ApiError):
+    """
+    Raised if a batched request did not return the requested id
+    """
+
+
 class UnknownError(ApiError):
     """
     Usually raised if an internal server error occurred
@@ -2,23 +2,23 @@
 https://en.gw2treasures.com/dev/api
 """
 
-import asyncio
 import functools
 import logging
-from asyncio import Future, Task
 from collections.abc import AsyncIterator
 from typing import Literal, cast
 
 import httpx
-from asyncio_throttle import Throttler
 
 from gw2 import errors, models
 from gw2.const import HTTP_UNAUTHORIZED
-from gw2.utils import get_generic_alias
+from gw2.ratelimit import RateLimiter
+from gw2.utils import get_generic_alias, map_bounded
 
 # noinspection PyProtectedMember
 from ..api._base import (
+    DEFAULT_CONCURRENCY,
     DEFAULT_TIMEOUT,
+    ERROR_BODY_PREFIX,
     HTTP_SUCCESS,
     Base,
     EndpointId,
@@ -30,7 +30,7 @@ from ..api._base import (
 
 BASE_URL = "https://api.gw2treasures.com"
 LOG = logging.getLogger(__name__)
-GLOBAL_THROTTLE = Throttler(rate_limit=600, period=60)
+GLOBAL_THROTTLE = RateLimiter(burst=600, refill_rate=10)
 
 __all__ = [
     "Achievements",
@@ -45,23 +45,23 @@ class _TBase(_Base[EndpointModel]):
         super().__init__(timeout)
         self.auth(api_key)
 
-    @functools.cached_property
-    def _klass(self) -> EndpointModel | list[EndpointModel]:
+    @classmethod
+    def _model_type(cls) -> EndpointModel | list[EndpointModel]:
         """
         Returns the actual endpoint model instance for later use, can be a
         `str`, `int`, list[BaseModel], or anything similar
         """
         try:
-            generic_alias = get_generic_alias(self)
+            generic_alias = get_generic_alias(cls)
         except StopIteration as e:
             raise NotImplementedError from e
 
-        if issubclass(self.__class__, TIdsBase):
+        if issubclass(cls, TIdsBase):
             return cast(
                 EndpointModel,
                 generic_alias.__args__[0],
             )
-        elif issubclass(self.__class__, TBase):
+        elif issubclass(cls, TBase):
             return cast(EndpointModel, generic_alias.__args__[0])
         else:
             raise NotImplementedError
@@ -72,12 +72,13 @@ class _TBase(_Base[EndpointModel]):
         _id: IdsParameter = None,
         ids: None = None,
         _raw: bool = False,
-    ) -> str | EndpointModel | list[EndpointModel]:
+    ) -> bytes | EndpointModel | list[EndpointModel]:
         """
         Get model or raw value from endpoint
 
         Args:
-            _raw: Return the raw API response instead of a model instance
+            _raw: Return the raw API response (undecoded bytes) instead of a model
+                  instance
 
         Raises:
              httpx.NetworkError: Network-related issues, should not be hit
@@ -108,7 +109,12 @@ class _TBase(_Base[EndpointModel]):
 
         async with GLOBAL_THROTTLE:
             try:
-                response = await self._session.get(url, params=params)
+                response = await self._session.get(
+                    url,
+                    params=params,
+                    headers=self._headers,
+                    timeout=self.timeout,
+                )
             except httpx.NetworkError:
                 LOG.exception("Failed to fetch data")
                 raise
@@ -119,15 +125,15 @@ class _TBase(_Base[EndpointModel]):
         if response.status_code != HTTP_SUCCESS:
             response.raise_for_status()
             LOG.debug(
-                "Unhandled HTTP response: status=%s content=%s",
+                "Unhandled HTTP response: status=%s content=%r",
                 response.status_code,
-                response.text,
+                response.content[:ERROR_BODY_PREFIX],
             )
 
         if _raw:
-            return response.text
+            return response.content
 
-        return self._cast(response.text)
+        return self._cast(response.content)
 
     @functools.cached_property
     def url(self) -> str:
@@ -137,28 +143,36 @@ class _TBase(_Base[EndpointModel]):
 
 
 class TIdsBase(IdsBase[EndpointModel, EndpointId], _TBase[EndpointModel]):
+    # ?ids=all and its discovery via /v2.json only apply to the official API
+    all_ids = False
+
     async def many(
         self,
         ids: list[EndpointId] | Literal["all"],
         *,
         concurrent: bool = False,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = True,
     ) -> AsyncIterator[EndpointModel]:
         if ids == "all":
             raise NotImplementedError()
 
+        async def get_one(_id: EndpointId) -> EndpointModel:
+            return cast(EndpointModel, await self._get(_id=_id))
+
         if concurrent:
-            tasks: list[Task] = []
-            for _id in ids:
-                tasks.append(asyncio.ensure_future(self._get(_id=_id)))
+            results: AsyncIterator[EndpointModel] = map_bounded(
+                get_one,
+                ids,
+                max_concurrency,
+                ordered=ordered,
+            )
 
-            for _model in await cast(
-                Future[list[EndpointModel]],
-                asyncio.gather(*tasks),
-            ):
+            async for _model in results:
                 yield _model
         else:
             for _id in ids:
-                yield cast(EndpointModel, await self._get(_id=_id))
+                yield await get_one(_id)
 
 
 class TBase(Base[EndpointModel], _TBase[EndpointModel]):
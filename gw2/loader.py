@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+import httpx
+
+from gw2 import errors
+from gw2.const import HTTP_NOT_FOUND
+from gw2.utils import chunks
+
+LOG = logging.getLogger(__name__)
+
+KeyVar = TypeVar("KeyVar", bound=Hashable)
+ValueVar = TypeVar("ValueVar")
+
+
+class BatchLoader(Generic[KeyVar, ValueVar]):
+    """
+    Collects loads issued within a short window and fetches them in batches.
+
+    Keys are deduplicated, loads of a key which is already being fetched join that
+    fetch. Keys missing from a response (e.g. on HTTP 206) resolve to None.
+
+    ```python
+    loader = BatchLoader(lambda ids: Items()._get(ids=ids), lambda item: item.id)
+    first, second = await asyncio.gather(loader.load(1), loader.load(2))
+    ```
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[KeyVar]], Awaitable[list[ValueVar]]],
+        key: Callable[[ValueVar], KeyVar],
+        *,
+        window: float = 0.005,
+        max_batch: int = 200,
+    ) -> None:
+        """
+        Args:
+            fetch: Fetches the values for up to `max_batch` keys
+            key: Returns the key of a fetched value
+            window: Seconds to wait for further loads after the first one
+            max_batch: Upper bound for keys per fetch
+        """
+
+        self.fetch = fetch
+        self.key = key
+        self.window = window
+        self.max_batch = max_batch
+
+        # Keys collected in the current window
+        self._queue: list[KeyVar] = []
+        # Keys which are queued or being fetched
+        self._futures: dict[KeyVar, asyncio.Future[ValueVar | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        # Running fetches, the event loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Future[None]] = set()
+
+        # Statistics
+        self.loads = 0
+        self.batches = 0
+
+    async def load(self, key: KeyVar) -> ValueVar | None:
+        """
+        Returns the value for a key or None if the response did not contain it
+        """
+
+        self.loads += 1
+
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+
+            future = self._futures[key] = loop.create_future()
+            self._queue.append(key)
+
+            if len(self._queue) >= self.max_batch:
+                self.dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self.dispatch)
+
+        # Cancelling a single load must not cancel the loads sharing the future
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[KeyVar]) -> list[ValueVar | None]:
+        """
+        Returns the values for multiple keys, see :py:function:`load()`
+        """
+
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def dispatch(self) -> None:
+        """
+        Fetches all queued keys right away
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        queue, self._queue = self._queue, []
+        for batch in chunks(queue, self.max_batch):
+            self.batches += 1
+            task = asyncio.ensure_future(self._fetch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, batch: list[KeyVar]) -> None:
+        try:
+            values = await self.fetch(batch)
+        except httpx.HTTPStatusError as e:
+            # Returned if none of the requested ids exist
+            if e.response.status_code != HTTP_NOT_FOUND:
+                self._fail(batch, e)
+                return
+
+            values = []
+        except (Exception, errors.ApiError) as e:
+            self._fail(batch, e)
+            return
+        except asyncio.CancelledError:
+            for key in batch:
+                self._futures.pop(key).cancel()
+            raise
+
+        found = {self.key(value): value for value in values}
+        for key in batch:
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_result(found.get(key))
+
+    def _fail(self, batch: list[KeyVar], exc: BaseException) -> None:
+        LOG.debug("Failed to load %s", batch, exc_info=exc)
+
+        for key in batch:
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_exception(exc)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__module__}.{self.__class__.__name__}: loads={self.loads} "
+            f"batches={self.batches} pending={len(self._futures)}>"
+        )
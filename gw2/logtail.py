@@ -0,0 +1,163 @@
+import asyncio
+import json
+import logging
+import os
+import pathlib
+from collections.abc import AsyncIterator, Mapping
+
+import httpx
+from pydantic import ValidationError
+
+from gw2 import errors
+from gw2.api.guild import Guild
+from gw2.client import Client
+from gw2.models.guild import AnyLog
+from gw2.utils import map_bounded
+
+LOG = logging.getLogger(__name__)
+
+# Guilds polled at once by LogTail
+DEFAULT_CONCURRENCY = 10
+
+
+class CursorStore:
+    """
+    Remembers the last seen id per guild or other stream, in memory.
+    Subclass and override :py:function:`flush()` to persist cursors elsewhere.
+    """
+
+    def __init__(self, cursors: Mapping[str, int] | None = None) -> None:
+        self.cursors: dict[str, int] = dict(cursors or {})
+
+    def get(self, key: str) -> int | None:
+        return self.cursors.get(key)
+
+    def set(self, key: str, last_id: int) -> None:
+        self.cursors[key] = last_id
+
+    def flush(self) -> None:
+        """
+        Persists the cursors, called after every poll
+        """
+
+    def __repr__(self) -> str:
+        return f"<{self.__module__}.{self.__class__.__name__}: {len(self.cursors)}>"
+
+
+class JsonCursorStore(CursorStore):
+    """
+    Keeps cursors in a JSON file, so a restarted process continues where it stopped
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = pathlib.Path(path)
+
+        cursors = {}
+        if self.path.exists():
+            cursors = json.loads(self.path.read_text())
+
+        super().__init__(cursors)
+
+    def flush(self) -> None:
+        # Replace atomically to not lose all cursors if interrupted
+        tmp = self.path.with_suffix(f"{self.path.suffix}.tmp")
+        tmp.write_text(json.dumps(self.cursors))
+        tmp.replace(self.path)
+
+
+class LogTail:
+    """
+    Follows the logs of many guilds, only requesting entries newer than the last
+    seen one via ?since=.
+
+    ```python
+    tail = LogTail({"<guild id>": "<API key>"}, store=JsonCursorStore("logs.json"))
+    async for guild_id, entry in tail.follow():
+        ...
+    ```
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        guilds: Mapping[str, str],
+        *,
+        store: CursorStore | None = None,
+        interval: float = 60,
+        backfill: bool = True,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        client: Client | None = None,
+    ) -> None:
+        """
+        Args:
+            guilds: API key of a guild leader per guild id
+            store: Keeps the last seen log id per guild, in memory by default
+            interval: Seconds between polls of :py:function:`follow()`
+            backfill: Yield the whole log of guilds without a cursor, otherwise
+                      only entries after the first poll
+            max_concurrency: Upper bound for guilds polled at once
+            client: Client used for requests, see :py:class:`gw2.client.Client`
+        """
+
+        self.guilds = dict(guilds)
+        self.store = store if store is not None else CursorStore()
+        self.interval = interval
+        self.backfill = backfill
+        self.max_concurrency = max_concurrency
+        self.client = client
+
+    async def poll(self) -> AsyncIterator[tuple[str, AnyLog]]:
+        """
+        Fetches new entries of all guilds once and yields them oldest first per
+        guild. A guild's cursor advances once all of its entries were consumed.
+        """
+
+        try:
+            async for guild_id, entries in map_bounded(
+                self._fetch,
+                self.guilds,
+                self.max_concurrency,
+                ordered=False,
+            ):
+                if not entries:
+                    continue
+
+                if self.backfill or self.store.get(guild_id) is not None:
+                    for entry in entries:
+                        yield guild_id, entry
+
+                self.store.set(guild_id, entries[-1].id)
+        finally:
+            self.store.flush()
+
+    async def follow(self) -> AsyncIterator[tuple[str, AnyLog]]:
+        """
+        Polls all guilds every `interval` seconds, forever
+        """
+
+        while True:
+            async for item in self.poll():
+                yield item
+
+            await asyncio.sleep(self.interval)
+
+    async def _fetch(self, guild_id: str) -> tuple[str, list[AnyLog]]:
+        guild = Guild(guild_id)
+        if self.client is not None:
+            guild.using(self.client)
+        guild.auth(self.guilds[guild_id])
+
+        log = guild.log(since=self.store.get(guild_id))
+        # Polling must not be answered from the response cache
+        log.expiry = None
+
+        try:
+            entries = await log.get()
+        except (httpx.HTTPError, ValidationError, errors.ApiError) as e:
+            LOG.warning("Failed to fetch log of guild %s: %r", guild_id, e)
+            return guild_id, []
+
+        # The API returns the newest entries first
+        return guild_id, sorted(entries, key=lambda entry: entry.id)
+
+    def __repr__(self) -> str:
+        return f"<{self.__module__}.{self.__class__.__name__}: {len(self.guilds)}>"
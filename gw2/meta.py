@@ -0,0 +1,68 @@
+import dataclasses
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass(frozen=True)
+class ResponseMeta:
+    """
+    Status and headers of an API response, see `meta` of endpoints. Headers the
+    API did not send are None.
+    """
+
+    status: int
+    # Objects on the endpoint and in this response
+    result_total: int | None = None
+    result_count: int | None = None
+    # Pages of ?page_size=, only sent for paginated requests
+    page_total: int | None = None
+    page_size: int | None = None
+    cache_control: str | None = None
+    expires: str | None = None
+    last_modified: str | None = None
+    rate_limit_limit: int | None = None
+    rate_limit_remaining: int | None = None
+    # Seconds until the response was received, excluding waits for the rate limiter
+    latency: float = 0.0
+    retries: int = 0
+    # Whether the response was answered from the response cache
+    cached: bool = False
+
+    @classmethod
+    def from_response(
+        cls,
+        response: httpx.Response,
+        *,
+        latency: float = 0.0,
+        retries: int = 0,
+    ) -> "ResponseMeta":
+        headers = response.headers
+        return cls(
+            status=response.status_code,
+            result_total=_int(headers.get("X-Result-Total")),
+            result_count=_int(headers.get("X-Result-Count")),
+            page_total=_int(headers.get("X-Page-Total")),
+            page_size=_int(headers.get("X-Page-Size")),
+            cache_control=headers.get("Cache-Control"),
+            expires=headers.get("Expires"),
+            last_modified=headers.get("Last-Modified"),
+            rate_limit_limit=_int(headers.get("X-Rate-Limit-Limit")),
+            rate_limit_remaining=_int(headers.get("X-Rate-Limit-Remaining")),
+            latency=latency,
+            retries=retries,
+        )
+
+    def from_cache(self) -> "ResponseMeta":
+        """
+        Returns a copy marked as answered from the cache
+        """
+
+        return dataclasses.replace(self, latency=0.0, retries=0, cached=True)
+
+
+def _int(value: str | None) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
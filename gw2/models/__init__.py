@@ -1,80 +1,202 @@
-from ._base import Unknown
-from .account import Account
-from .achievements import Achievement, AchievementCategory, AchievementGroup
-from .backstory import BackstoryAnswer, BackstoryQuestion
-from .build import Build, BuildManifest
-from .characters import Character
-from .colors import Color
-from .continents import (
-    Adventure,
-    Continent,
-    ContinentMap,
-    Floor,
-    GodShrine,
-    MasteryPoint,
-    PointOfInterest,
-    Region,
-    Sector,
-    SkillChallenge,
-    Task,
-)
-from .currencies import Currency
-from .daily_crafting import DailyCrafting
-from .details import V2
-from .dungeons import Dungeon
-from .emblems import Emblem
-from .emotes import Emote
-from .files import File
-from .finishers import Finisher
-from .gliders import Glider
-from .guild import AuthenticatedGuild, Guild, GuildPermission, GuildUpgrade
-from .home import HomeCat, HomeNode
-from .item_stats import ItemStat
-from .items import Item
-from .legendary_armory import LegendaryArmory
-from .legends import Legend
-from .mail_carriers import MailCarrier
-from .map_chests import MapChest
-from .maps import Map
-from .masteries import Mastery
-from .materials import Material
-from .minis import Mini
-from .mounts import MountSkin, MountType
-from .novelties import Novelty
-from .outfits import Outfit
-from .pets import Pet
-from .professions import Profession
-from .pvp import (
-    Amulet,
-    Game,
-    Hero,
-    LeaderboardLadder,
-    PvPRank,
-    Season,
-    Standings,
-    Stats,
-)
-from .quaggans import Quaggan
-from .quests import Quest
-from .races import Race
-from .raids import Raid
-from .recipes import Recipe
-from .skills import Skill
-from .skins import Skin
-from .specializations import Specialization
-from .stories import Story, StorySeason
-from .titles import Title
-from .tokeninfo import SubTokenInfo, TokenInfo
-from .traits import Trait
-from .wizards_vault import WizardsVaultListing, WizardsVaultObjective
-from .world_bosses import WorldBoss
-from .worlds import World
-from .wvw import (
-    Match,
-    MatchOverview,
-    MatchScore,
-    MatchStat,
-    Objective,
-    WvWRank,
-    WvWUpgrade,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._base import Unknown
+    from .account import Account
+    from .achievements import Achievement, AchievementCategory, AchievementGroup
+    from .backstory import BackstoryAnswer, BackstoryQuestion
+    from .build import Build, BuildManifest
+    from .characters import Character
+    from .colors import Color
+    from .commerce import Listing, Listings, Price, PriceInfo, Transaction
+    from .continents import (
+        Adventure,
+        Continent,
+        ContinentMap,
+        Floor,
+        GodShrine,
+        MasteryPoint,
+        PointOfInterest,
+        Region,
+        Sector,
+        SkillChallenge,
+        Task,
+    )
+    from .currencies import Currency
+    from .daily_crafting import DailyCrafting
+    from .details import V2
+    from .dungeons import Dungeon
+    from .emblems import Emblem
+    from .emotes import Emote
+    from .files import File
+    from .finishers import Finisher
+    from .gliders import Glider
+    from .guild import AuthenticatedGuild, Guild, GuildPermission, GuildUpgrade
+    from .home import HomeCat, HomeNode
+    from .item_stats import ItemStat
+    from .items import Item
+    from .legendary_armory import LegendaryArmory
+    from .legends import Legend
+    from .mail_carriers import MailCarrier
+    from .map_chests import MapChest
+    from .maps import Map
+    from .masteries import Mastery
+    from .materials import Material
+    from .minis import Mini
+    from .mounts import MountSkin, MountType
+    from .novelties import Novelty
+    from .outfits import Outfit
+    from .pets import Pet
+    from .professions import Profession
+    from .pvp import (
+        Amulet,
+        Game,
+        Hero,
+        LeaderboardLadder,
+        PvPRank,
+        Season,
+        Standings,
+        Stats,
+    )
+    from .quaggans import Quaggan
+    from .quests import Quest
+    from .races import Race
+    from .raids import Raid
+    from .recipes import Recipe
+    from .skills import Skill
+    from .skins import Skin
+    from .specializations import Specialization
+    from .stories import Story, StorySeason
+    from .titles import Title
+    from .tokeninfo import SubTokenInfo, TokenInfo
+    from .traits import Trait
+    from .wizards_vault import WizardsVaultListing, WizardsVaultObjective
+    from .world_bosses import WorldBoss
+    from .worlds import World
+    from .wvw import (
+        Match,
+        MatchOverview,
+        MatchScore,
+        MatchStat,
+        Objective,
+        WvWRank,
+        WvWUpgrade,
+    )
+
+# Public name -> module defining it, imported on first access to keep `import` cheap
+_LAZY_ATTRIBUTES = {
+    "Unknown": "._base",
+    "Account": ".account",
+    "Achievement": ".achievements",
+    "AchievementCategory": ".achievements",
+    "AchievementGroup": ".achievements",
+    "BackstoryAnswer": ".backstory",
+    "BackstoryQuestion": ".backstory",
+    "Build": ".build",
+    "BuildManifest": ".build",
+    "Character": ".characters",
+    "Color": ".colors",
+    "Listing": ".commerce",
+    "Listings": ".commerce",
+    "Price": ".commerce",
+    "PriceInfo": ".commerce",
+    "Transaction": ".commerce",
+    "Adventure": ".continents",
+    "Continent": ".continents",
+    "ContinentMap": ".continents",
+    "Floor": ".continents",
+    "GodShrine": ".continents",
+    "MasteryPoint": ".continents",
+    "PointOfInterest": ".continents",
+    "Region": ".continents",
+    "Sector": ".continents",
+    "SkillChallenge": ".continents",
+    "Task": ".continents",
+    "Currency": ".currencies",
+    "DailyCrafting": ".daily_crafting",
+    "V2": ".details",
+    "Dungeon": ".dungeons",
+    "Emblem": ".emblems",
+    "Emote": ".emotes",
+    "File": ".files",
+    "Finisher": ".finishers",
+    "Glider": ".gliders",
+    "AuthenticatedGuild": ".guild",
+    "Guild": ".guild",
+    "GuildPermission": ".guild",
+    "GuildUpgrade": ".guild",
+    "HomeCat": ".home",
+    "HomeNode": ".home",
+    "ItemStat": ".item_stats",
+    "Item": ".items",
+    "LegendaryArmory": ".legendary_armory",
+    "Legend": ".legends",
+    "MailCarrier": ".mail_carriers",
+    "MapChest": ".map_chests",
+    "Map": ".maps",
+    "Mastery": ".masteries",
+    "Material": ".materials",
+    "Mini": ".minis",
+    "MountSkin": ".mounts",
+    "MountType": ".mounts",
+    "Novelty": ".novelties",
+    "Outfit": ".outfits",
+    "Pet": ".pets",
+    "Profession": ".professions",
+    "Amulet": ".pvp",
+    "Game": ".pvp",
+    "Hero": ".pvp",
+    "LeaderboardLadder": ".pvp",
+    "PvPRank": ".pvp",
+    "Season": ".pvp",
+    "Standings": ".pvp",
+    "Stats": ".pvp",
+    "Quaggan": ".quaggans",
+    "Quest": ".quests",
+    "Race": ".races",
+    "Raid": ".raids",
+    "Recipe": ".recipes",
+    "Skill": ".skills",
+    "Skin": ".skins",
+    "Specialization": ".specializations",
+    "Story": ".stories",
+    "StorySeason": ".stories",
+    "Title": ".titles",
+    "SubTokenInfo": ".tokeninfo",
+    "TokenInfo": ".tokeninfo",
+    "Trait": ".traits",
+    "WizardsVaultListing": ".wizards_vault",
+    "WizardsVaultObjective": ".wizards_vault",
+    "WorldBoss": ".world_bosses",
+    "World": ".worlds",
+    "Match": ".wvw",
+    "MatchOverview": ".wvw",
+    "MatchScore": ".wvw",
+    "MatchStat": ".wvw",
+    "Objective": ".wvw",
+    "WvWRank": ".wvw",
+    "WvWUpgrade": ".wvw",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        # Submodules, e.g. gw2.models.items
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -5,7 +5,8 @@ from pydantic import ConfigDict
 
 
 class BaseModel(PydanticBaseModel):
-    model_config = ConfigDict(frozen=True, extra="forbid")
+    # Validators are built on first use, see gw2.prewarm() to build them up front
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=True)
 
 
 # todo: replace | None = None with empty attribute,
@@ -0,0 +1,49 @@
+import datetime
+
+from ._base import BaseModel
+
+
+class PriceInfo(BaseModel):
+    quantity: int
+    unit_price: int
+
+
+class Price(BaseModel):
+    """
+    https://wiki.guildwars2.com/wiki/API:2/commerce/prices
+    """
+
+    id: int
+    whitelisted: bool
+    buys: PriceInfo
+    sells: PriceInfo
+
+
+class Listing(BaseModel):
+    listings: int
+    unit_price: int
+    quantity: int
+
+
+class Listings(BaseModel):
+    """
+    https://wiki.guildwars2.com/wiki/API:2/commerce/listings
+    """
+
+    id: int
+    buys: list[Listing]
+    sells: list[Listing]
+
+
+class Transaction(BaseModel):
+    """
+    https://wiki.guildwars2.com/wiki/API:2/commerce/transactions
+    """
+
+    id: int
+    item_id: int
+    price: int
+    quantity: int
+    created: datetime.datetime
+    # Only set for completed transactions
+    purchased: datetime.datetime | None = None
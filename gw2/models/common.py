@@ -1,4 +1,4 @@
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import AnyHttpUrl, Field
 
@@ -166,88 +166,238 @@ class PrefixedBuff(BaseModel):
     description: str | None = None
 
 
-class Fact(BaseModel):
-    # todo: tagged union, somehow...
-    text: str | None = None
-    icon: AnyHttpUrl | None = None
-    type: (
-        Literal[
-            "AttributeAdjust",
-            "Buff",
-            "BuffConversion",
-            "ComboField",
-            "ComboFinisher",
-            "Damage",
-            "Distance",
-            "NoData",
-            "Number",
-            "Percent",
-            "PrefixedBuff",
-            "Radius",
-            "Range",
-            "Recharge",
-            "StunBreak",
-            "Time",
-            "Unblockable",
-            "Duration",
-            "HealingAdjust",
-        ]
-        | None
-    ) = None
-    # AttributeAdjust/Number/Range/Recharge/Unblockable
-    value: int | float | None = None
-    # AttributeAdjust/BuffConversion
-    target: str | None = None
-    # Buff/PrefixedBuff
-    status: str | None = None
-    description: str | None = None
-    apply_count: int | None = None
-    # Buff/PrefixedBuff/Time
-    duration: int | None = None
-    # BuffConversion/Percent
-    percent: int | float | None = None
-    # BuffConversion
-    source: str | None = None
-    # ComboField
-    field_type: (
-        Literal[
-            "Air",
-            "Dark",
-            "Fire",
-            "Ice",
-            "Light",
-            "Lightning",
-            "Poison",
-            "Smoke",
-            "Ethereal",
-            "Water",
-        ]
-        | None
-    ) = None
-    # ComboFinisher
-    finisher_type: (
-        Literal[
-            "Blast",
-            "Leap",
-            "Projectile",
-            "Whirl",
-        ]
-        | None
-    ) = None
-    # Damage
-    hit_count: int | None = None
-    # Distance/Radius
-    distance: int | None = None
-    # PrefixedBuff
-    prefix: PrefixedBuff | None = None
-    # ???
-    dmg_multiplier: float | None = None
-    chance: int | None = None
-
-
-class TraitedFact(Fact):
-    requires_trait: int
-    overrides: int | None = None
+FactType = Literal[
+    "AttributeAdjust",
+    "Buff",
+    "BuffConversion",
+    "ComboField",
+    "ComboFinisher",
+    "Damage",
+    "Distance",
+    "NoData",
+    "Number",
+    "Percent",
+    "PrefixedBuff",
+    "Radius",
+    "Range",
+    "Recharge",
+    "StunBreak",
+    "Time",
+    "Unblockable",
+    "Duration",
+    "HealingAdjust",
+]
+
+ComboFieldType = Literal[
+    "Air",
+    "Dark",
+    "Fire",
+    "Ice",
+    "Light",
+    "Lightning",
+    "Poison",
+    "Smoke",
+    "Ethereal",
+    "Water",
+]
+
+ComboFinisherType = Literal[
+    "Blast",
+    "Leap",
+    "Projectile",
+    "Whirl",
+]
+
+
+class _FactNamespace(type):
+    """
+    Keeps the namespaces usable like the single model they replaced: any fact is
+    an instance of them, and calling them builds the generic model
+    """
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        return isinstance(instance, cls._Base)  # type: ignore[attr-defined]
+
+    def __call__(cls, **data: Any) -> Any:
+        return cls.Generic(**data)  # type: ignore[attr-defined]
+
+
+class Fact(metaclass=_FactNamespace):
+    """
+    https://wiki.guildwars2.com/wiki/API:2/skills#Facts
+
+    One model per fact type, see AnyFact. `Fact(...)` builds a Fact.Generic.
+    """
+
+    class _Base(BaseModel):
+        text: str | None = None
+        icon: AnyHttpUrl | None = None
+
+    class AttributeAdjust(_Base):
+        type: Literal["AttributeAdjust"]
+        value: int | float | None = None
+        target: str | None = None
+
+    class Buff(_Base):
+        type: Literal["Buff"]
+        status: str | None = None
+        description: str | None = None
+        apply_count: int | None = None
+        duration: int | None = None
+
+    class BuffConversion(_Base):
+        type: Literal["BuffConversion"]
+        source: str | None = None
+        target: str | None = None
+        percent: int | float | None = None
+
+    class ComboField(_Base):
+        type: Literal["ComboField"]
+        field_type: ComboFieldType | None = None
+
+    class ComboFinisher(_Base):
+        type: Literal["ComboFinisher"]
+        finisher_type: ComboFinisherType | None = None
+        percent: int | float | None = None
+
+    class Damage(_Base):
+        type: Literal["Damage"]
+        hit_count: int | None = None
+        dmg_multiplier: float | None = None
+
+    class Distance(_Base):
+        type: Literal["Distance", "Radius"]
+        distance: int | None = None
+
+    class Duration(_Base):
+        type: Literal["Duration", "Time"]
+        duration: int | None = None
+
+    class NoData(_Base):
+        type: Literal["NoData"]
+
+    class Number(_Base):
+        type: Literal["Number", "Range", "Recharge", "StunBreak", "Unblockable"]
+        value: int | float | None = None
+
+    class Percent(_Base):
+        type: Literal["Percent"]
+        percent: int | float | None = None
+
+    class PrefixedBuff(_Base):
+        type: Literal["PrefixedBuff"]
+        status: str | None = None
+        description: str | None = None
+        apply_count: int | None = None
+        duration: int | None = None
+        prefix: PrefixedBuff | None = None
+
+    class Generic(_Base):
+        """
+        Fallback for facts without or with an unknown type, or with unexpected fields
+        """
+
+        type: Annotated[FactType, EnumValidator] | Unknown | None = None
+        value: int | float | None = None
+        target: str | None = None
+        status: str | None = None
+        description: str | None = None
+        apply_count: int | None = None
+        duration: int | None = None
+        percent: int | float | None = None
+        source: str | None = None
+        field_type: ComboFieldType | None = None
+        finisher_type: ComboFinisherType | None = None
+        hit_count: int | None = None
+        distance: int | None = None
+        prefix: PrefixedBuff | None = None
+        # ???
+        dmg_multiplier: float | None = None
+        chance: int | None = None
+
+
+class TraitedFact(metaclass=_FactNamespace):
+    """
+    Facts which only apply if a trait is selected, see AnyTraitedFact.
+    `TraitedFact(...)` builds a TraitedFact.Generic.
+    """
+
+    class _Base(BaseModel):
+        requires_trait: int
+        overrides: int | None = None
+
+    class AttributeAdjust(Fact.AttributeAdjust, _Base): ...
+
+    class Buff(Fact.Buff, _Base): ...
+
+    class BuffConversion(Fact.BuffConversion, _Base): ...
+
+    class ComboField(Fact.ComboField, _Base): ...
+
+    class ComboFinisher(Fact.ComboFinisher, _Base): ...
+
+    class Damage(Fact.Damage, _Base): ...
+
+    class Distance(Fact.Distance, _Base): ...
+
+    class Duration(Fact.Duration, _Base): ...
+
+    class NoData(Fact.NoData, _Base): ...
+
+    class Number(Fact.Number, _Base): ...
+
+    class Percent(Fact.Percent, _Base): ...
+
+    class PrefixedBuff(Fact.PrefixedBuff, _Base): ...
+
+    class Generic(Fact.Generic, _Base): ...
+
+
+# Facts are validated against the model of their type, facts without a known type
+# or with unexpected fields fall back to the generic model
+AnyFact = Annotated[
+    Annotated[
+        (
+            Fact.AttributeAdjust
+            | Fact.Buff
+            | Fact.BuffConversion
+            | Fact.ComboField
+            | Fact.ComboFinisher
+            | Fact.Damage
+            | Fact.Distance
+            | Fact.Duration
+            | Fact.NoData
+            | Fact.Number
+            | Fact.Percent
+            | Fact.PrefixedBuff
+        ),
+        Field(discriminator="type"),
+    ]
+    | Fact.Generic,
+    Field(union_mode="left_to_right"),
+]
+
+AnyTraitedFact = Annotated[
+    Annotated[
+        (
+            TraitedFact.AttributeAdjust
+            | TraitedFact.Buff
+            | TraitedFact.BuffConversion
+            | TraitedFact.ComboField
+            | TraitedFact.ComboFinisher
+            | TraitedFact.Damage
+            | TraitedFact.Distance
+            | TraitedFact.Duration
+            | TraitedFact.NoData
+            | TraitedFact.Number
+            | TraitedFact.Percent
+            | TraitedFact.PrefixedBuff
+        ),
+        Field(discriminator="type"),
+    ]
+    | TraitedFact.Generic,
+    Field(union_mode="left_to_right"),
+]
 
 
 Binding = Literal["Account", "Character"]
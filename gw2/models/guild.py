@@ -1,7 +1,7 @@
 import datetime
 from typing import Annotated, Literal
 
-from pydantic import AnyHttpUrl
+from pydantic import AnyHttpUrl, ConfigDict, Field
 
 from ..utils import EnumValidator
 from . import common, pvp
@@ -169,21 +169,27 @@ class Log:
         )
 
     class Invite(_Base):
+        type: Literal["invited"]
         invited_by: str
 
     class InviteDeclined(_Base):
+        type: Literal["invite_declined"]
         declined_by: str
 
     class Join(_Base):
+        type: Literal["joined"]
         user: str
 
     class Kick(_Base):
+        type: Literal["kick"]
         kicked_by: str
 
     class Motd(_Base):
+        type: Literal["motd"]
         motd: str
 
     class RankChange(_Base):
+        type: Literal["rank_change"]
         # may be missing if guild was created by user
         # old_rank seems to be "none" in such a case
         changed_by: str | None = None
@@ -191,16 +197,19 @@ class Log:
         new_rank: str
 
     class Stash(_Base):
+        type: Literal["stash"]
         operation: Literal["deposit", "withdraw", "move"]
         item_id: int
         count: int
         coins: int
 
     class Treasury(_Base):
+        type: Literal["treasury"]
         item_id: int
         count: int
 
     class Upgrade(_Base):
+        type: Literal["upgrade"]
         action: Literal["queued", "cancelled", "complete", "completed", "sped_up"]
         count: int | None = None
         item_id: int | None = None
@@ -208,10 +217,41 @@ class Log:
         upgrade_id: int
 
     class Influence(_Base):
+        type: Literal["influence"]
         activity: Literal["gifted", "daily_login"]
         participants: list[str] | None = None  # list of account names
         total_participants: int | None = None
 
+    class Generic(_Base):
+        """
+        Fallback for entries with an unknown type or unexpected fields
+        """
+
+        model_config = ConfigDict(extra="allow")
+
+
+# Entries are validated against the model of their type, anything else falls back to
+# the generic model instead of failing the whole log
+AnyLog = Annotated[
+    Annotated[
+        (
+            Log.Invite
+            | Log.InviteDeclined
+            | Log.Kick
+            | Log.Join
+            | Log.Motd
+            | Log.RankChange
+            | Log.Stash
+            | Log.Treasury
+            | Log.Upgrade
+            | Log.Influence
+        ),
+        Field(discriminator="type"),
+    ]
+    | Log.Generic,
+    Field(union_mode="left_to_right"),
+]
+
 
 class Member(BaseModel):
     """
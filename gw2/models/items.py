@@ -1,6 +1,14 @@
-from typing import Annotated, Literal
-
-from pydantic import AnyHttpUrl, BeforeValidator
+from collections.abc import Callable
+from typing import Annotated, Any, ClassVar, Literal
+
+from pydantic import (
+    AnyHttpUrl,
+    BeforeValidator,
+    ValidationError,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+)
 
 from ..utils import EnumValidator
 from ._base import BaseModel, Unknown
@@ -260,6 +268,23 @@ class Details:
         type: GatheringType
 
 
+# Details model per item type, spares validating against every member of the union
+DETAILS_BY_TYPE: dict[str, type[BaseModel]] = {
+    "Armor": Details.Armor,
+    "Back": Details.BackItem,
+    "Bag": Details.Bag,
+    "Consumable": Details.Consumable,
+    "Container": Details.Container,
+    "Gathering": Details.Gathering,
+    "Gizmo": Details.Gizmo,
+    "MiniPet": Details.Miniature,
+    "Tool": Details.SalvageKit,
+    "Trinket": Details.Trinket,
+    "UpgradeComponent": Details.UpgradeComponent,
+    "Weapon": Details.Weapon,
+}
+
+
 class Item(BaseModel):
     """
     https://wiki.guildwars2.com/wiki/API:2/items
@@ -295,3 +320,29 @@ class Item(BaseModel):
         | Details.Weapon
         | None
     ) = None
+
+    # Picks the details model when constructing trusted data, see gw2.trusted
+    _construct_selectors: ClassVar[dict[str, Callable[[dict], Any]]] = {
+        "details": lambda data: DETAILS_BY_TYPE.get(data.get("type")),  # type: ignore[arg-type]
+    }
+
+    @field_validator("details", mode="wrap")
+    def validate_details(
+        cls,  # noqa: N805
+        val: Any,
+        handler: ValidatorFunctionWrapHandler,
+        info: ValidationInfo,
+    ) -> Any:
+        """
+        Validates details against the model of the item's type, unknown types and
+        mismatching details fall back to the whole union
+        """
+
+        details = DETAILS_BY_TYPE.get(info.data.get("type"))  # type: ignore[arg-type]
+        if details is None or val is None:
+            return handler(val)
+
+        try:
+            return details.model_validate(val)
+        except ValidationError:
+            return handler(val)
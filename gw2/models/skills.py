@@ -4,11 +4,11 @@ from pydantic import AnyHttpUrl, field_validator
 
 from ._base import BaseModel
 from .common import (
+    AnyFact,
+    AnyTraitedFact,
     Attunement,
-    Fact,
     Profession,
     SkillSlot,
-    TraitedFact,
     Weapon,
     coerce_weapon,
 )
@@ -34,7 +34,7 @@ class Skill(BaseModel):
     description: str
     dual_wield: str | None = None
     dual_attunement: Attunement | None = None
-    facts: list[Fact] | None = None
+    facts: list[AnyFact] | None = None
     flags: list[str] | None = None  # todo: types
     flip_skill: int | None = None
     icon: AnyHttpUrl | None = None
@@ -47,7 +47,7 @@ class Skill(BaseModel):
     specialization: int | None = None
     subskills: list[SubSkill] | None = None
     toolbelt_skill: int | None = None
-    traited_facts: list[TraitedFact] | None = None
+    traited_facts: list[AnyTraitedFact] | None = None
     transform_skills: list[int] | None = None
     type: (
         Literal[
@@ -4,7 +4,7 @@ from pydantic import AnyHttpUrl
 
 from ..utils import EnumValidator
 from ._base import BaseModel, Unknown
-from .common import Fact, TraitedFact
+from .common import AnyFact, AnyTraitedFact
 
 
 class Skill(BaseModel):
@@ -12,8 +12,8 @@ class Skill(BaseModel):
     name: str
     description: str
     icon: AnyHttpUrl | None = None
-    facts: list[Fact] | None = None
-    traited_facts: list[TraitedFact] | None = None
+    facts: list[AnyFact] | None = None
+    traited_facts: list[AnyTraitedFact] | None = None
     flags: list[int]
     chat_link: str
     categories: (
@@ -65,7 +65,7 @@ class Trait(BaseModel):
     specialization: int
     tier: int
     slot: Literal["Minor", "Major"]
-    facts: list[Fact] | None = None
-    traited_facts: list[TraitedFact] | None = None
+    facts: list[AnyFact] | None = None
+    traited_facts: list[AnyTraitedFact] | None = None
     skills: list[Skill] | None = None
     order: int
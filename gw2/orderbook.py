@@ -0,0 +1,173 @@
+import bisect
+import itertools
+import operator
+from array import array
+from typing import Any, Literal
+
+Side = Literal["buys", "sells"]
+
+# Values of OrderBook.sides
+SIDES: dict[Side, int] = {"buys": 0, "sells": 1}
+
+
+class OrderBook:
+    """
+    Trading post listings of many items as columns of integer arrays, with one row
+    per price level. Levels of an item are stored consecutively, buy orders from the
+    highest price down, then sell offers from the lowest price up.
+
+    ```python
+    book = await Listings().order_book([19721, 19976])
+    book.cost_to_buy(19721, 250)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.item_ids: array[int] = array("q")
+        self.sides: array[int] = array("b")
+        self.unit_prices: array[int] = array("q")
+        self.quantities: array[int] = array("q")
+        self.listings: array[int] = array("q")
+
+        # Rows of buys and sells per item, buys are [start:middle], sells [middle:end]
+        self._rows: dict[int, tuple[int, int, int]] = {}
+
+    @classmethod
+    def from_data(cls, data: list[dict[str, Any]]) -> "OrderBook":
+        book = cls()
+        book.extend(data)
+        return book
+
+    def extend(self, data: list[dict[str, Any]]) -> None:
+        """
+        Adds items from decoded responses of /v2/commerce/listings
+
+        Raises:
+            ValueError: An item was added before
+        """
+
+        for obj in data:
+            item_id = obj["id"]
+            if item_id in self._rows:
+                raise ValueError(f"Listings of item {item_id} were already added")
+
+            start = len(self.item_ids)
+            self._append(item_id, "buys", obj["buys"])
+            middle = len(self.item_ids)
+            self._append(item_id, "sells", obj["sells"])
+
+            self._rows[item_id] = (start, middle, len(self.item_ids))
+
+    def _append(self, item_id: int, side: Side, levels: list[dict[str, int]]) -> None:
+        prices = [level["unit_price"] for level in levels]
+
+        # The API returns levels best price first, queries rely on that
+        reverse = side == "buys"
+        if prices != sorted(prices, reverse=reverse):
+            levels = sorted(levels, key=lambda level: level["unit_price"])
+            if reverse:
+                levels.reverse()
+
+            prices = [level["unit_price"] for level in levels]
+
+        self.item_ids.extend(itertools.repeat(item_id, len(levels)))
+        self.sides.extend(itertools.repeat(SIDES[side], len(levels)))
+        self.unit_prices.extend(prices)
+        self.quantities.extend([level["quantity"] for level in levels])
+        self.listings.extend([level["listings"] for level in levels])
+
+    def rows(self, item_id: int, side: Side) -> slice:
+        """
+        Returns the rows of an item's buy orders or sell offers, best price first
+        """
+
+        if item_id not in self._rows:
+            return slice(0, 0)
+
+        start, middle, end = self._rows[item_id]
+        return slice(start, middle) if side == "buys" else slice(middle, end)
+
+    def best_price(self, item_id: int, side: Side) -> int | None:
+        """
+        Returns the highest buy order or the lowest sell offer
+        """
+
+        rows = self.rows(item_id, side)
+        return self.unit_prices[rows.start] if rows.stop > rows.start else None
+
+    def cost_to_buy(self, item_id: int, quantity: int) -> int | None:
+        """
+        Returns the copper needed to instantly buy `quantity` units from the lowest
+        sell offers, None if fewer are offered
+        """
+
+        return self._fill(self.rows(item_id, "sells"), quantity)
+
+    def proceeds_of_selling(self, item_id: int, quantity: int) -> int | None:
+        """
+        Returns the copper earned by instantly selling `quantity` units to the
+        highest buy orders, before fees. None if fewer are ordered.
+        """
+
+        return self._fill(self.rows(item_id, "buys"), quantity)
+
+    def quantity_within(
+        self,
+        item_id: int,
+        unit_price: int,
+        side: Side = "sells",
+    ) -> int:
+        """
+        Returns the quantity offered at or below `unit_price`, or ordered at or
+        above it for buys
+        """
+
+        rows = self.rows(item_id, side)
+        if side == "sells":
+            end = bisect.bisect_right(
+                self.unit_prices,
+                unit_price,
+                rows.start,
+                rows.stop,
+            )
+        else:
+            # Buys are sorted descending
+            end = bisect.bisect_right(
+                self.unit_prices,
+                -unit_price,
+                rows.start,
+                rows.stop,
+                key=operator.neg,
+            )
+
+        return sum(self.quantities[rows.start : end])
+
+    def _fill(self, rows: slice, quantity: int) -> int | None:
+        """
+        Returns the price of `quantity` units from the levels in `rows`, best first
+        """
+
+        quantities = self.quantities[rows]
+        filled = list(itertools.accumulate(quantities))
+        if not filled or filled[-1] < quantity:
+            return None
+
+        # Levels taken completely, and the one taken partially
+        full = bisect.bisect_left(filled, quantity)
+        prices = self.unit_prices[rows]
+        cost: int = sum(map(operator.mul, prices[:full], quantities[:full]))
+        taken = filled[full - 1] if full else 0
+
+        return cost + (quantity - taken) * prices[full]
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"{len(self)} items, {len(self.item_ids)} levels>"
+        )
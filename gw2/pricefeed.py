@@ -0,0 +1,241 @@
+import asyncio
+import bisect
+import functools
+import itertools
+import logging
+import operator
+from array import array
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import Any, NamedTuple, cast
+
+import httpx
+import pydantic_core
+
+from gw2 import errors, models
+from gw2.api._base import DEFAULT_CONCURRENCY
+from gw2.api.commerce import Prices
+from gw2.client import Client
+from gw2.utils import chunks, map_bounded
+
+LOG = logging.getLogger(__name__)
+
+# Maximum of ids per request
+CHUNK_SIZE = 200
+
+# Columns of a PriceSnapshot compared between polls, quantities are optional
+COLUMNS = ("buys", "sells", "buy_quantities", "sell_quantities")
+
+
+class PriceSnapshot(NamedTuple):
+    """
+    Prices of items as integer arrays, in the order of the response. Snapshots of
+    a PriceFeed are sorted by id.
+    """
+
+    ids: "array[int]"
+    buys: "array[int]"
+    sells: "array[int]"
+    buy_quantities: "array[int]"
+    sell_quantities: "array[int]"
+
+    @classmethod
+    def from_data(cls, data: list[dict[str, Any]]) -> "PriceSnapshot":
+        return cls(
+            array("q", [obj["id"] for obj in data]),
+            array("q", [obj["buys"]["unit_price"] for obj in data]),
+            array("q", [obj["sells"]["unit_price"] for obj in data]),
+            array("q", [obj["buys"]["quantity"] for obj in data]),
+            array("q", [obj["sells"]["quantity"] for obj in data]),
+        )
+
+    @classmethod
+    def concat(cls, snapshots: Iterable["PriceSnapshot"]) -> "PriceSnapshot":
+        columns = tuple(array("q") for _ in cls._fields)
+        for snapshot in snapshots:
+            for column, values in zip(columns, snapshot, strict=True):
+                column.extend(values)
+
+        return cls(*columns)
+
+    def between(self, first: int, last: int) -> "PriceSnapshot":
+        """
+        Returns the rows of ids from `first` to `last`, the ids must be sorted
+        """
+
+        start = bisect.bisect_left(self.ids, first)
+        end = bisect.bisect_right(self.ids, last)
+        return PriceSnapshot(*(column[start:end] for column in self))
+
+    def changes(
+        self,
+        previous: "PriceSnapshot | None",
+        *,
+        quantities: bool = False,
+    ) -> Iterator[bool]:
+        """
+        Returns whether the price of each item differs from the previous snapshot.
+        Items missing from the previous snapshot count as changed.
+
+        Args:
+            previous: The snapshot of the last poll
+            quantities: Count changed quantities as well, not only unit prices
+        """
+
+        columns = COLUMNS if quantities else COLUMNS[:2]
+
+        if previous is None:
+            return itertools.repeat(True, len(self.ids))
+
+        if previous.ids != self.ids:
+            # Items were added or removed, align them by id
+            before = dict(
+                zip(previous.ids, previous._rows(columns), strict=True),
+            )
+            return (
+                before.get(_id) != row
+                for _id, row in zip(self.ids, self._rows(columns), strict=True)
+            )
+
+        # Compares whole columns without a loop in Python
+        masks = [
+            map(operator.ne, getattr(previous, column), getattr(self, column))
+            for column in columns
+        ]
+        return functools.reduce(lambda a, b: map(operator.or_, a, b), masks)
+
+    def _rows(self, columns: tuple[str, ...]) -> Iterator[tuple[int, ...]]:
+        return zip(*(getattr(self, column) for column in columns), strict=True)
+
+
+class PriceFeed:
+    """
+    Polls prices of the trading post and yields only items whose price changed.
+
+    Prices of the previous poll are kept as integer arrays sorted by id and compared
+    column by column per chunk of 200 items, models are only created for changed
+    items.
+
+    ```python
+    async for price in PriceFeed().follow():
+        ...
+    ```
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        ids: list[int] | None = None,
+        *,
+        interval: float = 60,
+        initial: bool = True,
+        quantities: bool = False,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        client: Client | None = None,
+    ) -> None:
+        """
+        Args:
+            ids: Items to watch, all tradable items are fetched every poll by default
+            interval: Seconds between polls of :py:function:`follow()`
+            initial: Yield all prices on the first poll, otherwise only changes
+                     after it
+            quantities: Yield items whose quantities changed, not only their prices
+            max_concurrency: Upper bound for concurrent requests
+            client: Client used for requests, see :py:class:`gw2.client.Client`
+        """
+
+        self.ids = ids
+        self.interval = interval
+        self.initial = initial
+        self.quantities = quantities
+        self.max_concurrency = max_concurrency
+        self.client = client
+
+        # Prices of the last poll, sorted by id
+        self.snapshot: PriceSnapshot | None = None
+
+    async def poll(self) -> AsyncIterator[models.Price]:
+        """
+        Fetches all prices once and yields those which changed since the last poll
+        """
+
+        ids = self.ids if self.ids is not None else await self._endpoint().ids()
+        previous = self.snapshot
+        emit = self.initial or previous is not None
+
+        batches = list(chunks(sorted(set(ids)), CHUNK_SIZE))
+        snapshots: dict[int, PriceSnapshot] = {}
+
+        try:
+            async for index, data in map_bounded(
+                self._fetch,
+                enumerate(batches),
+                self.max_concurrency,
+                ordered=False,
+            ):
+                if data is None:
+                    continue
+
+                data.sort(key=operator.itemgetter("id"))
+                snapshot = PriceSnapshot.from_data(data)
+
+                # Compares against the same items, even if ids were added before
+                batch = batches[index]
+                before = None
+                if previous is not None:
+                    before = previous.between(batch[0], batch[-1])
+
+                changes = snapshot.changes(before, quantities=self.quantities)
+                snapshots[index] = snapshot
+
+                changed = list(itertools.compress(data, changes))
+                if emit and changed:
+                    prices = self._endpoint()._cast(changed)
+                    for price in cast(list[models.Price], prices):
+                        yield price
+        finally:
+            # Failed or unconsumed chunks keep their previous prices
+            if previous is not None:
+                for index, batch in enumerate(batches):
+                    if index not in snapshots:
+                        snapshots[index] = previous.between(batch[0], batch[-1])
+
+            self.snapshot = PriceSnapshot.concat(
+                snapshots[index] for index in sorted(snapshots)
+            )
+
+    async def follow(self) -> AsyncIterator[models.Price]:
+        """
+        Polls prices every `interval` seconds, forever
+        """
+
+        while True:
+            async for price in self.poll():
+                yield price
+
+            await asyncio.sleep(self.interval)
+
+    def _endpoint(self) -> Prices:
+        prices = Prices()
+        if self.client is not None:
+            prices.using(self.client)
+
+        # Polling must not be answered from the response cache
+        prices.expiry = None
+        return prices
+
+    async def _fetch(
+        self,
+        chunk: tuple[int, list[int]],
+    ) -> tuple[int, list[dict[str, Any]] | None]:
+        index, ids = chunk
+
+        try:
+            raw = await self._endpoint()._get(ids=ids, _raw=True)
+        except (httpx.HTTPError, errors.ApiError) as e:
+            LOG.warning("Failed to fetch prices of %d items: %r", len(ids), e)
+            return index, None
+
+        return index, pydantic_core.from_json(raw)
+
+    def __repr__(self) -> str:
+        watched = len(self.ids) if self.ids is not None else "all"
+        return f"<{self.__module__}.{self.__class__.__name__}: {watched}>"
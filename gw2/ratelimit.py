@@ -0,0 +1,202 @@
+import asyncio
+import datetime
+import logging
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+LOG = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with a cap on in-flight requests.
+
+    The bucket starts full with `burst` tokens and is refilled with `refill_rate`
+    tokens per second, every request consumes one token. Requests wait in FIFO
+    order for a token and a free in-flight slot.
+
+    ```python
+    async with limiter:
+        response = await session.get(...)
+    ```
+    """
+
+    def __init__(
+        self,
+        burst: int = 300,
+        refill_rate: float = 5,
+        max_in_flight: int = 50,
+        max_requeues: int = 5,
+    ) -> None:
+        """
+        Args:
+            burst: Size of the bucket, i.e. requests which may be sent at once
+            refill_rate: Tokens added per second
+            max_in_flight: Upper bound for concurrently running requests
+            max_requeues: How often a request is sent again after being
+                          rate limited (HTTP 429) by the server
+        """
+
+        self.burst = burst
+        self.refill_rate = refill_rate
+        self.max_in_flight = max_in_flight
+        self.max_requeues = max_requeues
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+
+        self._waiting = 0
+        self._in_flight = 0
+
+        # asyncio primitives are bound to the loop they are first used in
+        self._primitives: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[asyncio.Lock, asyncio.Semaphore],
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def tokens(self) -> float:
+        """Currently available tokens"""
+
+        self._refill()
+        return self._tokens
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a token or an in-flight slot"""
+
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot"""
+
+        return self._in_flight
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._updated_at) * self.refill_rate,
+        )
+        self._updated_at = now
+
+    def _get_primitives(self) -> tuple[asyncio.Lock, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+
+        primitives = self._primitives.get(loop)
+        if primitives is None:
+            primitives = self._primitives[loop] = (
+                asyncio.Lock(),
+                asyncio.Semaphore(self.max_in_flight),
+            )
+
+        return primitives
+
+    async def acquire(self) -> None:
+        """
+        Waits for an in-flight slot and a token
+        """
+
+        lock, semaphore = self._get_primitives()
+
+        self._waiting += 1
+        try:
+            await semaphore.acquire()
+
+            try:
+                # Only the first request in line waits for the bucket, everyone
+                # else waits for the lock
+                async with lock:
+                    while True:
+                        self._refill()
+
+                        delay = self._paused_until - time.monotonic()
+                        if delay <= 0 and self._tokens >= 1:
+                            self._tokens -= 1
+                            break
+
+                        await asyncio.sleep(
+                            max(delay, (1 - self._tokens) / self.refill_rate),
+                        )
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """
+        Frees the in-flight slot of a request
+        """
+
+        _, semaphore = self._get_primitives()
+
+        self._in_flight -= 1
+        semaphore.release()
+
+    def backoff(self, delay: float) -> None:
+        """
+        Stops handing out tokens for `delay` seconds and empties the bucket, e.g.
+        after the server responded with HTTP 429
+
+        Args:
+            delay: Seconds to wait
+        """
+
+        LOG.warning("Rate limited, pausing requests for %.1fs", delay)
+
+        self._refill()
+        self._tokens = 0
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: Any = None,
+    ) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__module__}.{self.__class__.__name__}: "
+            f"tokens={self.tokens:.1f}/{self.burst} queue_depth={self.queue_depth} "
+            f"in_flight={self.in_flight}/{self.max_in_flight}>"
+        )
+
+
+def parse_retry_after(value: str | None, default: float) -> float:
+    """
+    Parses the Retry-After header, which is either in seconds or an HTTP date
+
+    Args:
+        value: The header's value
+        default: Returned if the header is missing or invalid
+    """
+
+    if value is None:
+        return default
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.UTC)
+
+    return max((retry_at - datetime.datetime.now(datetime.UTC)).total_seconds(), 0)
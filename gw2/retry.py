@@ -0,0 +1,147 @@
+import random
+
+import httpx
+
+from gw2 import errors
+
+# Bad Gateway, Service Unavailable, Gateway Timeout
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    # May be caused by server-side caching issues
+    errors.InvalidKeyError,
+)
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the requests, so retries can't amplify an
+    outage.
+
+    Every request deposits `ratio` tokens, every retry withdraws one. Tokens are
+    capped at `capacity`, which also allows a few retries after a quiet period.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10) -> None:
+        """
+        Args:
+            ratio: Retries allowed per request
+            capacity: Upper bound for saved up retries
+        """
+
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+
+    def deposit(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Returns whether a retry is allowed and consumes a token if so
+        """
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+    def __repr__(self) -> str:
+        return f"<{self.__module__}.{self.__class__.__name__}: tokens={self.tokens}>"
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with exponential backoff and full jitter.
+
+    Requests are retried for exceptions in `retry_on` and HTTP errors with a
+    status in `retry_statuses`. Override :py:function:`is_retryable()` for
+    anything more specific.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30,
+        retry_on: tuple[type[BaseException], ...] = RETRY_EXCEPTIONS,
+        retry_statuses: frozenset[int] = RETRY_STATUSES,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        """
+        Args:
+            max_retries: Retries per request, 0 disables retries
+            base_delay: Delay before the first retry, doubled for every further one
+            max_delay: Upper bound for delays
+            retry_on: Exceptions which are regarded as transient
+            retry_statuses: HTTP status codes which are regarded as transient
+            budget: Shared retry budget, a new one is created by default
+        """
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.retry_statuses = retry_statuses
+        self.budget = budget if budget is not None else RetryBudget()
+
+        # Statistics
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """
+        Classifies an exception as transient
+        """
+
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code in self.retry_statuses
+
+        return isinstance(exc, self.retry_on)
+
+    def should_retry(self, exc: BaseException, retries: int) -> bool:
+        """
+        Returns whether a request should be retried after failing with `exc`
+
+        Args:
+            exc: The exception raised by the request
+            retries: Retries already made for this request
+        """
+
+        if not self.is_retryable(exc):
+            return False
+
+        if retries >= self.max_retries or not self.budget.withdraw():
+            self.exhausted += 1
+            return False
+
+        self.retries += 1
+        return True
+
+    def delay(self, retries: int) -> float:
+        """
+        Returns a random delay in seconds before the next retry
+
+        Args:
+            retries: Retries already made for this request
+        """
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retries))
+
+    def record_request(self) -> None:
+        """
+        Records a request, which refills the retry budget
+        """
+
+        self.requests += 1
+        self.budget.deposit()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__module__}.{self.__class__.__name__}: requests={self.requests} "
+            f"retries={self.retries} exhausted={self.exhausted}>"
+        )
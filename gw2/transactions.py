@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterable, Mapping
+from typing import Literal
+
+import httpx
+from pydantic import ValidationError
+
+from gw2 import errors, models
+from gw2.api._base import MAX_PAGE_SIZE
+from gw2.api.commerce import Transactions
+from gw2.client import Client
+from gw2.logtail import CursorStore
+from gw2.utils import map_bounded
+
+LOG = logging.getLogger(__name__)
+
+# Accounts synced at once by TransactionSync
+DEFAULT_CONCURRENCY = 10
+
+# State and side of /v2/commerce/transactions, e.g. ("history", "buys")
+Stream = tuple[Literal["current", "history"], Literal["buys", "sells"]]
+
+DEFAULT_STREAMS: tuple[Stream, ...] = (("history", "buys"), ("history", "sells"))
+
+
+class TransactionSync:
+    """
+    Syncs the trading post history of many accounts incrementally. Pages are only
+    requested until the newest transaction of the last sync was reached.
+
+    ```python
+    sync = TransactionSync({"<account>": "<API key>"}, store=JsonCursorStore("tp.json"))
+    async for account, (state, side), transaction in sync.follow():
+        ...
+    ```
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        accounts: Mapping[str, str],
+        *,
+        store: CursorStore | None = None,
+        streams: Iterable[Stream] = DEFAULT_STREAMS,
+        interval: float = 300,
+        backfill: bool = True,
+        page_size: int = MAX_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        client: Client | None = None,
+    ) -> None:
+        """
+        Args:
+            accounts: API key per account name, the name is only used for cursors
+            store: Keeps the newest transaction id per account and stream, in
+                   memory by default
+            streams: Transactions to sync, completed buys and sells by default
+            interval: Seconds between syncs of :py:function:`follow()`
+            backfill: Yield the whole history of accounts without a cursor,
+                      otherwise only transactions after the first sync
+            page_size: Transactions per request
+            max_concurrency: Upper bound for streams synced at once
+            client: Client used for requests, see :py:class:`gw2.client.Client`
+        """
+
+        self.accounts = dict(accounts)
+        self.store = store if store is not None else CursorStore()
+        self.streams = tuple(streams)
+        self.interval = interval
+        self.backfill = backfill
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.client = client
+
+    @staticmethod
+    def key(account: str, stream: Stream) -> str:
+        """
+        Returns the cursor key of an account's stream
+        """
+
+        state, side = stream
+        return f"{account}/{state}/{side}"
+
+    async def poll(
+        self,
+    ) -> AsyncIterator[tuple[str, Stream, models.Transaction]]:
+        """
+        Fetches new transactions of all accounts once and yields them oldest first
+        per stream. A stream's cursor advances once all of its transactions were
+        consumed.
+        """
+
+        try:
+            async for account, stream, transactions in map_bounded(
+                self._fetch,
+                [
+                    (account, stream)
+                    for account in self.accounts
+                    for stream in self.streams
+                ],
+                self.max_concurrency,
+                ordered=False,
+            ):
+                if not transactions:
+                    continue
+
+                key = self.key(account, stream)
+                if self.backfill or self.store.get(key) is not None:
+                    for transaction in transactions:
+                        yield account, stream, transaction
+
+                self.store.set(key, transactions[-1].id)
+        finally:
+            self.store.flush()
+
+    async def follow(
+        self,
+    ) -> AsyncIterator[tuple[str, Stream, models.Transaction]]:
+        """
+        Syncs all accounts every `interval` seconds, forever
+        """
+
+        while True:
+            async for item in self.poll():
+                yield item
+
+            await asyncio.sleep(self.interval)
+
+    async def _fetch(
+        self,
+        job: tuple[str, Stream],
+    ) -> tuple[str, Stream, list[models.Transaction]]:
+        account, stream = job
+
+        endpoint = Transactions(*stream)
+        if self.client is not None:
+            endpoint.using(self.client)
+        endpoint.auth(self.accounts[account])
+        # Syncing must not be answered from the response cache
+        endpoint.expiry = None
+
+        cursor = self.store.get(self.key(account, stream))
+
+        transactions = []
+        try:
+            if cursor is None and not self.backfill:
+                # Only the newest transaction is needed as cursor
+                async for page in endpoint.pages(page_size=1):
+                    transactions = page
+                    break
+            else:
+                async for transaction in endpoint.since(cursor, self.page_size):
+                    transactions.append(transaction)
+        except (httpx.HTTPError, ValidationError, errors.ApiError) as e:
+            LOG.warning(
+                "Failed to sync transactions %s of %s: %r",
+                "/".join(stream),
+                account,
+                e,
+            )
+            return account, stream, []
+
+        # The API returns the newest transactions first
+        transactions.reverse()
+        return account, stream, transactions
+
+    def __repr__(self) -> str:
+        return f"<{self.__module__}.{self.__class__.__name__}: {len(self.accounts)}>"
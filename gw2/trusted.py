@@ -0,0 +1,547 @@
+"""
+Builds models from trusted data without validating it, e.g. objects which were
+validated before they were stored.
+
+Data is converted along a plan built once per type: nested models are constructed
+instead of validated, unions are resolved by their discriminator or by the fields and
+literals of their members, and unknown enum values are wrapped in
+:py:class:`gw2.models.Unknown`. Before-validators of fields still run. Leaf values
+are converted to their declared type, e.g. URLs are parsed, so constructed models
+are equal to validated ones.
+"""
+
+import datetime
+import functools
+import types
+from collections.abc import Callable
+from typing import Annotated, Any, Literal, Union, cast, get_args, get_origin
+
+import pydantic
+import pydantic_core
+from pydantic import BeforeValidator
+from pydantic.fields import FieldInfo
+
+from gw2.models._base import Unknown
+from gw2.utils import type_adapter
+
+# Converts data into an instance of a type, None if the data is used as is
+Plan = Callable[[Any], Any] | None
+Matcher = Callable[[Any], bool]
+
+_PLANS: dict[Any, Plan] = {}
+
+# Marks fields without a default
+_REQUIRED = object()
+
+
+def construct(tp: Any, data: Any) -> Any:
+    """
+    Builds an instance of `tp` from trusted, JSON-like data without validating it
+
+    ```python
+    items = construct(list[models.Item], json.loads(snapshot))
+    ```
+
+    Args:
+        tp: The type, e.g. a model or a list of models
+        data: Decoded JSON, which is not copied and may be mutated
+    """
+
+    plan = construct_plan(tp)
+    return data if plan is None else plan(data)
+
+
+def construct_plan(tp: Any) -> Plan:
+    """
+    Returns the plan for a type, plans are built once per type
+    """
+
+    try:
+        return _PLANS[tp]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable type, e.g. due to metadata in Annotated
+        return _build_plan(tp)
+
+    # Placeholder for self-referencing types
+    resolved: list[Plan] = []
+    _PLANS[tp] = lambda v: _apply(resolved[0], v)
+
+    plan = _PLANS[tp] = _build_plan(tp)
+    resolved.append(plan)
+    return plan
+
+
+def _apply(plan: Plan, value: Any) -> Any:
+    return value if plan is None else plan(value)
+
+
+def _build_plan(tp: Any) -> Plan:  # noqa: PLR0911, PLR0912
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if origin is Annotated:
+        return _annotated_plan(tp, args[0], args[1:])
+
+    if origin is Union or origin is types.UnionType:
+        return _union_plan(tp, args)
+
+    if origin is list:
+        return _list_plan(args[0]) if args else None
+
+    if origin is tuple:
+        return _tuple_plan(args)
+
+    if origin is dict:
+        value_plan = construct_plan(args[1]) if args else None
+        if value_plan is None:
+            return None
+
+        return lambda v: {key: value_plan(value) for key, value in v.items()}
+
+    if not isinstance(tp, type) or origin is not None:
+        # Literal, Any, ...
+        return None
+
+    if issubclass(tp, pydantic.BaseModel):
+        return _model_plan(tp)
+
+    if tp is float:
+        # JSON doesn't tell 1 from 1.0
+        return float
+
+    if tp is datetime.datetime:
+        return datetime.datetime.fromisoformat
+
+    if tp is datetime.date:
+        return datetime.date.fromisoformat
+
+    if issubclass(tp, pydantic.AnyUrl):
+        return _url_plan(tp)
+
+    if issubclass(tp, Unknown):
+        return tp
+
+    return None
+
+
+def _url_plan(tp: type[pydantic.AnyUrl]) -> Plan:
+    """
+    Returns a plan which only parses URLs, their constraints were checked before
+    """
+
+    validate = type_adapter(tp).validate_python
+
+    def construct_url(v: str) -> Any:
+        url = tp.__new__(tp)
+        url._url = pydantic_core.Url(v)
+        return url
+
+    # URL types wrap a core URL since pydantic 2.10, otherwise they are validated
+    sample = "https://render.guildwars2.com/file/sample.png"
+    try:
+        if construct_url(sample) == validate(sample):
+            return construct_url
+    except (AttributeError, TypeError):
+        pass
+
+    return validate
+
+
+def _list_plan(item_type: Any) -> Plan:
+    enum = _enum(item_type)
+    if enum is not None:
+        # Usually all values are known, which is checked without a loop in Python
+        values, unknown = enum
+        return lambda v: (
+            v if values.issuperset(v) else [i if i in values else unknown(i) for i in v]
+        )
+
+    item_plan = construct_plan(item_type)
+    if item_plan is None:
+        return None
+
+    return lambda v: [item_plan(item) for item in v]
+
+
+def _tuple_plan(args: tuple[Any, ...]) -> Plan:
+    # JSON has no tuples
+    if len(args) == 2 and args[1] is Ellipsis:  # noqa: PLR2004
+        item_plan = construct_plan(args[0])
+        if item_plan is None:
+            return tuple
+
+        return lambda v: tuple(item_plan(item) for item in v)
+
+    plans = [construct_plan(arg) for arg in args]
+    if all(plan is None for plan in plans):
+        return tuple
+
+    return lambda v: tuple(
+        _apply(plan, item) for plan, item in zip(plans, v, strict=False)
+    )
+
+
+def _annotated_plan(tp: Any, inner: Any, metadata: tuple[Any, ...]) -> Plan:
+    discriminator, _ = _union_options(metadata)
+
+    plan: Plan
+    if discriminator is not None:
+        plan = _discriminated_plan(get_args(inner), discriminator)
+    elif get_origin(inner) in {Union, types.UnionType}:
+        plan = _union_plan(tp, get_args(inner))
+    else:
+        plan = construct_plan(inner)
+
+    before = [
+        meta.func
+        for item in metadata
+        for meta in (item.metadata if isinstance(item, FieldInfo) else [item])
+        if isinstance(meta, BeforeValidator)
+    ]
+    if not before:
+        return plan
+
+    def apply_validators(v: Any) -> Any:
+        for fn in before:
+            v = fn(v)  # type: ignore[call-arg]
+
+        return _apply(plan, v)
+
+    return apply_validators
+
+
+def _union_options(metadata: tuple[Any, ...]) -> tuple[str | None, str | None]:
+    """
+    Returns discriminator and union mode of Annotated metadata
+    """
+
+    discriminator = None
+    mode = None
+    for item in metadata:
+        if not isinstance(item, FieldInfo):
+            continue
+
+        if isinstance(item.discriminator, str):
+            discriminator = item.discriminator
+
+        for meta in item.metadata:
+            mode = getattr(meta, "union_mode", mode)
+
+    return discriminator, mode
+
+
+def _discriminated_plan(members: tuple[Any, ...], discriminator: str) -> Plan:
+    plans = {}
+    for member in members:
+        for tag in get_args(member.model_fields[discriminator].annotation):
+            plans[tag] = construct_plan(member)
+
+    return lambda v: _apply(plans[v[discriminator]], v)
+
+
+def _union_plan(tp: Any, members: tuple[Any, ...]) -> Plan:
+    candidates = [(_matcher(member), construct_plan(member)) for member in members]
+    if all(plan is None for _, plan in candidates):
+        return None
+
+    enum = _enum(tp)
+    if enum is not None:
+        values, unknown = enum
+        return lambda v: v if v in values else unknown(v)
+
+    others = [member for member in members if member not in {None, type(None)}]
+    if len(others) == 1:
+        # Optional values
+        plan = cast(Callable[[Any], Any], construct_plan(others[0]))
+        return lambda v: None if v is None else plan(v)
+
+    _, mode = _union_options(get_args(tp)[1:] if get_origin(tp) is Annotated else ())
+    if mode != "left_to_right" and sum(map(_is_model, members)) > 1:
+        # Smart unions pick the best match, which is left to pydantic if ambiguous
+        def construct_smart(v: Any) -> Any:
+            matches = [plan for match, plan in candidates if match(v)]
+            if len(matches) != 1:
+                return type_adapter(tp).validate_python(v)
+
+            return _apply(matches[0], v)
+
+        return construct_smart
+
+    def construct_member(v: Any) -> Any:
+        for match, plan in candidates:
+            if match(v):
+                return v if plan is None else plan(v)
+
+        return type_adapter(tp).validate_python(v)
+
+    return construct_member
+
+
+def _enum(tp: Any) -> tuple[frozenset[Any], type[Unknown]] | None:
+    """
+    Returns the known values and the type of unknown values of enums, e.g.
+    `Annotated[Literal[...], EnumValidator] | Unknown`
+    """
+
+    while get_origin(tp) is Annotated:
+        tp = get_args(tp)[0]
+
+    if get_origin(tp) is not Union and get_origin(tp) is not types.UnionType:
+        return None
+
+    values: set[Any] = set()
+    unknown = None
+    for member in get_args(tp):
+        while get_origin(member) is Annotated:
+            member = get_args(member)[0]  # noqa: PLW2901
+
+        if get_origin(member) is Literal:
+            values.update(get_args(member))
+        elif member is type(None):
+            values.add(None)
+        elif isinstance(member, type) and issubclass(member, Unknown):
+            unknown = member
+        else:
+            return None
+
+    if unknown is None:
+        return None
+
+    return frozenset(values), unknown
+
+
+def _is_model(tp: Any) -> bool:
+    if get_origin(tp) is Annotated:
+        return _is_model(get_args(tp)[0])
+
+    return isinstance(tp, type) and issubclass(tp, pydantic.BaseModel)
+
+
+def _matcher(tp: Any) -> Matcher:  # noqa: PLR0911
+    """
+    Returns a cheap check whether data may be an instance of `tp`
+    """
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if tp is None or tp is type(None):
+        return lambda v: v is None
+
+    if origin is Annotated:
+        discriminator, _ = _union_options(args[1:])
+        if discriminator is None:
+            return _matcher(args[0])
+
+        # Tags must match and so must the fields of the tagged member
+        matchers = {
+            tag: _model_matcher(member)
+            for member in get_args(args[0])
+            for tag in get_args(member.model_fields[discriminator].annotation)
+        }
+        return lambda v: (
+            isinstance(v, dict)
+            and (match := matchers.get(v.get(discriminator))) is not None
+            and match(v)
+        )
+
+    if origin is Union or origin is types.UnionType:
+        members = [_matcher(arg) for arg in args]
+        return lambda v: any(match(v) for match in members)
+
+    if origin is Literal:
+        values = set(args)
+        return lambda v: isinstance(v, str | int | bool) and v in values
+
+    if origin in {list, tuple}:
+        return lambda v: isinstance(v, list | tuple)
+
+    if origin is dict:
+        return lambda v: isinstance(v, dict)
+
+    if not isinstance(tp, type):
+        return lambda v: True
+
+    if issubclass(tp, pydantic.BaseModel):
+        return _model_matcher(tp)
+
+    if tp is bool:
+        return lambda v: isinstance(v, bool)
+
+    if tp in {int, float}:
+        return lambda v: isinstance(v, int | float) and not isinstance(v, bool)
+
+    # str, URLs, dates, ...
+    return lambda v: isinstance(v, str)
+
+
+@functools.cache
+def _model_matcher(model: type[pydantic.BaseModel]) -> Matcher:
+    keys = {field.alias or name for name, field in model.model_fields.items()}
+    required = {
+        field.alias or name
+        for name, field in model.model_fields.items()
+        if field.is_required()
+    }
+    extra_allowed = model.model_config.get("extra") != "forbid"
+
+    # Literal fields tell members apart, e.g. the type of a fact
+    literals = {
+        field.alias or name: set(get_args(field.annotation))
+        for name, field in model.model_fields.items()
+        if get_origin(field.annotation) is Literal
+    }
+
+    def match(v: Any) -> bool:
+        if not isinstance(v, dict) or not required.issubset(v):
+            return False
+
+        if not extra_allowed and not keys.issuperset(v):
+            return False
+
+        return all(v[key] in values for key, values in literals.items() if key in v)
+
+    return match
+
+
+def _model_plan(model: type[pydantic.BaseModel]) -> Plan:
+    """
+    Returns a plan which converts the fields of the model and sets them like
+    `model_construct()` does, which is slower as it is not specialized per model
+    """
+
+    before_validators: dict[str, list[Callable[[Any], Any]]] = {}
+    for decorator in model.__pydantic_decorators__.field_validators.values():
+        if decorator.info.mode == "before":
+            for name in decorator.info.fields:
+                before_validators.setdefault(name, []).append(decorator.func)
+
+    # Picks the type of a field from the surrounding data, see e.g. Item
+    selectors: dict[str, Callable[[dict], Any]] = getattr(
+        model,
+        "_construct_selectors",
+        {},
+    )
+
+    fields = []
+    for name, field in model.model_fields.items():
+        tp: Any = field.annotation
+        if field.metadata or field.discriminator:
+            tp = Annotated[tp, field]
+
+        plan: Any = construct_plan(tp)
+        validators = before_validators.get(name)
+        selector = selectors.get(name)
+        if validators or selector:
+            plan = _field_plan(validators or [], plan, selector)
+
+        # Mutable defaults are copied
+        default: Any = field.default
+        factory = field.default_factory is not None or isinstance(
+            default,
+            list | dict | set,
+        )
+        if factory:
+            default = functools.partial(
+                field.get_default,
+                call_default_factory=True,
+                validated_data={},
+            )
+        elif field.is_required():
+            default = _REQUIRED
+
+        fields.append(
+            (
+                field.alias or name,
+                name,
+                plan,
+                bool(validators or selector),
+                default,
+                factory,
+            ),
+        )
+
+    names = {key: name for key, name, *_ in fields}
+    extra = model.model_config.get("extra")
+    # Forbidden extra keys never occur in trusted data
+    same_names = extra == "forbid" and all(key == name for key, name in names.items())
+    post_init = bool(model.__pydantic_post_init__)
+    setattr = object.__setattr__
+
+    def construct_model(data: dict[str, Any]) -> pydantic.BaseModel:
+        values = {}
+        for key, name, plan, with_data, default, factory in fields:
+            if key in data:
+                value = data[key]
+                if with_data:
+                    value = plan(value, data)
+                elif plan is not None:
+                    value = plan(value)
+
+                values[name] = value
+            elif factory:
+                values[name] = default()
+            elif default is not _REQUIRED:
+                values[name] = default
+
+        instance = model.__new__(model)
+        setattr(instance, "__dict__", values)
+        setattr(
+            instance,
+            "__pydantic_fields_set__",
+            set(data) if same_names else {names[k] for k in data if k in names},
+        )
+        setattr(
+            instance,
+            "__pydantic_extra__",
+            {k: v for k, v in data.items() if k not in names}
+            if extra == "allow"
+            else None,
+        )
+        setattr(instance, "__pydantic_private__", None)
+
+        if post_init:
+            instance.model_post_init(None)
+
+        return instance
+
+    return construct_model
+
+
+def _field_plan(
+    validators: list[Callable[[Any], Any]],
+    plan: Plan,
+    selector: Callable[[dict], Any] | None,
+) -> Callable[[Any, dict[str, Any]], Any]:
+    """
+    Runs before-validators and the selector of a field, which needs the whole data
+    """
+
+    def construct_field(value: Any, data: dict[str, Any]) -> Any:
+        for fn in validators:
+            value = fn(value)
+
+        if selector is not None:
+            return _select(selector, plan, data, value)
+
+        return _apply(plan, value)
+
+    return construct_field
+
+
+def _select(
+    selector: Callable[[dict], Any],
+    plan: Plan,
+    data: dict[str, Any],
+    value: Any,
+) -> Any:
+    selected = selector(data)
+
+    # Unknown types and mismatching values fall back to the whole union, like
+    # validation does
+    if selected is None or value is None or not _model_matcher(selected)(value):
+        return _apply(plan, value)
+
+    return construct(selected, value)
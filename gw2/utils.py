@@ -1,9 +1,19 @@
+import asyncio
+import threading
 import types
 import warnings
-from collections.abc import Callable, Iterator
-from typing import TYPE_CHECKING, Any, TypeGuard, TypeVar, cast
-
-from pydantic import ValidationError, WrapValidator
+from collections import Counter, deque
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+)
+from typing import TYPE_CHECKING, Any, TypeGuard, TypeVar, cast, overload
+
+from pydantic import TypeAdapter, ValidationError, ValidationInfo, WrapValidator
 
 if TYPE_CHECKING:
     # noinspection PyProtectedMember
@@ -11,6 +21,12 @@ if TYPE_CHECKING:
     from gw2.models import Unknown
 
 ChunkVar = TypeVar("ChunkVar")
+ArgVar = TypeVar("ArgVar")
+ResultVar = TypeVar("ResultVar")
+AdapterVar = TypeVar("AdapterVar")
+
+# Process-wide adapters, building one creates the whole core schema of a type
+_TYPE_ADAPTERS: dict[Any, TypeAdapter[Any]] = {}
 
 
 def chunks(lst: list[ChunkVar], n: int) -> Iterator[list[ChunkVar]]:
@@ -28,28 +44,205 @@ def chunks(lst: list[ChunkVar], n: int) -> Iterator[list[ChunkVar]]:
         yield lst[i : i + n]
 
 
-def get_generic_alias(klass: "_Base[EndpointModel]") -> types.GenericAlias:
+async def map_bounded(
+    fn: Callable[[ArgVar], Awaitable[ResultVar]],
+    args: Iterable[ArgVar],
+    limit: int,
+    *,
+    ordered: bool = True,
+) -> AsyncIterator[ResultVar]:
+    """
+    Runs `fn` for every argument with at most `limit` calls in flight and yields
+    results as soon as they are available.
+
+    Args:
+        fn: Coroutine function, called once per argument
+        args: Arguments, consumed lazily
+        limit: Upper bound for running calls
+        ordered: Yield results in the order of `args`. Finished calls wait in a
+                 buffer until all previous calls are done, the buffer counts
+                 towards `limit` to keep memory bounded.
+    Returns:
+        An async iterator for the results of `fn`
+    """
+
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    pending = iter(args)
+    running: deque[asyncio.Future[ResultVar]] = deque()
+
+    def fill() -> None:
+        while len(running) < limit:
+            try:
+                arg = next(pending)
+            except StopIteration:
+                return
+
+            running.append(asyncio.ensure_future(fn(arg)))
+
+    try:
+        fill()
+        while running:
+            if ordered:
+                task = running.popleft()
+                result = await task
+            else:
+                done, _ = await asyncio.wait(
+                    running,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                task = done.pop()
+                running.remove(task)
+                result = task.result()
+
+            fill()
+            yield result
+    finally:
+        # Stop the remaining calls if the consumer stopped early or a call failed
+        for task in running:
+            task.cancel()
+        # Wait until the cancelled calls are done, calls which finished or failed
+        # meanwhile are retrieved as well
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+@overload
+def type_adapter(tp: type[AdapterVar]) -> TypeAdapter[AdapterVar]: ...
+
+
+@overload
+def type_adapter(tp: Any) -> TypeAdapter[Any]: ...
+
+
+def type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """
+    Returns a cached TypeAdapter for the given type
+
+    Args:
+        tp: Any type pydantic can validate, e.g. `list[models.Item]`
+    """
+
+    try:
+        return _TYPE_ADAPTERS[tp]
+    except KeyError:
+        adapter = _TYPE_ADAPTERS[tp] = TypeAdapter(tp)
+        return adapter
+    except TypeError:
+        # Unhashable type, e.g. due to metadata in Annotated
+        return TypeAdapter(tp)
+
+
+def get_generic_alias(
+    klass: "_Base[EndpointModel] | type[_Base[EndpointModel]]",
+) -> types.GenericAlias:
     def type_guard(x: Any) -> TypeGuard[types.GenericAlias]:
         return hasattr(x, "__args__")
 
     # todo: retire and replace with types.get_original_bases on py3.12
-    orig_bases = klass.__orig_bases__  # type: ignore[attr-defined]
+    orig_bases = klass.__orig_bases__  # type: ignore[union-attr]
 
     return cast(types.GenericAlias, next(filter(type_guard, orig_bases)))
 
 
-def validate_enum(v: Any, handler: Callable[[Any], str]) -> "str | Unknown":
+class UnknownEnums:
+    """
+    Counts enum values missing from the models per model, field and value, e.g. the
+    item types of a new expansion. Every distinct value is only warned about once.
+
+    ```python
+    for entry in GLOBAL_UNKNOWN_ENUMS.export():
+        print(entry["model"], entry["field"], entry["value"], entry["count"])
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter[tuple[str | None, str | None, Any]] = Counter()
+        # Validation may run in worker threads, see asyncio.to_thread()
+        self._lock = threading.Lock()
+
+    def record(self, model: str | None, field: str | None, value: Any) -> bool:
+        """
+        Counts an unknown value
+
+        Returns:
+            Whether the value was seen for the first time
+        """
+
+        if not isinstance(value, Hashable):
+            value = repr(value)
+
+        key = (model, field, value)
+        with self._lock:
+            self.counts[key] += 1
+            return self.counts[key] == 1
+
+    def values(
+        self,
+        model: str | None = None,
+        field: str | None = None,
+    ) -> dict[Any, int]:
+        """
+        Returns the count per unknown value, optionally of a single model or field
+        """
+
+        result: Counter[Any] = Counter()
+        for (_model, _field, value), count in self.counts.items():
+            if model in {None, _model} and field in {None, _field}:
+                result[value] += count
+
+        return dict(result)
+
+    def export(self) -> list[dict[str, Any]]:
+        """
+        Returns all unknown values as JSON-serializable records, most frequent first
+        """
+
+        return [
+            {"model": model, "field": field, "value": value, "count": count}
+            for (model, field, value), count in self.counts.most_common()
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __repr__(self) -> str:
+        return f"<{self.__module__}.{self.__class__.__name__}: {len(self)}>"
+
+
+GLOBAL_UNKNOWN_ENUMS = UnknownEnums()
+
+
+def validate_enum(
+    v: Any,
+    handler: Callable[[Any], str],
+    info: ValidationInfo,
+) -> "str | Unknown":
     """
     Validate (Literal) enum value,
-    wrap in gw2.models.Unknown and issue warning if invalid
+    wrap in gw2.models.Unknown and count it in GLOBAL_UNKNOWN_ENUMS if invalid.
+    Only the first occurrence of a value issues a warning.
     """
 
     try:
         return handler(v)
-    except ValidationError as e:
+    except ValidationError:
         from gw2.models import Unknown
 
-        warnings.warn(f"failed to validate {v}: {e}", RuntimeWarning, stacklevel=2)
+        model = info.config.get("title") if info.config is not None else None
+        if GLOBAL_UNKNOWN_ENUMS.record(model, info.field_name, v):
+            warnings.warn(
+                f"failed to validate {v!r} of {model}.{info.field_name}, "
+                "further occurrences are counted in GLOBAL_UNKNOWN_ENUMS",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
         return Unknown(v)
 
 
@@ -0,0 +1,21 @@
+from collections.abc import Callable
+
+import pytest
+
+
+@pytest.fixture
+def mini() -> Callable[[int], dict]:
+    """
+    Returns a factory for objects of /v2/minis
+    """
+
+    def build(_id: int) -> dict:
+        return {
+            "id": _id,
+            "name": f"Mini {_id}",
+            "icon": "https://render.guildwars2.com/file/mini.png",
+            "order": _id,
+            "item_id": _id,
+        }
+
+    return build
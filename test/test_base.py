@@ -1,10 +1,24 @@
+import asyncio
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+
+import httpx
 import pytest
+import respx
 
 import gw2
-from gw2 import models
+from gw2 import errors, models
+from gw2.api import _base
+from gw2.api._base import IdsBase
+from gw2.cache import ResponseCache, SingleFlight
 from gw2.models import Unknown, common
 from gw2.models._base import BaseModel
 from gw2.models.account import Access
+from gw2.ratelimit import RateLimiter, parse_retry_after
+from gw2.retry import RetryBudget, RetryPolicy
+from gw2.utils import GLOBAL_UNKNOWN_ENUMS, map_bounded, type_adapter
 
 
 def test_klass() -> None:
@@ -30,3 +44,588 @@ def test_unknown() -> None:
 
     inst2 = Test(access="JanthirWilds")
     assert inst2.access == "JanthirWilds"
+
+
+def test_unknown_enums() -> None:
+    class Test(BaseModel):
+        access: list[Access]
+
+    GLOBAL_UNKNOWN_ENUMS.clear()
+    with pytest.warns(RuntimeWarning, match="failed to validate.*") as record:
+        Test(access=["Future", "Future", "Other", "GuildWars2"])  # type: ignore
+        Test(access=["Future"])  # type: ignore
+
+    # Once per distinct value
+    assert len(record) == len(["Future", "Other"])
+    assert GLOBAL_UNKNOWN_ENUMS.values("Test", "access") == {"Future": 3, "Other": 1}
+    assert GLOBAL_UNKNOWN_ENUMS.export()[0] == {
+        "model": "Test",
+        "field": "access",
+        "value": "Future",
+        "count": 3,
+    }
+
+
+def test_response_cache() -> None:
+    cache = ResponseCache(max_bytes=200)
+    key_a = ResponseCache.key("https://example.com/a", {"v": "1"}, "key", "en")
+    key_b = ResponseCache.key("https://example.com/b", {"v": "1"}, "key", "en")
+
+    assert cache.get(key_a) is None
+    cache.set(key_a, b"a" * 100, ttl=60)
+    assert cache.get(key_a) == b"a" * 100
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Least recently used entry is evicted once the budget is exceeded
+    cache.set(key_b, b"b" * 100, ttl=60)
+    assert cache.get(key_a) is None
+    assert cache.get(key_b) == b"b" * 100
+    assert cache.size <= cache.max_bytes
+
+    # Expired entries are dropped
+    cache.set(key_b, b"b", ttl=-1)
+    assert cache.get(key_b) is None
+    cache.set(key_a, b"a", ttl=0.000001)
+    time.sleep(0.001)
+    assert cache.get(key_a) is None
+
+    # API keys are only stored as hashes
+    assert "key" not in ResponseCache.key("url", {}, "key", None)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_cached() -> None:
+    route = respx.get("https://api.guildwars2.com/v2/colors").respond(
+        json=[1, 2, 3],
+    )
+
+    client = gw2.Colors()
+    client.cache = ResponseCache()
+
+    assert await client.ids() == [1, 2, 3]
+    assert await client.ids() == [1, 2, 3]
+    assert route.call_count == 1
+    assert client.cache.hits == 1
+
+    # Different API keys do not share entries
+    client.auth("ABCDE")
+    await client.ids()
+    assert route.calls.last.request.headers["Authorization"] == "Bearer ABCDE"
+
+    # Account data and trading post data are never cached
+    for endpoint in (
+        gw2.Account(),
+        gw2.Account().bank(),
+        gw2.Character("Name").inventory(),
+        gw2.Guild("id").stash(),
+        gw2.TokenInfo(),
+        gw2.Prices(),
+        gw2.Listing(1),
+        gw2.Transactions(),
+    ):
+        assert endpoint.expiry is None, endpoint
+
+
+@pytest.mark.asyncio
+async def test_shared_client() -> None:
+    account = gw2.Account()
+    account.auth("ABCDE")
+
+    # Sub-clients borrow the session of their parent
+    bank = account.bank()
+    assert bank._session is account._session
+    assert bank.api_key == "ABCDE"
+    assert gw2.Guild("guild").members()._session is account._session
+
+    async with gw2.Client(max_connections=1) as client:
+        account.using(client)
+        assert account.bank()._session is client.session
+        assert account.bank().client is client
+
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter() -> None:
+    limiter = RateLimiter(burst=2, refill_rate=1000, max_in_flight=1)
+
+    async with limiter:
+        assert limiter.in_flight == 1
+        assert limiter.tokens < limiter.burst
+
+        # Second request has to wait for the in-flight slot
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+
+    await waiter
+    limiter.release()
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 0
+
+    limiter.backoff(0.01)
+    assert limiter.tokens < 1
+    async with limiter:
+        pass
+
+    assert parse_retry_after("0", 1) == 0
+    assert parse_retry_after(None, 1) == 1
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", 1) == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_rate_limited() -> None:
+    route = respx.get("https://api.guildwars2.com/v2/colors").mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json=[1]),
+        ],
+    )
+
+    client = gw2.Colors()
+    client.cache = None
+    client.limiter = RateLimiter()
+
+    assert await client.ids() == [1]
+    assert route.calls.last.response.status_code == httpx.codes.OK
+    assert route.calls[0].response.status_code == httpx.codes.TOO_MANY_REQUESTS
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_retried() -> None:
+    route = respx.get("https://api.guildwars2.com/v2/colors").mock(
+        side_effect=[
+            httpx.Response(503),
+            httpx.ReadTimeout("timeout"),
+            httpx.Response(200, json=[1]),
+        ],
+    )
+
+    client = gw2.Colors()
+    client.cache = None
+    client.retry_policy = RetryPolicy(base_delay=0)
+
+    assert await client.ids() == [1]
+    assert client.retries == client.retry_policy.retries == len(route.calls) - 1
+
+    # Errors which aren't transient are raised immediately
+    route.side_effect = [httpx.Response(404)]
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.ids()
+
+
+def test_retry_budget() -> None:
+    policy = RetryPolicy(max_retries=5, budget=RetryBudget(ratio=0.5, capacity=1))
+    error = httpx.ReadTimeout("timeout")
+
+    assert policy.should_retry(error, 0)
+    # Budget is used up
+    assert not policy.should_retry(error, 1)
+    assert policy.exhausted == 1
+
+    # Successful requests refill the budget
+    policy.record_request()
+    policy.record_request()
+    assert policy.should_retry(error, 1)
+
+    assert not policy.should_retry(errors.UnknownError(), 0)
+    assert not policy.should_retry(errors.InvalidKeyError(), policy.max_retries)
+
+
+@pytest.mark.asyncio
+async def test_map_bounded() -> None:
+    running = 0
+    max_running = 0
+
+    async def work(delay: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(delay / 1000)
+        running -= 1
+        return delay
+
+    delays = [5, 1, 3, 1, 2]
+    limit = 2
+
+    ordered = [_ async for _ in map_bounded(work, delays, limit)]
+    assert ordered == delays
+    assert max_running <= limit
+
+    unordered = [_ async for _ in map_bounded(work, delays, limit, ordered=False)]
+    assert sorted(unordered) == sorted(delays)
+    assert unordered != delays
+
+
+@pytest.mark.asyncio
+async def test_map_bounded_failure() -> None:
+    running = 0
+
+    async def work(delay: int) -> int:
+        nonlocal running
+        running += 1
+        try:
+            await asyncio.sleep(delay / 1000)
+            raise ValueError(delay)
+        finally:
+            running -= 1
+
+    # The second call fails while the first one is awaited, the third one is
+    # still running once the first one fails
+    with pytest.raises(ValueError, match="5"):
+        _ = [_ async for _ in map_bounded(work, [5, 0, 100], 3)]
+    assert running == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_many_concurrent(mini: Callable[[int], dict]) -> None:
+    def respond(request: httpx.Request) -> httpx.Response:
+        ids = request.url.params["ids"].split(",")
+        return httpx.Response(200, json=[mini(int(_)) for _ in ids])
+
+    respx.get("https://api.guildwars2.com/v2/minis").mock(side_effect=respond)
+
+    client = gw2.Minis()
+    client.cache = None
+    ids = list(range(1000))
+
+    results = [_.id async for _ in client.many(ids, concurrent=True, max_concurrency=2)]
+    assert results == ids
+
+
+def test_adapters() -> None:
+    gw2.build_adapters([gw2.Items, gw2.Item])
+
+    # Adapters are shared between instances and endpoints of the same model
+    assert gw2.Items()._adapter is gw2.Items()._adapter
+    assert gw2.Items()._adapter is type_adapter(list[models.Item])
+    assert gw2.Item(1)._adapter is type_adapter(models.Item)
+
+    gw2.build_adapters()
+
+
+def test_prewarm() -> None:
+    class Test(BaseModel):
+        access: Access
+
+    # Schemas are built on first use
+    assert not Test.__pydantic_complete__
+
+    gw2.prewarm([Test, gw2.Minis])
+    assert Test.__pydantic_complete__
+    assert Test(access="GuildWars2").access == "GuildWars2"
+
+    class Other(BaseModel):
+        access: Access
+
+    # Without targets all endpoints and models are prepared
+    gw2.prewarm()
+    assert Other.__pydantic_complete__
+    assert models.items.Details.Bag.__pydantic_complete__
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_all_ids_discovery(
+    monkeypatch: pytest.MonkeyPatch, mini: Callable[[int], dict]
+) -> None:
+    monkeypatch.setattr(IdsBase, "_routes", None)
+    monkeypatch.setattr(_base, "_ALL_IDS_SUPPORT", {})
+
+    respx.get("https://api.guildwars2.com/v2.json").respond(
+        json={
+            "langs": ["en"],
+            "routes": [
+                {"path": "/v2/minis", "lang": True, "auth": False, "active": True},
+                {"path": "/v2/colors", "lang": True, "auth": False, "active": True},
+            ],
+            "schema_versions": [],
+        },
+    )
+
+    respx.get("https://api.guildwars2.com/v2/minis", params={"ids": "all"}).respond(
+        json=[mini(1), mini(2)],
+    )
+
+    minis = gw2.Minis()
+    minis.cache = None
+    assert [_.id for _ in await minis.all_noniter()] == [1, 2]
+    assert await minis.all_noniter()
+    assert _base._ALL_IDS_SUPPORT == {"/v2/minis": True}
+
+    # Rejected ?ids=all falls back to requests by ids
+    respx.get("https://api.guildwars2.com/v2/colors", params={"ids": "all"}).respond(
+        400,
+        json={"text": "all ids not supported"},
+    )
+    route = respx.get("https://api.guildwars2.com/v2/colors").respond(json=[])
+
+    colors = gw2.Colors()
+    colors.cache = None
+    assert await colors.all_noniter() == []
+    assert _base._ALL_IDS_SUPPORT["/v2/colors"] is False
+    assert route.called
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_all_ids_discovery_failed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(IdsBase, "_routes", None)
+    monkeypatch.setattr(IdsBase, "_routes_retry_at", 0.0)
+    monkeypatch.setattr(_base, "_ALL_IDS_SUPPORT", {})
+
+    routes = respx.get("https://api.guildwars2.com/v2.json").respond(404)
+    respx.get("https://api.guildwars2.com/v2/minis").respond(json=[])
+
+    minis = gw2.Minis()
+    minis.cache = None
+    minis.auth("secret key")
+
+    assert await minis.all_noniter() == []
+    assert await minis.all_noniter() == []
+
+    # The failure is remembered, and the API key is not sent to /v2.json
+    assert routes.call_count == 1
+    assert "Authorization" not in routes.calls.last.request.headers
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_all_pages(
+    monkeypatch: pytest.MonkeyPatch, mini: Callable[[int], dict]
+) -> None:
+    page_size, total = 200, 450
+    page_total = -(-total // page_size)
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        assert int(request.url.params["page_size"]) == page_size
+        page = int(request.url.params["page"])
+        ids = range(page * page_size + 1, min((page + 1) * page_size, total) + 1)
+        return httpx.Response(
+            200,
+            json=[mini(_) for _ in ids],
+            headers={"X-Page-Total": str(page_total)},
+        )
+
+    route = respx.get("https://api.guildwars2.com/v2/minis").mock(
+        side_effect=respond,
+    )
+
+    monkeypatch.setattr(gw2.Minis, "all_pages", True)
+    minis = gw2.Minis()
+    minis.cache = None
+
+    # No ?ids= requests, the remaining pages are requested concurrently
+    models = await minis.all_noniter(concurrent=True)
+    assert [_.id for _ in models] == list(range(1, total + 1))
+    assert sorted(call.request.url.params["page"] for call in route.calls) == [
+        str(_) for _ in range(page_total)
+    ]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_response_meta_and_count(mini: Callable[[int], dict]) -> None:
+    total, rate_limit = 80000, 600
+    route = respx.get("https://api.guildwars2.com/v2/minis").respond(
+        json=[mini(1)],
+        headers={
+            "X-Result-Total": str(total),
+            "X-Result-Count": "1",
+            "X-Page-Total": str(total),
+            "X-Page-Size": "1",
+            "Cache-Control": "public, max-age=300",
+            "X-Rate-Limit-Limit": str(rate_limit),
+        },
+    )
+
+    minis = gw2.Minis()
+    minis.cache = ResponseCache()
+
+    # A single object is requested instead of all ids
+    assert await minis.count() == total
+    assert route.call_count == 1
+    assert route.calls.last.request.url.params["page_size"] == "1"
+
+    meta = minis.meta
+    assert meta is not None
+    assert (meta.status, meta.result_count, meta.page_total) == (200, 1, total)
+    assert meta.cache_control == "public, max-age=300"
+    assert meta.rate_limit_limit == rate_limit
+    assert meta.rate_limit_remaining is None
+    assert not meta.cached
+    assert meta.latency >= 0
+
+    # Cached responses keep their metadata
+    assert await minis.count() == total
+    assert route.call_count == 1
+    assert minis.meta is not None
+    assert minis.meta.cached
+    assert minis.meta.result_total == total
+
+
+@pytest.mark.asyncio
+async def test_single_flight() -> None:
+    single_flight = SingleFlight()
+    key = ResponseCache.key("https://example.com", {}, None, "en")
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    first = asyncio.ensure_future(single_flight.do(key, fetch))
+    second = asyncio.ensure_future(single_flight.do(key, fetch))
+    third = asyncio.ensure_future(single_flight.do(key, fetch))
+    await asyncio.sleep(0)
+
+    # Cancelling one caller doesn't affect the others
+    second.cancel()
+    assert await first == await third == 1
+    assert second.cancelled()
+    assert single_flight.shared == len([second, third])
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_get_coalesced() -> None:
+    route = respx.get("https://api.guildwars2.com/v2/colors").respond(json=[1])
+
+    client = gw2.Colors()
+    client.cache = None
+    client.single_flight = SingleFlight()
+
+    results = await asyncio.gather(*(client.ids() for _ in range(10)))
+    assert results == [[1]] * len(results)
+    assert route.call_count == 1
+
+
+def test_item_details() -> None:
+    item = {
+        "id": 1,
+        "chat_link": "[&AgEBAAAA]",
+        "name": "Bag",
+        "type": "Bag",
+        "rarity": "Basic",
+        "level": 0,
+        "vendor_value": 0,
+        "flags": [],
+        "game_types": [],
+        "restrictions": [],
+        "details": {"size": 20, "no_sell_or_sort": False},
+    }
+    details = models.Item.model_validate(item).details
+    assert isinstance(details, models.items.Details.Bag)
+
+    # Types without a dedicated details model use the whole union
+    item["type"] = "Relic"
+    details = models.Item.model_validate(item).details
+    assert isinstance(details, models.items.Details.Bag)
+
+
+def test_facts() -> None:
+    facts = type_adapter(list[common.AnyFact]).validate_python(
+        [
+            {"type": "Buff", "status": "Might", "duration": 5, "apply_count": 1},
+            {"type": "Radius", "distance": 240},
+            {"text": "No type"},
+            {"type": "Damage", "chance": 5},
+        ]
+    )
+    assert [type(_) for _ in facts] == [
+        common.Fact.Buff,
+        common.Fact.Distance,
+        common.Fact.Generic,
+        common.Fact.Generic,
+    ]
+
+    with pytest.warns(RuntimeWarning, match="failed to validate.*"):
+        (fact,) = type_adapter(list[common.AnyTraitedFact]).validate_python(
+            [{"type": "Unreleased", "value": 1, "requires_trait": 1}]
+        )
+    assert isinstance(fact, common.TraitedFact.Generic)
+    assert fact.type == Unknown("Unreleased")
+
+    # The namespaces stand in for the former single models
+    assert all(isinstance(_, common.Fact) for _ in facts)
+    assert not isinstance(facts[0], common.TraitedFact)
+    assert isinstance(fact, common.Fact)
+    assert isinstance(fact, common.TraitedFact)
+    assert not isinstance(1, common.Fact)
+
+    fact = common.Fact(type="Buff", status="Might")
+    assert isinstance(fact, common.Fact.Generic)
+    assert fact.status == "Might"
+    fact = common.TraitedFact(type="Buff", requires_trait=1)
+    assert isinstance(fact, common.TraitedFact.Generic)
+
+
+def test_guild_log() -> None:
+    with pytest.warns(RuntimeWarning, match="failed to validate.*"):
+        entries = type_adapter(list[models.guild.AnyLog]).validate_python(
+            [
+                {
+                    "id": 2,
+                    "time": "2024-05-02T15:12:45.000Z",
+                    "user": "Account.1234",
+                    "type": "joined",
+                },
+                {
+                    "id": 1,
+                    "time": "2024-05-02T15:10:20.000Z",
+                    "type": "mentor_assigned",
+                    "mentor": "Account.5678",
+                },
+            ]
+        )
+    assert isinstance(entries[0], models.guild.Log.Join)
+
+    # New types don't fail the whole log
+    assert isinstance(entries[1], models.guild.Log.Generic)
+    assert entries[1].model_extra == {"mentor": "Account.5678"}
+
+
+def _import_gw2(statement: str) -> tuple[float, set[str]]:
+    """
+    Runs `statement` after `import gw2` in a fresh interpreter
+
+    Returns:
+        Seconds taken by both and the imported modules
+    """
+
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import gw2; {statement}\n"
+        "print(time.perf_counter() - start)\n"
+        "print(' '.join(sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.splitlines()
+
+    return float(output[0]), set(output[1].split())
+
+
+def test_lazy_import() -> None:
+    seconds, modules = _import_gw2("pass")
+    assert "gw2.models.items" not in modules
+    assert "pydantic" not in modules
+
+    _, modules = _import_gw2("gw2.Items")
+    assert "gw2.models.items" in modules
+    assert "gw2.models.skills" not in modules
+
+    # Guards against modules being imported eagerly again
+    eager_seconds, _ = _import_gw2("[getattr(gw2, name) for name in gw2.__all__]")
+    assert seconds * 10 < eager_seconds
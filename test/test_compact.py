@@ -0,0 +1,52 @@
+import gc
+
+from gw2 import models
+from gw2.compact import Compactor
+from gw2.models._base import BaseModel
+from gw2.utils import type_adapter
+
+
+def test_compact() -> None:
+    recipe = {
+        "id": 1,
+        "type": "Refinement",
+        "output_item_id": 1,
+        "output_item_count": 1,
+        "time_to_craft_ms": 1000,
+        "disciplines": ["Armorsmith"],
+        "min_rating": 0,
+        "flags": [],
+        "ingredients": [{"item_id": 19697, "count": 2}],
+        "chat_link": "[&CQEAAAA=]",
+    }
+    validated = type_adapter(list[models.Recipe]).validate_python([recipe, recipe])
+    first, second = Compactor().compact(
+        type_adapter(list[models.Recipe]).validate_python([recipe, recipe])
+    )
+    assert [first, second] == validated
+
+    assert first.ingredients[0] is second.ingredients[0]
+    assert first.__pydantic_fields_set__ is second.__pydantic_fields_set__
+
+    # Shared objects stay independent
+    copy = first.model_copy(update={"guild_ingredients": []})
+    assert "guild_ingredients" not in second.model_fields_set
+    assert copy.guild_ingredients == []
+
+
+class Point(BaseModel):
+    x: int | float
+
+
+def test_compact_leaves() -> None:
+    compactor = Compactor()
+
+    # Equal values of different types are not shared
+    first, second, third = compactor.compact([Point(x=1), Point(x=1.0), Point(x=1)])
+    assert type(second.x) is float
+    assert first is third
+
+    # Shared objects are dropped once no model uses them anymore
+    del first, second, third
+    gc.collect()
+    assert len(compactor) == 0
@@ -0,0 +1,64 @@
+import json
+import pathlib
+from collections.abc import Callable
+
+import httpx
+import pytest
+import respx
+from pydantic import AnyHttpUrl, ValidationError
+
+import gw2
+from gw2.api._base import SCHEMA
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_disk_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path, mini: Callable[[int], dict]
+) -> None:
+    def respond(request: httpx.Request) -> httpx.Response:
+        ids = [int(_) for _ in request.url.params["ids"].split(",")]
+        # Mini 5 is invalid
+        return httpx.Response(
+            200,
+            json=[mini(_id) if _id != invalid else {"id": _id} for _id in ids],
+        )
+
+    invalid = 5
+
+    respx.get("https://api.guildwars2.com/v2/build").respond(json={"id": 1})
+    route = respx.get("https://api.guildwars2.com/v2/minis").mock(side_effect=respond)
+
+    path = tmp_path / "gw2.sqlite"
+    monkeypatch.setattr(gw2.Minis, "cache", None)
+    monkeypatch.setattr(gw2.Minis, "disk_cache", gw2.DiskCache(path))
+
+    assert [_.id async for _ in gw2.Minis().many([1, 2])] == [1, 2]
+    assert route.calls.last.request.url.params["ids"] == "1,2"
+
+    # Starts warm after a restart, without validating stored objects again
+    disk_cache = gw2.DiskCache(path, trusted=True)
+    monkeypatch.setattr(gw2.Minis, "disk_cache", disk_cache)
+
+    # Stored and fetched objects keep the requested order and are alike
+    loaded = [_ async for _ in gw2.Minis().many([3, 2, 4, 1])]
+    assert [_.id for _ in loaded] == [3, 2, 4, 1]
+    assert loaded[1] == gw2.models.Mini.model_validate(mini(2))
+    assert {type(_.icon) for _ in loaded} == {AnyHttpUrl}
+    assert route.calls.last.request.url.params["ids"] == "3,4"
+    assert disk_cache.hits == len([1, 2])
+
+    many = gw2.Minis().many([2, 3, 1, 4], concurrent=True)
+    assert [_.id async for _ in many] == [2, 3, 1, 4]
+
+    # Objects are only stored once they were validated
+    with pytest.raises(ValidationError):
+        await anext(gw2.Minis().many([invalid]))
+
+    minis = gw2.Minis()
+    stored = disk_cache.get_many(minis.url, ["1", "5"], minis.client.language, SCHEMA)
+    assert stored == {"1": json.dumps(mini(1))}
+
+    # Objects of older builds are dropped
+    disk_cache.set_build(2)
+    assert len(disk_cache) == 0
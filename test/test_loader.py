@@ -0,0 +1,76 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+import respx
+
+import gw2
+from gw2 import errors
+from gw2.api._base import _LOADERS
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_batched_one(
+    monkeypatch: pytest.MonkeyPatch, mini: Callable[[int], dict]
+) -> None:
+    def respond(request: httpx.Request) -> httpx.Response:
+        # id 404 doesn't exist
+        ids = [int(_) for _ in request.url.params["ids"].split(",") if _ != "404"]
+        return httpx.Response(206, json=[mini(_id) for _id in ids])
+
+    route = respx.get("https://api.guildwars2.com/v2/minis").mock(side_effect=respond)
+
+    monkeypatch.setattr(gw2.Minis, "batch_window", 0.01)
+    monkeypatch.setattr(gw2.Minis, "cache", None)
+
+    one, two, same = await asyncio.gather(
+        gw2.Minis().one(1),
+        gw2.Minis().one(2),
+        gw2.Minis().one(1),
+    )
+    assert (one.id, two.id, same.id) == (1, 2, 1)
+    assert route.call_count == 1
+    assert route.calls.last.request.url.params["ids"] == "1,2"
+
+    with pytest.raises(errors.NotFoundError):
+        await gw2.Minis().one(404)
+
+    assert [_ and _.id for _ in await gw2.Minis().loader().load_many([3, 404])] == [
+        3,
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_loader_per_client(
+    monkeypatch: pytest.MonkeyPatch, mini: Callable[[int], dict]
+) -> None:
+    route = respx.get("https://api.guildwars2.com/v2/minis").respond(
+        json=[mini(1)],
+    )
+    monkeypatch.setattr(gw2.Minis, "batch_window", 0.01)
+    monkeypatch.setattr(gw2.Minis, "cache", None)
+
+    async with gw2.Client() as first, gw2.Client() as second:
+        minis = gw2.Minis(client=first)
+        minis.auth("secret key")
+        loader = minis.loader()
+
+        # The plain API key is not kept
+        key = next(
+            key for key in _LOADERS[asyncio.get_running_loop()] if key[1] is first
+        )
+        assert "secret key" not in key
+
+        assert gw2.Minis(client=second).loader() is not loader
+        other = gw2.Minis(client=first)
+        other.auth("secret key")
+        assert other.loader() is loader
+
+        # Changing the key of an instance doesn't change requests of its loader
+        minis.auth("other key")
+        assert (await loader.load(1)).id == 1  # type: ignore[union-attr]
+        assert route.calls.last.request.headers["Authorization"] == "Bearer secret key"
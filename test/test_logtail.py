@@ -0,0 +1,47 @@
+import pathlib
+
+import httpx
+import pytest
+import respx
+
+import gw2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_log_tail(tmp_path: pathlib.Path) -> None:
+    def entry(_id: int) -> dict:
+        return {
+            "id": _id,
+            "time": "2024-05-02T12:00:00.000Z",
+            "type": "motd",
+            "motd": "",
+        }
+
+    logs = {"a": [entry(2), entry(1)], "b": [entry(5)]}
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        guild_id = request.url.path.split("/")[3]
+        since = int(request.url.params.get("since", 0))
+        return httpx.Response(200, json=[_ for _ in logs[guild_id] if _["id"] > since])
+
+    route = respx.get(url__regex=r"/v2/guild/\w+/log").mock(side_effect=respond)
+
+    path = tmp_path / "cursors.json"
+    tail = gw2.LogTail({"a": "key a", "b": "key b"}, store=gw2.JsonCursorStore(path))
+
+    assert sorted([(g, e.id) async for g, e in tail.poll()]) == [
+        ("a", 1),
+        ("a", 2),
+        ("b", 5),
+    ]
+
+    # Only the delta is requested, also after a restart
+    logs["a"].insert(0, entry(3))
+    tail = gw2.LogTail({"a": "key a", "b": "key b"}, store=gw2.JsonCursorStore(path))
+
+    assert [(g, e.id) async for g, e in tail.poll()] == [("a", 3)]
+    assert {call.request.url.params["since"] for call in route.calls[-2:]} == {
+        "2",
+        "5",
+    }
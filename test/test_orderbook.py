@@ -0,0 +1,46 @@
+import httpx
+import pytest
+import respx
+
+import gw2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_order_book() -> None:
+    def level(unit_price: int, quantity: int) -> dict:
+        return {"listings": 1, "unit_price": unit_price, "quantity": quantity}
+
+    best_buy, best_sell = level(90, 5), level(100, 3)
+    listings = {
+        1: {
+            "id": 1,
+            "buys": [best_buy, level(80, 10)],
+            "sells": [best_sell, level(110, 4)],
+        },
+        2: {"id": 2, "buys": [], "sells": [level(5, 1)]},
+    }
+    respx.get("https://api.guildwars2.com/v2/commerce/listings").mock(
+        side_effect=lambda request: httpx.Response(
+            200,
+            json=(
+                [listings[int(_)] for _ in request.url.params["ids"].split(",")]
+                if "ids" in request.url.params
+                else list(listings)
+            ),
+        )
+    )
+
+    book = await gw2.Listings().order_book()
+    assert len(book) == len(listings)
+    assert list(book.unit_prices[book.rows(1, "sells")]) == [100, 110]
+
+    assert book.cost_to_buy(1, 5) == 3 * 100 + 2 * 110
+    assert book.cost_to_buy(1, 8) is None
+    assert book.proceeds_of_selling(1, 6) == 5 * 90 + 80
+    assert book.proceeds_of_selling(2, 1) is None
+
+    # Only the best level of each side is within these prices
+    assert book.quantity_within(1, 105) == best_sell["quantity"]
+    assert book.quantity_within(1, 85, "buys") == best_buy["quantity"]
+    assert book.best_price(1, "buys") == best_buy["unit_price"]
@@ -0,0 +1,73 @@
+import httpx
+import pytest
+import respx
+
+import gw2
+from gw2 import models
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_price_feed() -> None:
+    prices = {
+        _id: {
+            "id": _id,
+            "whitelisted": False,
+            "buys": {"quantity": 10, "unit_price": 100},
+            "sells": {"quantity": 5, "unit_price": 120},
+        }
+        for _id in range(1, 251)
+    }
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        ids = [int(_) for _ in request.url.params["ids"].split(",")]
+        return httpx.Response(200, json=[prices[_id] for _id in ids])
+
+    respx.get("https://api.guildwars2.com/v2/commerce/prices").mock(
+        side_effect=lambda request: (
+            respond(request)
+            if "ids" in request.url.params
+            else httpx.Response(200, json=list(prices))
+        )
+    )
+
+    feed = gw2.PriceFeed()
+    assert len([_ async for _ in feed.poll()]) == len(prices)
+
+    # Only items with changed prices, quantities are ignored by default
+    prices[3]["sells"] = {"quantity": 5, "unit_price": 110}
+    prices[7]["buys"] = {"quantity": 11, "unit_price": 100}
+    prices[251] = {**prices[1], "id": 251}
+
+    changed = [_ async for _ in feed.poll()]
+    assert sorted(_.id for _ in changed) == [3, 251]
+    assert isinstance(changed[0], models.Price)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_price_feed_inserted_id() -> None:
+    def price(_id: int) -> dict:
+        return {
+            "id": _id,
+            "whitelisted": False,
+            "buys": {"quantity": 10, "unit_price": 100 + _id},
+            "sells": {"quantity": 5, "unit_price": 120 + _id},
+        }
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        ids = [int(_) for _ in request.url.params["ids"].split(",")]
+        return httpx.Response(200, json=[price(_id) for _id in ids])
+
+    respx.get("https://api.guildwars2.com/v2/commerce/prices").mock(
+        side_effect=respond,
+    )
+
+    ids = list(range(10, 1010))
+    feed = gw2.PriceFeed(ids, initial=False)
+    assert [_ async for _ in feed.poll()] == []
+
+    # Shifts every later chunk by one item, none of their prices changed
+    feed.ids = [*ids[:500], 1, *ids[500:]]
+    assert [_.id async for _ in feed.poll()] == [1]
+    assert [_ async for _ in feed.poll()] == []
@@ -0,0 +1,55 @@
+import httpx
+import pytest
+import respx
+
+import gw2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_transaction_sync() -> None:
+    def transaction(_id: int) -> dict:
+        return {
+            "id": _id,
+            "item_id": 19721,
+            "price": 100,
+            "quantity": 1,
+            "created": "2024-05-02T12:00:00+00:00",
+            "purchased": "2024-05-02T12:05:00+00:00",
+        }
+
+    page_size = 2
+    history = {"key a": [transaction(_) for _ in range(5, 0, -1)], "key b": []}
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        transactions = history[request.headers["Authorization"].removeprefix("Bearer ")]
+        if page and page * page_size >= len(transactions):
+            return httpx.Response(400, json={"text": "page out of range"})
+
+        return httpx.Response(200, json=transactions[page * page_size :][:page_size])
+
+    route = respx.get(
+        "https://api.guildwars2.com/v2/commerce/transactions/history/buys"
+    ).mock(side_effect=respond)
+
+    sync = gw2.TransactionSync(
+        {"a": "key a", "b": "key b"},
+        streams=[("history", "buys")],
+        page_size=page_size,
+    )
+    assert [(a, t.id) async for a, _, t in sync.poll()] == [
+        ("a", 1),
+        ("a", 2),
+        ("a", 3),
+        ("a", 4),
+        ("a", 5),
+    ]
+    assert sync.store.cursors == {"a/history/buys": 5}
+
+    # Stops at the first known transaction instead of fetching the whole history
+    history["key a"].insert(0, transaction(6))
+    route.reset()
+
+    assert [(a, t.id) async for a, _, t in sync.poll()] == [("a", 6)]
+    assert [call.request.url.params["page"] for call in route.calls] == ["0", "0"]
@@ -0,0 +1,63 @@
+import pytest
+from pydantic import AnyHttpUrl
+
+from gw2 import models
+from gw2.models import Unknown, common
+from gw2.trusted import construct
+
+
+def test_trusted() -> None:
+    item = {
+        "id": 1,
+        "chat_link": "[&AgEBAAAA]",
+        "name": "Sword",
+        "icon": "https://render.guildwars2.com/file/sword.png",
+        "type": "Weapon",
+        "rarity": "Exotic",
+        "level": 80,
+        "vendor_value": 0,
+        "flags": ["NoSell", "Unreleased"],
+        "game_types": [],
+        "restrictions": [],
+        "details": {
+            "type": "Sword",
+            "damage_type": "Physical",
+            "min_power": 1,
+            "max_power": 2,
+            "defense": 0,
+            "infusion_slots": [{"flags": ["Infusion"]}],
+            "attribute_adjustment": 0,
+        },
+    }
+    with pytest.warns(RuntimeWarning, match="failed to validate.*"):
+        validated = models.Item.model_validate(item)
+
+    constructed = construct(models.Item, item)
+    assert constructed == validated
+    assert isinstance(constructed.icon, AnyHttpUrl)
+    assert isinstance(constructed.details, models.items.Details.Weapon)
+    assert isinstance(constructed.details.infusion_slots[0], models.items.InfusionSlot)
+    assert isinstance(constructed.details.attribute_adjustment, float)
+    assert constructed.flags[1] == Unknown("Unreleased")
+
+    # Details not matching the item's type fall back to the whole union
+    armor = {
+        **item,
+        "flags": [],
+        "details": {
+            "type": "Coat",
+            "weight_class": "Heavy",
+            "defense": 1,
+            "infusion_slots": [],
+            "attribute_adjustment": 0,
+        },
+    }
+    constructed = construct(models.Item, armor)
+    assert isinstance(constructed.details, models.items.Details.Armor)
+    assert constructed.details == models.Item.model_validate(armor).details
+
+    facts = construct(
+        list[common.AnyFact],
+        [{"type": "Radius", "distance": 240}, {"type": "Damage", "chance": 5}],
+    )
+    assert [type(_) for _ in facts] == [common.Fact.Distance, common.Fact.Generic]